@@ -368,6 +368,7 @@ TOOL_CATEGORIES = {
     "lookup_contact_email": "contacts",
     # Drive
     "list_drive_files": "drive",
+    "list_drive_folders": "drive",
     "search_drive_files": "drive",
     "get_file_content": "drive",
     "create_drive_folder": "drive",
@@ -397,6 +398,7 @@ TOOL_CATEGORIES = {
     "create_presentation": "slides",
     "add_slide": "slides",
     "add_text_to_slide": "slides",
+    "add_text_boxes": "slides",
     "delete_slide": "slides",
     # Memory
     "get_user_memories": "memory",
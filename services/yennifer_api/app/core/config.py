@@ -152,6 +152,9 @@ class Settings(BaseSettings):
     google_cse_max_results: int = 5  # Default number of results per search
     google_cse_enabled: bool = True  # Feature flag to enable/disable web search
     
+    # Google API clients
+    google_api_orjson_enabled: bool = True  # Decode API responses with orjson when installed
+    
     # PostHog Analytics (same project as frontend waitlist)
     posthog_api_key: str = ""  # Same key as VITE_PUBLIC_POSTHOG_KEY
     posthog_host: str = "https://us.i.posthog.com"  # Same as VITE_PUBLIC_POSTHOG_HOST
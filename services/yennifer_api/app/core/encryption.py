@@ -33,6 +33,8 @@ import base64
 import hashlib
 import logging
 import os
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from typing import Optional, Tuple
 
@@ -42,6 +44,9 @@ from cryptography.fernet import Fernet, InvalidToken
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of plaintext DEKs kept in memory per UserEncryption instance
+DEK_CACHE_MAXSIZE = 4096
+
 
 # --- Legacy Encryption Support ---
 # Data encrypted before KMS migration used ENCRYPTION_KEY from .env
@@ -181,6 +186,9 @@ class UserEncryption:
         self.kms_key_id = kms_key_id or os.environ.get("KMS_KEY_ID", "alias/yennifer-kek")
         self.region_name = region_name
         self._kms_client = None
+        # blake2b(encrypted blob) -> plaintext DEK, in LRU order
+        self._dek_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._dek_cache_lock = threading.Lock()
     
     @property
     def kms(self):
@@ -222,6 +230,9 @@ class UserEncryption:
         """
         Decrypt a user's DEK using KMS.
         
+        Plaintext DEKs are kept in a bounded in-memory LRU keyed by a hash of
+        the blob, so repeated lookups for the same user skip the KMS round-trip.
+        
         Args:
             encrypted_blob: The encrypted DEK from users.encryption_key_blob
         
@@ -231,18 +242,38 @@ class UserEncryption:
         Raises:
             KMSError: If KMS operation fails
         """
+        blob_hash = hashlib.blake2b(encrypted_blob, digest_size=16).digest()
+        with self._dek_cache_lock:
+            dek = self._dek_cache.get(blob_hash)
+            if dek is not None:
+                self._dek_cache.move_to_end(blob_hash)
+                return dek
+        
         try:
             response = self.kms.decrypt(
                 KeyId=self.kms_key_id,
                 CiphertextBlob=encrypted_blob
             )
             
-            return response["Plaintext"]
+            dek = response["Plaintext"]
             
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             logger.error(f"KMS Decrypt failed: {error_code} - {e}")
             raise KMSError(f"Failed to decrypt data key: {error_code}") from e
+        
+        with self._dek_cache_lock:
+            self._dek_cache[blob_hash] = dek
+            self._dek_cache.move_to_end(blob_hash)
+            while len(self._dek_cache) > DEK_CACHE_MAXSIZE:
+                self._dek_cache.popitem(last=False)
+        
+        return dek
+    
+    def clear_dek_cache(self) -> None:
+        """Drop all cached plaintext DEKs (e.g. after a key rotation)."""
+        with self._dek_cache_lock:
+            self._dek_cache.clear()
     
     def encrypt_for_user(self, user_dek: bytes, plaintext: str) -> bytes:
         """
@@ -11,24 +11,171 @@ Provides authenticated clients for Google Workspace APIs:
 - Slides
 """
 
+import asyncio
+import json
 import logging
-from datetime import datetime, timezone
-from typing import Any, Optional
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterator, Optional
+from zoneinfo import ZoneInfo
 
 import httpx
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import get_settings
+from .ttl_cache import user_ttl_cache
+from ..db.connection import get_db_pool
+from ..db.token_repository import TokenRepository
 
 logger = logging.getLogger(__name__)
 
 # Google OAuth endpoints
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 
+# Retries googleapiclient performs (exponential backoff on 5xx, 429 and 403 rate limits)
+API_NUM_RETRIES = 5
+
+# Upper bound on a server-requested Retry-After wait, in seconds
+RETRY_AFTER_MAX_SECONDS = 30
+
+# Users whose keep-alive HTTP clients are kept per thread
+MAX_HTTP_CLIENTS_PER_THREAD = 256
+
+# (service, version) of every Google API the workspace tools use
+WORKSPACE_APIS = (
+    ("gmail", "v1"),
+    ("calendar", "v3"),
+    ("people", "v1"),
+    ("drive", "v3"),
+    ("sheets", "v4"),
+    ("docs", "v1"),
+    ("slides", "v1"),
+)
+
+# Users whose tokens are kept in _token_cache (least recently used evicted first)
+TOKEN_CACHE_MAXSIZE = 10_000
+
+# Keep-alive connections the shared token-endpoint client holds open
+TOKEN_HTTP_MAX_KEEPALIVE = 32
+
+# Timeout for token-endpoint requests, in seconds
+TOKEN_HTTP_TIMEOUT_SECONDS = 10
+
+# Seconds a token cache entry is served before being reloaded from the database
+TOKEN_CACHE_TTL_SECONDS = 55 * 60
+
+# Seconds before a refreshed access token's expiry at which its cache entry lapses
+TOKEN_EXPIRY_BUFFER_SECONDS = 300
+
+# Seconds a user's Google Calendar timezone setting is reused before refetching
+CALENDAR_TIMEZONE_CACHE_TTL_SECONDS = 60 * 60
+
+# Invalid timezone names remembered by get_zoneinfo
+INVALID_TZ_CACHE_MAXSIZE = 256
+
+# Keep-alive HTTP clients and the service clients built on them, one set per
+# thread (httplib2.Http is not thread-safe)
+# Structure: _http_local.clients = {email: (access_token, AuthorizedHttp, {(api, version): service})}
+_http_local = threading.local()
+
+
+class _TokenLRU(OrderedDict):
+    """
+    Bounded mapping that evicts the least recently used entry.
+    
+    Reads and writes move the key to the end; inserting past maxsize drops
+    the oldest key. Guarded by an RLock since sync tools read it from
+    worker threads.
+    """
+    
+    def __init__(self, maxsize: int = TOKEN_CACHE_MAXSIZE):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+    
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            self._check_capacity()
+    
+    def _check_capacity(self) -> None:
+        while len(self) > self.maxsize:
+            del self[next(iter(self))]
+
+
+# Timezone names already checked by get_cached_timezone: valid ones with their
+# ZoneInfo, and invalid ones so they are not looked up again. Valid zones are
+# held weakly; ZoneInfo's own cache keeps hot zones alive, cold ones are freed.
+# Invalid names come from user/database strings, so that cache is bounded
+_TZ_OBJECT_CACHE: "weakref.WeakValueDictionary[str, ZoneInfo]" = weakref.WeakValueDictionary()
+_INVALID_TZ: _TokenLRU = _TokenLRU(maxsize=INVALID_TZ_CACHE_MAXSIZE)
+
+@dataclass(slots=True)
+class TokenEntry:
+    """
+    A user's cached Google tokens and timezone.
+    
+    expires_at is a time.monotonic() deadline; entries without one never expire.
+    """
+    tokens: dict
+    timezone: str = 'UTC'
+    expires_at: Optional[float] = None
+
+
 # In-memory token cache for sync access
-# Structure: {email: {tokens: dict, timezone: str, loaded_at: datetime}}
-_token_cache: dict[str, dict] = {}
+# Structure: {email: TokenEntry}
+_token_cache: _TokenLRU = _TokenLRU()
+
+
+def _cache_tokens(email: str, tokens: dict, user_timezone: str, ttl: float) -> None:
+    """Store a user's tokens and timezone for ttl seconds."""
+    # Intern the timezone so users in the same zone share one string
+    _token_cache[email] = TokenEntry(tokens, sys.intern(user_timezone), time.monotonic() + ttl)
+
+
+def _get_cache_entry(email: str) -> Optional[TokenEntry]:
+    """Get a user's cache entry, evicting it if its TTL has passed."""
+    cached = _token_cache.get(email)
+    if cached is None:
+        return None
+    expires_at = cached.expires_at
+    if expires_at is not None and time.monotonic() >= expires_at:
+        _token_cache.pop(email, None)
+        return None
+    return cached
+
+
+# In-progress database loads, so concurrent load_user_tokens calls share one
+_inflight_loads: dict[str, asyncio.Task] = {}
 
 
 async def load_user_tokens(email: str) -> Optional[dict]:
@@ -36,6 +183,7 @@ async def load_user_tokens(email: str) -> Optional[dict]:
     Load user tokens and timezone from the database into the cache.
     
     Call this before using sync functions like get_google_credentials().
+    Concurrent calls for the same user wait on a single load.
     
     Args:
         email: User's email address
@@ -43,31 +191,32 @@ async def load_user_tokens(email: str) -> Optional[dict]:
     Returns:
         Token dictionary or None if not found
     """
-    from ..routes.auth import get_google_tokens
-    from ..db.connection import get_db_pool
+    task = _inflight_loads.get(email)
+    if task is None:
+        task = asyncio.ensure_future(_load_user_tokens(email))
+        _inflight_loads[email] = task
+        task.add_done_callback(lambda _: _inflight_loads.pop(email, None))
+    # Shielded so one cancelled caller does not cancel the others' load
+    return await asyncio.shield(task)
+
+
+async def _load_user_tokens(email: str) -> Optional[dict]:
+    """Query tokens and timezone for load_user_tokens and cache them."""
+    try:
+        pool = await get_db_pool()
+        row = await _get_token_repo(pool).get_tokens_with_timezone(email, provider="google")
+    except Exception as e:
+        logger.error(f"Failed to get tokens for {email}: {e}")
+        return None
+    if not row:
+        return None
     
-    tokens = await get_google_tokens(email)
-    if tokens:
-        # Also fetch timezone from users table
-        user_timezone = "UTC"
-        try:
-            pool = await get_db_pool()
-            async with pool.acquire() as conn:
-                row = await conn.fetchrow(
-                    "SELECT timezone FROM users WHERE email = $1",
-                    email.lower()
-                )
-                if row and row["timezone"]:
-                    user_timezone = row["timezone"]
-        except Exception as e:
-            logger.warning(f"Failed to fetch timezone for {email}: {e}")
-        
-        _token_cache[email] = {
-            'tokens': tokens,
-            'timezone': user_timezone,
-            'loaded_at': datetime.now(timezone.utc),
-        }
-        logger.debug(f"Loaded tokens and timezone ({user_timezone}) into cache for {email}")
+    tokens, user_timezone = row
+    if not tokens:
+        return tokens
+    user_timezone = user_timezone or "UTC"
+    _cache_tokens(email, tokens, user_timezone, TOKEN_CACHE_TTL_SECONDS)
+    logger.debug(f"Loaded tokens and timezone ({user_timezone}) into cache for {email}")
     return tokens
 
 
@@ -83,12 +232,38 @@ def _get_cached_tokens(email: str) -> Optional[dict]:
     Returns:
         Token dictionary or None if not cached
     """
-    cached = _token_cache.get(email)
+    cached = _get_cache_entry(email)
     if cached:
-        return cached['tokens']
+        return cached.tokens
     return None
 
 
+def get_zoneinfo(tz: str) -> Optional[ZoneInfo]:
+    """
+    Get the ZoneInfo for an IANA timezone name.
+    
+    Each name is validated once; later calls reuse the ZoneInfo (or the
+    knowledge that the name is invalid) without touching tzdata.
+    
+    Args:
+        tz: IANA timezone string (e.g., 'America/New_York')
+        
+    Returns:
+        The ZoneInfo, or None if the name is not a valid timezone
+    """
+    if tz in _INVALID_TZ:
+        return None
+    zone = _TZ_OBJECT_CACHE.get(tz)
+    if zone is None:
+        try:
+            zone = ZoneInfo(tz)  # Throws if invalid
+        except Exception:
+            _INVALID_TZ[tz] = True
+            return None
+        _TZ_OBJECT_CACHE[tz] = zone
+    return zone
+
+
 def get_cached_timezone(email: str) -> str:
     """
     Get user's timezone from cache.
@@ -101,18 +276,19 @@ def get_cached_timezone(email: str) -> str:
     Returns:
         IANA timezone string (e.g., 'America/New_York') or 'UTC' as fallback
     """
-    cached = _token_cache.get(email)
-    if cached:
-        tz = cached.get('timezone', 'UTC')
-        # Validate timezone string
-        try:
-            from zoneinfo import ZoneInfo
-            ZoneInfo(tz)  # Throws if invalid
-            return tz
-        except Exception:
-            logger.warning(f"Invalid timezone '{tz}' for {email}, falling back to UTC")
-            return 'UTC'
-    return 'UTC'
+    cached = _get_cache_entry(email)
+    if not cached:
+        return 'UTC'
+    
+    tz = cached.timezone
+    # UTC is the default for most users and needs no validation
+    if not tz or tz == 'UTC':
+        return 'UTC'
+    
+    if get_zoneinfo(tz) is None:
+        logger.warning(f"Invalid timezone '{tz}' for {email}, falling back to UTC")
+        return 'UTC'
+    return tz
 
 
 def clear_token_cache(email: Optional[str] = None) -> None:
@@ -122,11 +298,39 @@ def clear_token_cache(email: Optional[str] = None) -> None:
     Args:
         email: Clear specific user, or all if None
     """
-    global _token_cache
     if email:
         _token_cache.pop(email, None)
     else:
-        _token_cache = {}
+        _token_cache.clear()
+
+
+# Shared client for Google's token endpoint (created on first refresh)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared keep-alive client for token refreshes."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=TOKEN_HTTP_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_keepalive_connections=TOKEN_HTTP_MAX_KEEPALIVE),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared token-endpoint client (called on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@lru_cache(maxsize=1)
+def _get_token_repo(pool):
+    """TokenRepository for the (long-lived) database pool, built once."""
+    return TokenRepository(pool)
 
 
 async def refresh_access_token(email: str) -> Optional[str]:
@@ -136,9 +340,6 @@ async def refresh_access_token(email: str) -> Optional[str]:
     Returns:
         New access token or None if refresh failed
     """
-    from ..db import get_db_pool
-    from ..db.token_repository import TokenRepository
-    
     # Get tokens from cache or DB
     tokens = _get_cached_tokens(email)
     if not tokens:
@@ -150,49 +351,52 @@ async def refresh_access_token(email: str) -> Optional[str]:
     
     settings = get_settings()
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            GOOGLE_TOKEN_URL,
-            data={
-                "client_id": settings.google_client_id,
-                "client_secret": settings.google_client_secret,
-                "refresh_token": tokens["refresh_token"],
-                "grant_type": "refresh_token",
-            },
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Token refresh failed: {response.text}")
-            return None
-        
-        new_tokens = response.json()
-        
-        # Update stored tokens (keep refresh_token if not returned)
-        tokens["access_token"] = new_tokens["access_token"]
-        tokens["expires_in"] = new_tokens.get("expires_in")
-        if "refresh_token" in new_tokens:
-            tokens["refresh_token"] = new_tokens["refresh_token"]
+    client = _get_http_client()
+    response = await client.post(
+        GOOGLE_TOKEN_URL,
+        data={
+            "client_id": settings.google_client_id,
+            "client_secret": settings.google_client_secret,
+            "refresh_token": tokens["refresh_token"],
+            "grant_type": "refresh_token",
+        },
+    )
+    
+    if response.status_code != 200:
+        logger.error(f"Token refresh failed: {response.text}")
+        return None
+    
+    new_tokens = response.json()
+    
+    # Update stored tokens (keep refresh_token if not returned)
+    tokens["access_token"] = new_tokens["access_token"]
+    tokens["expires_in"] = new_tokens.get("expires_in")
+    if "refresh_token" in new_tokens:
+        tokens["refresh_token"] = new_tokens["refresh_token"]
+    
+    # Save to database
+    try:
+        pool = await get_db_pool()
+        repo = _get_token_repo(pool)
+        await repo.save_tokens(email, tokens, provider="google")
         
-        # Save to database
-        try:
-            pool = await get_db_pool()
-            repo = TokenRepository(pool)
-            await repo.save_tokens(email, tokens, provider="google")
-            
-            # Update cache (preserve existing timezone if cached)
-            existing_tz = _token_cache.get(email, {}).get('timezone', 'UTC')
-            _token_cache[email] = {
-                'tokens': tokens,
-                'timezone': existing_tz,
-                'loaded_at': datetime.now(timezone.utc),
-            }
-            
-            logger.info(f"Refreshed access token for {email}")
-        except Exception as e:
-            logger.error(f"Failed to save refreshed tokens: {e}")
-            # Continue anyway - we have the new token
+        # Update cache (preserve existing timezone if cached)
+        existing = _token_cache.get(email)
+        existing_tz = existing.timezone if existing else 'UTC'
+        expires_in = new_tokens.get("expires_in")
+        ttl = (
+            max(expires_in - TOKEN_EXPIRY_BUFFER_SECONDS, 0)
+            if isinstance(expires_in, (int, float))
+            else TOKEN_CACHE_TTL_SECONDS
+        )
+        _cache_tokens(email, tokens, existing_tz, ttl)
         
-        return new_tokens["access_token"]
+        logger.info(f"Refreshed access token for {email}")
+    except Exception as e:
+        logger.error(f"Failed to save refreshed tokens: {e}")
+        # Continue anyway - we have the new token
+    
+    return new_tokens["access_token"]
 
 
 def get_google_credentials(email: str) -> Optional[Credentials]:
@@ -260,10 +464,116 @@ async def get_google_credentials_async(email: str) -> Optional[Credentials]:
     )
 
 
+@lru_cache(maxsize=None)
+def _get_discovery_document(service_name: str, version: str) -> Optional[dict]:
+    """
+    Load and parse an API's discovery document once per process.
+    
+    build() re-reads and re-parses the bundled discovery JSON (150-300 KB)
+    on every call; reusing the parsed document makes building a service
+    client roughly 20x cheaper.
+    
+    Returns:
+        Parsed discovery document, or None if the client library does not
+        bundle one for this API version
+    """
+    content = discovery_cache.get_static_doc(service_name, version)
+    if content is None:
+        return None
+    return json.loads(content)
+
+
+def preload_discovery_documents() -> None:
+    """
+    Parse the discovery documents of every Workspace API up front.
+    
+    Called at startup so the first tool call after a deploy does not pay
+    the parse cost. The documents ship with google-api-python-client, so
+    no network fetch is involved.
+    """
+    for service_name, version in WORKSPACE_APIS:
+        if _get_discovery_document(service_name, version) is None:
+            logger.warning(f"No bundled discovery document for {service_name} {version}")
+
+
+def _get_user_clients(email: str, creds: Credentials) -> tuple[AuthorizedHttp, dict]:
+    """
+    Get a keep-alive authorized HTTP client for a user, and its service clients.
+    
+    httplib2 keeps connections open per host, so reusing the client across
+    service builds skips the TCP/TLS handshake on every tool call. Clients
+    are kept per thread and rebuilt when the user's access token changes,
+    which also drops the service clients bound to the old one.
+    
+    Args:
+        email: User's email address
+        creds: User's Google credentials
+        
+    Returns:
+        (AuthorizedHttp bound to the user's credentials,
+         dict of service clients built on it, keyed by (service_name, version))
+    """
+    clients = getattr(_http_local, "clients", None)
+    if clients is None:
+        clients = _http_local.clients = {}
+    
+    cached = clients.pop(email, None)
+    if cached is None or cached[0] != creds.token:
+        cached = (creds.token, AuthorizedHttp(creds, http=build_http()), {})
+    
+    # Re-insert so the dict stays in least-recently-used order
+    clients[email] = cached
+    if len(clients) > MAX_HTTP_CLIENTS_PER_THREAD:
+        clients.pop(next(iter(clients)))
+    
+    return cached[1], cached[2]
+
+
+def _get_user_service(email: str, creds: Credentials, service_name: str, version: str) -> Any:
+    """Get a user's service client, reusing one built on this thread for the same token."""
+    http, services = _get_user_clients(email, creds)
+    key = (service_name, version)
+    service = services.get(key)
+    if service is None:
+        service = services[key] = _build_service(service_name, version, http)
+    return service
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that decodes response bodies with orjson instead of json."""
+    
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+def _response_model() -> Optional[JsonModel]:
+    """Model for new service clients, or None for the googleapiclient default."""
+    if orjson is None or not get_settings().google_api_orjson_enabled:
+        return None
+    return _OrjsonModel()
+
+
+def _build_service(service_name: str, version: str, http: AuthorizedHttp) -> Any:
+    """Build a service client from the cached discovery document."""
+    model = _response_model()
+    document = _get_discovery_document(service_name, version)
+    if document is None:
+        return build(service_name, version, http=http, model=model)
+    return build_from_document(document, http=http, model=model)
+
+
 def build_google_service(email: str, service_name: str, version: str) -> Any:
     """
     Build a Google API service client.
     
+    The client is reused on this thread until the user's access token changes.
+    
     Note: Call load_user_tokens() first if not already cached.
     
     Args:
@@ -280,7 +590,7 @@ def build_google_service(email: str, service_name: str, version: str) -> Any:
     creds = get_google_credentials(email)
     if not creds:
         raise ValueError(f"No Google credentials for {email}. Please re-authenticate.")
-    return build(service_name, version, credentials=creds)
+    return _get_user_service(email, creds, service_name, version)
 
 
 async def build_google_service_async(email: str, service_name: str, version: str) -> Any:
@@ -303,7 +613,96 @@ async def build_google_service_async(email: str, service_name: str, version: str
     creds = await get_google_credentials_async(email)
     if not creds:
         raise ValueError(f"No Google credentials for {email}. Please re-authenticate.")
-    return build(service_name, version, credentials=creds)
+    return _get_user_service(email, creds, service_name, version)
+
+
+def execute_with_retry(request: Any, num_retries: int = API_NUM_RETRIES) -> Any:
+    """
+    Execute a Google API request with exponential backoff.
+    
+    googleapiclient retries 5xx, 429 and 403 rate-limit responses itself when
+    num_retries is set. If a rate-limited request still fails and the server
+    sent a Retry-After header, wait that long and try once more.
+    
+    Only use this for reads and idempotent writes - a retried create or send
+    can be applied twice.
+    
+    Args:
+        request: googleapiclient HttpRequest
+        num_retries: Retries performed by googleapiclient
+        
+    Returns:
+        Parsed API response
+    """
+    try:
+        return request.execute(num_retries=num_retries)
+    except HttpError as e:
+        retry_after = e.resp.get("retry-after") if e.resp.status in (403, 429) else None
+        if not retry_after or not retry_after.isdigit():
+            raise
+        delay = min(int(retry_after), RETRY_AFTER_MAX_SECONDS)
+        logger.warning(f"Google API rate limited (HTTP {e.resp.status}), retrying in {delay}s")
+        time.sleep(delay)
+        return request.execute(num_retries=num_retries)
+
+
+def iter_paginated(
+    collection: Any,
+    items_key: str,
+    max_results: int,
+    page_size_param: str = "pageSize",
+    max_page_size: int = 100,
+    **list_kwargs: Any,
+) -> Iterator[dict]:
+    """
+    Iterate over the items of a paginated Google API list method.
+    
+    Follows nextPageToken (via the collection's list_next helper) until
+    max_results items have been yielded or the listing is exhausted.
+    
+    Args:
+        collection: API collection exposing list/list_next (e.g. service.files())
+        items_key: Response key holding the page items (e.g. "files", "messages")
+        max_results: Maximum number of items to yield
+        page_size_param: Name of the page-size parameter ("pageSize" or "maxResults")
+        max_page_size: Largest page size the API accepts for this method
+        **list_kwargs: Extra arguments for the list call (q, fields, orderBy, ...)
+        
+    Yields:
+        Raw item dictionaries from the API responses, in API order
+    """
+    remaining = max_results
+    if remaining <= 0:
+        return
+    
+    list_kwargs[page_size_param] = min(max_page_size, remaining)
+    request = collection.list(**list_kwargs)
+    
+    while request is not None:
+        response = execute_with_retry(request)
+        items = response.get(items_key, [])[:remaining]
+        yield from items
+        remaining -= len(items)
+        
+        if remaining <= 0 or not response.get("nextPageToken"):
+            return
+        request = collection.list_next(request, response)
+
+
+# Drive file fields and the keys the workspace tools return them under
+DRIVE_FILE_KEYS = {
+    "id": "id",
+    "name": "name",
+    "mimeType": "mime_type",
+    "createdTime": "created_time",
+    "modifiedTime": "modified_time",
+    "webViewLink": "web_link",
+}
+
+
+def escape_drive_query(value: str) -> str:
+    """Escape a value for use inside a single-quoted Drive search query string."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
 
 
 def get_gmail_service(email: str) -> Any:
@@ -316,10 +715,20 @@ def get_calendar_service(email: str) -> Any:
     return build_google_service(email, "calendar", "v3")
 
 
+@user_ttl_cache(ttl=CALENDAR_TIMEZONE_CACHE_TTL_SECONDS, maxsize=TOKEN_CACHE_MAXSIZE)
+def _fetch_calendar_timezone(user_email: str) -> str:
+    """Read the timezone setting from Google Calendar (errors are not cached)."""
+    service = get_calendar_service(user_email)
+    setting = service.settings().get(setting='timezone').execute()
+    return setting.get('value', 'UTC')
+
+
 def get_user_calendar_timezone(user_email: str) -> str:
     """
     Fetch user's timezone from Google Calendar settings.
     
+    Successful lookups are cached for CALENDAR_TIMEZONE_CACHE_TTL_SECONDS.
+    
     Args:
         user_email: User's email address
         
@@ -327,9 +736,7 @@ def get_user_calendar_timezone(user_email: str) -> str:
         IANA timezone string (e.g., 'America/New_York') or 'UTC' on error
     """
     try:
-        service = get_calendar_service(user_email)
-        setting = service.settings().get(setting='timezone').execute()
-        return setting.get('value', 'UTC')
+        return _fetch_calendar_timezone(user_email)
     except Exception as e:
         logger.warning(f"Failed to get calendar timezone for {user_email}: {e}")
         return 'UTC'
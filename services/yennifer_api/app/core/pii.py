@@ -19,7 +19,8 @@ Masking Modes:
 
 import re
 import logging
-from typing import Dict, List, Optional, Any
+from functools import partial
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from contextvars import ContextVar
 from enum import Enum
@@ -273,6 +274,60 @@ MASKING_RULES: Dict[MaskingMode, set] = {
 }
 
 
+# Order in which PII types are tried at each position (most specific first)
+# IMPORTANT Pattern order rules:
+# 1. Longer patterns before shorter (16-digit card before 12-digit Aadhaar)
+# 2. More specific patterns before generic (UPI before EMAIL)
+# 3. India-specific before generic where format overlaps (INDIAN_PHONE before PHONE)
+MASKING_PRIORITY: List[PIIType] = [
+    # Highest priority: Very specific patterns (most characters/most constrained)
+    PIIType.GSTIN,         # India: 15-char, very specific format
+    PIIType.CREDIT_CARD,   # 16-digit - MUST be before 12-digit Aadhaar!
+    PIIType.SSN,           # US/Canada SSN/SIN patterns (9-digit specific format)
+    PIIType.AADHAAR,       # India: 12-digit unique ID (after 16-digit card!)
+    PIIType.PAN,           # India: Very specific 10-char format ABCDE1234F
+    PIIType.IFSC,          # India: Bank code XXXX0XXXXXX (11 chars)
+    PIIType.IN_PASSPORT,   # India: Contextual passport pattern
+    PIIType.BANK_ACCOUNT,  # Contextual account patterns
+    # Medium priority: Contact patterns (India-specific before generic)
+    PIIType.UPI_ID,        # India: Must come BEFORE EMAIL (both use @)
+    PIIType.EMAIL,         # Generic email
+    PIIType.INDIAN_PHONE,  # India: Must come BEFORE PHONE (+91 format)
+    PIIType.PHONE,         # Generic phone
+    PIIType.VEHICLE_REG,   # India: Vehicle registration
+    # Lower priority: Contextual patterns
+    PIIType.ADDRESS,
+    PIIType.DOB,
+    PIIType.IP_ADDRESS,
+]
+
+
+def _build_masking_passes(types_to_mask: set) -> List[Tuple[PIIType, re.Pattern]]:
+    """
+    List the (PII type, pattern) passes for the given PII types.
+    
+    Passes follow MASKING_PRIORITY, and each type's patterns keep their
+    PII_PATTERNS order. Running them one after another means a more specific
+    type claims its text before a generic one can match part of it.
+    
+    Returns:
+        Passes to apply in order (empty if there is nothing to mask)
+    """
+    return [
+        (pii_type, pattern)
+        for pii_type in MASKING_PRIORITY
+        if pii_type in types_to_mask
+        for pattern in PII_PATTERNS[pii_type]
+    ]
+
+
+# Masking passes per mode, resolved once at import
+_MASKING_PASSES: Dict[MaskingMode, List[Tuple[PIIType, re.Pattern]]] = {
+    mode: _build_masking_passes(types)
+    for mode, types in MASKING_RULES.items()
+}
+
+
 @dataclass
 class MaskedItem:
     """Record of a single masked PII item."""
@@ -322,6 +377,14 @@ class PIIContext:
         self._opaque_counter: int = 0  # Global counter for [MASKED_N]
         self._value_to_placeholder: Dict[str, str] = {}  # Dedup: same value = same placeholder
     
+    def reset(self) -> None:
+        """Forget all masked items and restart numbering, reusing this context."""
+        self._mappings.clear()
+        self._counters.clear()
+        self._total_masked = 0
+        self._opaque_counter = 0
+        self._value_to_placeholder.clear()
+    
     def _next_placeholder(self, pii_type: PIIType, original_value: str) -> str:
         """
         Generate next OPAQUE placeholder.
@@ -371,70 +434,42 @@ class PIIContext:
         if not text or mode == MaskingMode.NONE:
             return PIIMaskingResult(masked_text=text, items_masked=[])
         
-        items_masked: List[MaskedItem] = []
-        result_text = text
+        passes = _MASKING_PASSES.get(mode)
+        if not passes:
+            return PIIMaskingResult(masked_text=text, items_masked=[])
         
-        # Get which types to mask in this mode
-        types_to_mask = MASKING_RULES.get(mode, set())
+        items_masked: List[MaskedItem] = []
         
-        # Apply patterns in order (most specific first)
-        # IMPORTANT Pattern order rules:
-        # 1. Longer patterns before shorter (16-digit card before 12-digit Aadhaar)
-        # 2. More specific patterns before generic (UPI before EMAIL)
-        # 3. India-specific before generic where format overlaps (INDIAN_PHONE before PHONE)
-        for pii_type in [
-            # Highest priority: Very specific patterns (most characters/most constrained)
-            PIIType.GSTIN,         # India: 15-char, very specific format
-            PIIType.CREDIT_CARD,   # 16-digit - MUST be before 12-digit Aadhaar!
-            PIIType.SSN,           # US/Canada SSN/SIN patterns (9-digit specific format)
-            PIIType.AADHAAR,       # India: 12-digit unique ID (after 16-digit card!)
-            PIIType.PAN,           # India: Very specific 10-char format ABCDE1234F
-            PIIType.IFSC,          # India: Bank code XXXX0XXXXXX (11 chars)
-            PIIType.IN_PASSPORT,   # India: Contextual passport pattern
-            PIIType.BANK_ACCOUNT,  # Contextual account patterns
-            # Medium priority: Contact patterns (India-specific before generic)
-            PIIType.UPI_ID,        # India: Must come BEFORE EMAIL (both use @)
-            PIIType.EMAIL,         # Generic email
-            PIIType.INDIAN_PHONE,  # India: Must come BEFORE PHONE (+91 format)
-            PIIType.PHONE,         # Generic phone
-            PIIType.VEHICLE_REG,   # India: Vehicle registration
-            # Lower priority: Contextual patterns
-            PIIType.ADDRESS,
-            PIIType.DOB,
-            PIIType.IP_ADDRESS,
-        ]:
-            if pii_type not in types_to_mask:
-                continue
+        def replace(pii_type: PIIType, match: re.Match) -> str:
+            original = match.group()
+            
+            # Skip if already masked (contains brackets)
+            if original.startswith('[') and original.endswith(']'):
+                return original
+            
+            # Get opaque placeholder (handles deduplication)
+            placeholder = self._next_placeholder(pii_type, original)
+            
+            # Only create new record if this is a new placeholder
+            if placeholder not in self._mappings:
+                # Create masked item record
+                item = MaskedItem(
+                    pii_type=pii_type,
+                    placeholder=placeholder,
+                    original_value=original,
+                )
+                items_masked.append(item)
                 
-            patterns = PII_PATTERNS.get(pii_type, [])
-            for pattern in patterns:
-                # Find all matches
-                for match in pattern.finditer(result_text):
-                    original = match.group()
-                    
-                    # Skip if already masked (contains brackets)
-                    if original.startswith('[') and original.endswith(']'):
-                        continue
-                    
-                    # Get opaque placeholder (handles deduplication)
-                    placeholder = self._next_placeholder(pii_type, original)
-                    
-                    # Only create new record if this is a new placeholder
-                    if placeholder not in self._mappings:
-                        # Create masked item record
-                        item = MaskedItem(
-                            pii_type=pii_type,
-                            placeholder=placeholder,
-                            original_value=original,
-                        )
-                        items_masked.append(item)
-                        
-                        # Store mapping for potential resolution
-                        self._mappings[placeholder] = item
-                        self._total_masked += 1
-                    
-                    # Replace in text (always replace, even for deduped values)
-                    result_text = result_text.replace(original, placeholder, 1)
+                # Store mapping for potential resolution
+                self._mappings[placeholder] = item
+                self._total_masked += 1
+            
+            return placeholder
+        
+        # Apply patterns in priority order; each pass is a single sub() over the text
+        result_text = text
+        for pii_type, pattern in passes:
+            result_text = pattern.sub(partial(replace, pii_type), result_text)
         
         return PIIMaskingResult(masked_text=result_text, items_masked=items_masked)
     
@@ -506,6 +541,21 @@ def clear_pii_context() -> None:
 # Convenience functions for tool authors
 # =============================================================================
 
+# Every PII pattern needs an "@" or a digit
+_PII_SIGILS = "@0123456789"
+
+
+def _may_contain_pii(text: str) -> bool:
+    """
+    Cheap pre-filter before running the masking regex.
+    
+    Plain substring checks, so text with no "@" and no digit skips the regex
+    entirely. Non-ASCII text always falls through, since \\d also matches
+    other scripts' digits.
+    """
+    return not text.isascii() or any(c in text for c in _PII_SIGILS)
+
+
 def mask_pii(
     text: str,
     mode: MaskingMode = MaskingMode.FULL,
@@ -528,7 +578,7 @@ def mask_pii(
             email = fetch_email(email_id)
             return mask_pii(format_email(email))
     """
-    if not text:
+    if not text or not _may_contain_pii(text):
         return text
     
     ctx = get_pii_context()
@@ -635,7 +685,8 @@ def unmask_pii(text: str) -> str:
         response = agent.chat(message)
         return unmask_pii(response)  # User sees real values
     """
-    if not text:
+    # No "[" means no placeholders to resolve
+    if not text or "[" not in text:
         return text
     
     ctx = get_pii_context()
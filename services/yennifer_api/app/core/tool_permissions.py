@@ -46,6 +46,7 @@ TOOL_SCOPE_REQUIREMENTS: Dict[str, List[str]] = {
     
     # === Drive tools ===
     "list_drive_files": ["drive.readonly"],
+    "list_drive_folders": ["drive.readonly"],
     "search_drive": ["drive.readonly"],
     "create_drive_folder": ["drive.file"],
     "rename_drive_file": ["drive.file"],
@@ -74,6 +75,7 @@ TOOL_SCOPE_REQUIREMENTS: Dict[str, List[str]] = {
     "create_slides_presentation": ["slides.full"],
     "add_slide_to_presentation": ["slides.full"],
     "add_text_to_presentation_slide": ["slides.full"],
+    "add_text_boxes_to_presentation_slide": ["slides.full"],
     "delete_presentation_slide": ["slides.full"],
 }
 
@@ -0,0 +1,158 @@
+"""
+TTL Cache Module
+
+Small in-process LRU cache with per-entry expiry, plus a decorator for
+caching idempotent per-user Google API reads.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+_MISSING = object()
+
+# Caches created by user_ttl_cache, for user-wide invalidation
+_user_caches: list["TTLCache"] = []
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Entries are evicted least-recently-used first once maxsize is reached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: Maximum number of entries kept in the cache
+            ttl: Time-to-live of each entry, in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry if the cache is full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (expired entries return default)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def evict(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove every entry whose key matches predicate."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert list/dict arguments into hashable equivalents for cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def user_ttl_cache(ttl: float, maxsize: int = 2048) -> Callable:
+    """
+    Cache results of a function whose first argument is user_email.
+
+    Calls are keyed by all bound arguments (defaults applied), so positional
+    and keyword invocations share entries. Cached results are returned as-is
+    and must be treated as read-only by callers.
+
+    The wrapped function gains:
+        cache_clear(): drop every entry
+        cache_invalidate(user_email): drop entries for one user
+
+    Use invalidate_user_caches() after writes to drop a user's entries
+    across every cached function.
+
+    Args:
+        ttl: Time-to-live of each entry, in seconds
+        maxsize: Maximum number of cached calls
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple((name, _freeze(value)) for name, value in bound.arguments.items())
+
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                cache.set(key, result)
+            return result
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_invalidate = functools.partial(_evict_user, cache)
+        _user_caches.append(cache)
+        return wrapper
+
+    return decorator
+
+
+def _evict_user(cache: TTLCache, user_email: Optional[str]) -> None:
+    """Drop every entry of cache belonging to user_email."""
+    cache.evict(lambda key: key[0][1] == user_email)
+
+
+def invalidate_user_caches(user_email: str) -> None:
+    """
+    Drop all cached reads for a user.
+
+    Call this after any write, so subsequent reads see the change.
+    """
+    for cache in _user_caches:
+        _evict_user(cache, user_email)
+
+
+def clear_user_caches() -> None:
+    """Drop all cached reads for every user."""
+    for cache in _user_caches:
+        cache.clear()
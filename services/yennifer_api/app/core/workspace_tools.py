@@ -9,10 +9,19 @@ PII Masking:
 - Write/action tools don't mask output (they return confirmations)
 """
 
-from datetime import datetime
+import threading
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
+from zoneinfo import ZoneInfo
+
+import requests
 from langchain_core.tools import tool
 
+from .auth import get_current_user_email
+from .config import get_settings
+from .google_services import get_cached_timezone, get_zoneinfo
 from .pii import mask_pii, mask_pii_financial_only, MaskingMode
 from ..tools import (
     # Calendar
@@ -31,6 +40,7 @@ from ..tools import (
     search_contacts as _search_contacts,
     # Drive
     list_drive_files as _list_drive_files,
+    list_drive_files_multi as _list_drive_files_multi,
     search_drive_files as _search_drive_files,
     get_file_content as _get_file_content,
     create_drive_folder as _create_drive_folder,
@@ -56,30 +66,43 @@ from ..tools import (
     create_presentation as _create_presentation,
     add_slide as _add_slide,
     add_text_to_slide as _add_text_to_slide,
+    add_text_boxes as _add_text_boxes,
     delete_slide as _delete_slide,
 )
 
 
-# Global variable to hold the current user's email
+# Current user's email for tool execution, per request context
 # This is set by the chat handler before invoking the agent
-_current_user_email: Optional[str] = None
+_current_user_email: ContextVar[Optional[str]] = ContextVar("tool_user_email", default=None)
 
 
 def set_current_user(email: str):
     """Set the current user email for tool execution."""
-    global _current_user_email
-    _current_user_email = email
+    _current_user_email.set(email)
 
 
 def get_current_user() -> str:
-    """Get the current user email."""
-    if not _current_user_email:
-        raise ValueError("No user email set. Please authenticate first.")
-    return _current_user_email
+    """
+    Get the current user email.
+    
+    Falls back to the authenticated request's email (and remembers it for
+    the rest of the request) when the chat handler has not set one.
+    """
+    email = _current_user_email.get()
+    if not email:
+        email = get_current_user_email()
+        if not email:
+            raise ValueError("No user email set. Please authenticate first.")
+        _current_user_email.set(email)
+    return email
 
 
 # ============== Utility Tools ==============
 
+# get_cached_timezone's fallback, so the common case skips the ZoneInfo lookup
+_UTC_ZI = ZoneInfo('UTC')
+
+
 @tool
 def get_current_datetime() -> str:
     """
@@ -89,13 +112,9 @@ def get_current_datetime() -> str:
     Returns:
         Current date, time (in user's timezone), and example ISO format for calendar events.
     """
-    from datetime import datetime, timedelta
-    from zoneinfo import ZoneInfo
-    from .google_services import get_cached_timezone
-    
     user_email = get_current_user()
     user_tz_str = get_cached_timezone(user_email)
-    tz = ZoneInfo(user_tz_str)
+    tz = _UTC_ZI if user_tz_str == 'UTC' else get_zoneinfo(user_tz_str)
     
     now = datetime.now(tz)
     tomorrow = now + timedelta(days=1)
@@ -115,6 +134,15 @@ Always use {now.year} or {now.year + 1} for the year."""
 
 # ============== Calendar Tools ==============
 
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 string (trailing 'Z' allowed), or None if invalid."""
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
+
+
 @tool
 def list_calendar_events(time_min: str, time_max: str) -> str:
     """
@@ -135,13 +163,16 @@ def list_calendar_events(time_min: str, time_max: str) -> str:
         - Specific day: time_min="2026-01-10T00:00:00", time_max="2026-01-10T23:59:59"
     """
     # Validation
-    try:
-        min_dt = datetime.fromisoformat(time_min.replace('Z', '+00:00'))
-        max_dt = datetime.fromisoformat(time_max.replace('Z', '+00:00'))
-        if min_dt >= max_dt:
-            return "❌ Error: time_min must be before time_max. Please check your date range."
-    except ValueError as e:
-        return f"❌ Error: Invalid date format. Use ISO format like '2026-01-05T00:00:00'. Details: {e}"
+    min_dt = _parse_iso(time_min)
+    max_dt = _parse_iso(time_max)
+    for value, parsed in ((time_min, min_dt), (time_max, max_dt)):
+        if parsed is None:
+            return (
+                "❌ Error: Invalid date format. Use ISO format like '2026-01-05T00:00:00'. "
+                f"Details: Invalid isoformat string: {value!r}"
+            )
+    if min_dt >= max_dt:
+        return "❌ Error: time_min must be before time_max. Please check your date range."
     
     events = _list_calendar_events(
         user_email=get_current_user(),
@@ -152,9 +183,10 @@ def list_calendar_events(time_min: str, time_max: str) -> str:
     if not events:
         return "No events found in the specified time range."
     
-    result = f"Calendar events ({len(events)} found):\n"
+    # Collect pieces and join once rather than re-copying the string per event
+    parts = [f"Calendar events ({len(events)} found):\n"]
     for event in events:
-        result += f"\n- **{event['summary']}**\n"
+        parts.append(f"\n- **{event['summary']}**\n")
         
         # Format dates with day-of-week using Python (LLMs are bad at date arithmetic)
         start_str = event['start']
@@ -178,14 +210,14 @@ def list_calendar_events(time_min: str, time_max: str) -> str:
             # Fallback to raw string if parsing fails
             time_str = f"{start_str} to {end_str}"
         
-        result += f"  Time: {time_str}\n"
+        parts.append(f"  Time: {time_str}\n")
         if event['location']:
-            result += f"  Location: {event['location']}\n"
+            parts.append(f"  Location: {event['location']}\n")
         if event['attendees']:
-            result += f"  Attendees: {', '.join(event['attendees'])}\n"
+            parts.append(f"  Attendees: {', '.join(event['attendees'])}\n")
     
     # Mask PII (emails in attendees, addresses in location)
-    return mask_pii(result)
+    return mask_pii("".join(parts))
 
 
 @tool
@@ -217,9 +249,6 @@ def create_calendar_event(
     Returns:
         Confirmation with event ID and link. Use the returned event_id for updates.
     """
-    from datetime import datetime, timedelta
-    from .google_services import get_cached_timezone
-    
     user_email = get_current_user()
     user_tz = get_cached_timezone(user_email)
     
@@ -281,8 +310,6 @@ def update_calendar_event(
     Returns:
         Confirmation with updated event info
     """
-    from .google_services import get_cached_timezone
-    
     user_email = get_current_user()
     user_tz = get_cached_timezone(user_email)
     
@@ -565,6 +592,50 @@ def list_drive_files(max_results: int = 20) -> str:
     return result
 
 
+@tool
+def list_drive_folders(folder_ids: list[str], max_results: int = 50) -> str:
+    """
+    List files inside one or more Google Drive folders.
+    
+    Use this instead of several list_drive_files calls when the user asks
+    about the contents of multiple folders (e.g. "show me files in these 3
+    projects"). All folders are listed together.
+    
+    Args:
+        folder_ids: Drive folder IDs to list
+        max_results: Maximum number of files across all folders (default: 50)
+        
+    Returns:
+        Files grouped by folder, newest first
+    """
+    files = _list_drive_files_multi(
+        user_email=get_current_user(),
+        folder_ids=folder_ids,
+        max_results=max_results,
+    )
+    if not files:
+        return "No files found in those folders."
+    
+    by_folder = {folder_id: [] for folder_id in folder_ids}
+    for f in files:
+        for parent in f['parents']:
+            if parent in by_folder:
+                by_folder[parent].append(f)
+    
+    lines = []
+    for folder_id, folder_files in by_folder.items():
+        lines.append(f"Folder {folder_id}:")
+        if not folder_files:
+            lines.append("  (no files)")
+        for i, f in enumerate(folder_files, 1):
+            if f.get('web_link'):
+                lines.append(f"{i}. **[{f['name']}]({f['web_link']})** ({f['mime_type']})")
+            else:
+                lines.append(f"{i}. **{f['name']}** ({f['mime_type']}) - ID: {f['id']}")
+        lines.append("")
+    return "\n".join(lines)
+
+
 @tool
 def search_drive(query: str) -> str:
     """
@@ -773,7 +844,10 @@ def list_spreadsheets() -> str:
     Returns:
         List of spreadsheets with links
     """
-    sheets = _list_spreadsheets(user_email=get_current_user())
+    sheets = _list_spreadsheets(
+        user_email=get_current_user(),
+        fields=("id", "name", "webViewLink"),
+    )
     if not sheets:
         return "No spreadsheets found."
     
@@ -802,6 +876,7 @@ def search_spreadsheets(search_term: str) -> str:
     sheets = _list_spreadsheets(
         user_email=get_current_user(),
         search_query=search_term,
+        fields=("id", "name", "webViewLink"),
     )
     if not sheets:
         return f"No spreadsheets found matching '{search_term}'. Try list_spreadsheets to see all available spreadsheets."
@@ -846,6 +921,7 @@ def read_spreadsheet_data(spreadsheet_id: str, range_name: str = "Sheet1") -> st
             user_email=get_current_user(),
             spreadsheet_id=spreadsheet_id,
             range_name=range_name,
+            include_metadata=True,
         )
     except ValueError as e:
         # Return the helpful error message from the underlying function
@@ -992,7 +1068,10 @@ def list_presentations() -> str:
     Returns:
         List of presentations with links
     """
-    slides = _list_presentations(user_email=get_current_user())
+    slides = _list_presentations(
+        user_email=get_current_user(),
+        fields=("id", "name", "webViewLink"),
+    )
     if not slides:
         return "No presentations found."
     
@@ -1082,6 +1161,9 @@ def add_text_to_presentation_slide(
     """
     Add a text box to a slide.
     
+    To add several text boxes to one slide (e.g. title, bullets and footer),
+    use add_text_boxes_to_presentation_slide instead.
+    
     Args:
         presentation_id: Presentation ID
         slide_id: Slide object ID (get from add_slide_to_presentation or read_presentation_content)
@@ -1107,6 +1189,36 @@ def add_text_to_presentation_slide(
     return f"✅ Text added to slide\nElement ID: {result['element_id']}\nLink: {result['web_link']}"
 
 
+@tool
+def add_text_boxes_to_presentation_slide(
+    presentation_id: str,
+    slide_id: str,
+    boxes: list[dict],
+) -> str:
+    """
+    Add several text boxes to a slide at once.
+    
+    Args:
+        presentation_id: Presentation ID
+        slide_id: Slide object ID (get from add_slide_to_presentation or read_presentation_content)
+        boxes: Text boxes to add, each with "text" and optional "x", "y",
+            "width", "height" in points (defaults: 100, 100, 400, 100)
+        
+    Returns:
+        Confirmation
+    """
+    result = _add_text_boxes(
+        user_email=get_current_user(),
+        presentation_id=presentation_id,
+        slide_id=slide_id,
+        boxes=boxes,
+    )
+    return (
+        f"✅ {len(result['element_ids'])} text boxes added to slide\n"
+        f"Element IDs: {', '.join(result['element_ids'])}\nLink: {result['web_link']}"
+    )
+
+
 @tool
 def delete_presentation_slide(presentation_id: str, slide_id: str) -> str:
     """
@@ -1150,9 +1262,6 @@ def sync_contacts_to_database() -> str:
     Returns:
         Confirmation that sync has been triggered.
     """
-    import threading
-    import requests
-    
     user_email = get_current_user()
     if not user_email:
         return "❌ Unable to sync: No authenticated user. Please log in first."
@@ -1205,15 +1314,12 @@ def get_my_profile() -> str:
     Returns:
         The user's profile information including name, email, company, title, etc.
     """
-    import requests
-    
     user_email = get_current_user()
     if not user_email:
         return "I don't have access to your profile information. Please log in first."
     
     try:
         # Call the User Network API to get core user profile
-        from ..core.config import get_settings
         settings = get_settings()
         
         response = requests.get(
@@ -1292,14 +1398,11 @@ def lookup_contact_email(name: str) -> str:
         - First call lookup_contact_email("Anish") to get their email
         - Then use that email in create_calendar_event's attendee_emails parameter
     """
-    import requests
-    
     user_email = get_current_user()
     if not user_email:
         return "Unable to look up contacts: Please log in first."
     
     try:
-        from ..core.config import get_settings
         settings = get_settings()
         
         # Search the User Network API for contacts matching the name
@@ -1401,6 +1504,7 @@ WORKSPACE_TOOLS = [
     sync_contacts_to_database,  # Sync Google Contacts to User Network
     # Drive
     list_drive_files,
+    list_drive_folders,
     search_drive,
     create_drive_folder,
     rename_drive_file,
@@ -1426,6 +1530,7 @@ WORKSPACE_TOOLS = [
     create_slides_presentation,
     add_slide_to_presentation,
     add_text_to_presentation_slide,
+    add_text_boxes_to_presentation_slide,
     delete_presentation_slide,
 ]
 
@@ -629,6 +629,33 @@ class IntegrationsRepository:
     # Bulk Operations for Migration
     # =========================================================================
     
+    async def get_users_with_enabled_integrations(
+        self,
+        user_ids: List[UUID]
+    ) -> set[UUID]:
+        """
+        Find which of the given users have at least one active integration enabled.
+        
+        One query for the whole batch instead of get_user_integrations per user.
+        
+        Args:
+            user_ids: Users to check
+            
+        Returns:
+            Set of user IDs that already have integrations enabled
+        """
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT DISTINCT ui.user_id
+                FROM user_integrations ui
+                JOIN integrations i ON i.id = ui.integration_id
+                WHERE ui.user_id = ANY($1::uuid[])
+                  AND ui.is_enabled = TRUE
+                  AND i.is_active = TRUE
+            """, user_ids)
+            
+            return {row["user_id"] for row in rows}
+    
     async def enable_all_integrations_and_scopes(
         self,
         user_id: UUID,
@@ -702,4 +729,86 @@ class IntegrationsRepository:
                     "integrations_enabled": integrations_count,
                     "scopes_enabled": scopes_count
                 }
+    
+    async def enable_all_integrations_and_scopes_bulk(
+        self,
+        user_ids: List[UUID],
+        mark_granted: bool = True
+    ) -> Dict[str, int]:
+        """
+        Enable all integrations and scopes for many users in one transaction.
+        
+        Same effect as enable_all_integrations_and_scopes for each user, but
+        with one INSERT per table for the whole batch. Cross-user writes, so
+        like migration 015 this relies on the migrating role bypassing RLS.
+        
+        Args:
+            user_ids: Users to migrate
+            mark_granted: If True, also mark all scopes as granted
+            
+        Returns:
+            Dict with counts of integration and scope rows written
+        """
+        # ON CONFLICT DO UPDATE cannot touch a row twice in one statement,
+        # so a repeated user ID would fail the whole batch
+        user_ids = list(dict.fromkeys(user_ids))
+        
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                # Enable all integrations
+                integrations_result = await conn.execute("""
+                    INSERT INTO user_integrations (user_id, integration_id, is_enabled, enabled_at)
+                    SELECT u.user_id, i.id, TRUE, NOW()
+                    FROM unnest($1::uuid[]) AS u(user_id)
+                    CROSS JOIN integrations i
+                    WHERE i.is_active = TRUE
+                    ON CONFLICT (user_id, integration_id)
+                    DO UPDATE SET
+                        is_enabled = TRUE,
+                        enabled_at = COALESCE(user_integrations.enabled_at, NOW()),
+                        updated_at = NOW()
+                """, user_ids)
+                
+                # Enable and optionally grant all scopes
+                if mark_granted:
+                    scopes_result = await conn.execute("""
+                        INSERT INTO user_integration_scopes (user_id, scope_id, is_enabled, is_granted, granted_at)
+                        SELECT u.user_id, s.id, TRUE, TRUE, NOW()
+                        FROM unnest($1::uuid[]) AS u(user_id)
+                        CROSS JOIN integration_scopes s
+                        JOIN integrations i ON s.integration_id = i.id
+                        WHERE i.is_active = TRUE
+                        ON CONFLICT (user_id, scope_id)
+                        DO UPDATE SET
+                            is_enabled = TRUE,
+                            is_granted = TRUE,
+                            granted_at = COALESCE(user_integration_scopes.granted_at, NOW()),
+                            updated_at = NOW()
+                    """, user_ids)
+                else:
+                    scopes_result = await conn.execute("""
+                        INSERT INTO user_integration_scopes (user_id, scope_id, is_enabled)
+                        SELECT u.user_id, s.id, TRUE
+                        FROM unnest($1::uuid[]) AS u(user_id)
+                        CROSS JOIN integration_scopes s
+                        JOIN integrations i ON s.integration_id = i.id
+                        WHERE i.is_active = TRUE
+                        ON CONFLICT (user_id, scope_id)
+                        DO UPDATE SET
+                            is_enabled = TRUE,
+                            updated_at = NOW()
+                    """, user_ids)
+                
+                integrations_count = int(integrations_result.split()[-1]) if integrations_result else 0
+                scopes_count = int(scopes_result.split()[-1]) if scopes_result else 0
+                
+                logger.info(
+                    f"Enabled all integrations/scopes for {len(user_ids)} users: "
+                    f"{integrations_count} integrations, {scopes_count} scopes"
+                )
+                
+                return {
+                    "integrations_enabled": integrations_count,
+                    "scopes_enabled": scopes_count
+                }
 
@@ -112,31 +112,38 @@ class TokenRepository:
             logger.error(f"Failed to save tokens for {email}: {e}")
             raise
     
-    async def get_tokens(
+    async def _fetch_tokens(
         self,
         email: str,
-        provider: str = "google",
-    ) -> Optional[dict]:
+        provider: str,
+        include_timezone: bool,
+    ) -> Optional[tuple[dict, Optional[str]]]:
         """
-        Get OAuth tokens for a user (legacy method).
+        Look up, decrypt and mark as used a user's legacy OAuth tokens.
         
-        Uses system-wide decryption. For per-user decryption,
-        use get_tokens_for_user() instead.
+        Shared by get_tokens() and get_tokens_with_timezone(); the users
+        table is only joined when include_timezone is set.
         
-        Args:
-            email: User's email address.
-            provider: OAuth provider name (default: "google").
-            
         Returns:
-            Token dictionary if found and valid, None otherwise.
+            (tokens, timezone) if tokens are found and valid, None otherwise.
+            timezone is None unless include_timezone is set and the user row
+            has one.
         """
         try:
             async with self.pool.acquire() as conn:
-                row = await conn.fetchrow("""
-                    SELECT encrypted_tokens, is_valid, expires_at
-                    FROM user_oauth_tokens
-                    WHERE email = $1 AND provider = $2 AND is_valid = TRUE
-                """, email, provider)
+                if include_timezone:
+                    row = await conn.fetchrow("""
+                        SELECT t.encrypted_tokens, u.timezone
+                        FROM user_oauth_tokens t
+                        LEFT JOIN users u ON u.email = LOWER(t.email)
+                        WHERE t.email = $1 AND t.provider = $2 AND t.is_valid = TRUE
+                    """, email, provider)
+                else:
+                    row = await conn.fetchrow("""
+                        SELECT encrypted_tokens, is_valid, expires_at
+                        FROM user_oauth_tokens
+                        WHERE email = $1 AND provider = $2 AND is_valid = TRUE
+                    """, email, provider)
                 
                 if not row:
                     return None
@@ -152,12 +159,54 @@ class TokenRepository:
                     WHERE email = $1 AND provider = $2
                 """, email, provider)
                 
-                return tokens
+                return tokens, row["timezone"] if include_timezone else None
                 
         except Exception as e:
             logger.error(f"Failed to get tokens for {email}: {e}")
             return None
     
+    async def get_tokens(
+        self,
+        email: str,
+        provider: str = "google",
+    ) -> Optional[dict]:
+        """
+        Get OAuth tokens for a user (legacy method).
+        
+        Uses system-wide decryption. For per-user decryption,
+        use get_tokens_for_user() instead.
+        
+        Args:
+            email: User's email address.
+            provider: OAuth provider name (default: "google").
+            
+        Returns:
+            Token dictionary if found and valid, None otherwise.
+        """
+        result = await self._fetch_tokens(email, provider, include_timezone=False)
+        return result[0] if result else None
+    
+    async def get_tokens_with_timezone(
+        self,
+        email: str,
+        provider: str = "google",
+    ) -> Optional[tuple[dict, Optional[str]]]:
+        """
+        Get OAuth tokens and the user's timezone in one query (legacy method).
+        
+        Same token lookup as get_tokens(), joined to the users table so
+        callers that also need the timezone avoid a second round trip.
+        
+        Args:
+            email: User's email address.
+            provider: OAuth provider name (default: "google").
+            
+        Returns:
+            (tokens, timezone) if tokens are found and valid, None otherwise.
+            timezone is None if the user row or its timezone is missing.
+        """
+        return await self._fetch_tokens(email, provider, include_timezone=True)
+    
     async def delete_tokens(
         self,
         email: str,
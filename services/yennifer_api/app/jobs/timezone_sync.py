@@ -7,6 +7,7 @@ This ensures users get accurate local time for calendar operations.
 Runs daily at 3 AM UTC.
 """
 
+import asyncio
 import logging
 
 from ..core.scheduler import register_job
@@ -20,6 +21,45 @@ logger = logging.getLogger(__name__)
 # Required scope for timezone sync - only users with this scope granted will be synced
 REQUIRED_SCOPE = "calendar.readonly"
 
+# Users synced concurrently (each may hold a pool connection while loading tokens)
+SYNC_CONCURRENCY = 8
+
+
+async def _sync_user(user, user_repo: UserRepository, semaphore: asyncio.Semaphore) -> str:
+    """
+    Sync one user's timezone from Google Calendar.
+    
+    Returns:
+        'updated', 'unchanged' or 'error'
+    """
+    user_email = user['email']
+    current_tz = user['current_tz'] or 'UTC'
+    
+    async with semaphore:
+        try:
+            # Load tokens first (required for Google API calls)
+            tokens = await load_user_tokens(user_email)
+            if not tokens:
+                logger.debug(f"No valid tokens for {user_email}, skipping")
+                return 'unchanged'
+            
+            # Fetch timezone from Google Calendar (blocking client, so off the loop)
+            new_tz = await asyncio.to_thread(get_user_calendar_timezone, user_email)
+            
+            # Only update if timezone changed
+            if new_tz != current_tz:
+                await user_repo.update_user_timezone(user['id'], new_tz)
+                logger.info(f"Updated timezone for {user_email}: {current_tz} -> {new_tz}")
+                return 'updated'
+            
+            logger.debug(f"Timezone unchanged for {user_email}: {current_tz}")
+            return 'unchanged'
+            
+        except Exception as e:
+            # One user's failure must not stop the others
+            logger.warning(f"Failed to sync timezone for {user_email}: {e}")
+            return 'error'
+
 
 @register_job(
     trigger='cron',
@@ -32,8 +72,9 @@ async def sync_user_timezones():
     """
     Sync all users' timezones from Google Calendar.
     
-    Iterates through all users with the calendar.readonly scope granted and updates their
-    timezone in the local database based on their Google Calendar settings.
+    Syncs all users with the calendar.readonly scope granted, up to
+    SYNC_CONCURRENCY at a time, updating their timezone in the local database
+    based on their Google Calendar settings.
     
     This job runs daily to keep timezone information up-to-date, especially
     for users who travel or change their calendar timezone settings.
@@ -66,39 +107,14 @@ async def sync_user_timezones():
     
     logger.info(f"Found {len(users)} users to sync timezones for")
     
-    success_count = 0
-    error_count = 0
-    skipped_count = 0
+    semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+    results = await asyncio.gather(
+        *(_sync_user(user, user_repo, semaphore) for user in users)
+    )
     
-    for user in users:
-        user_email = user['email']
-        user_id = user['id']
-        current_tz = user['current_tz'] or 'UTC'
-        
-        try:
-            # Load tokens first (required for Google API calls)
-            tokens = await load_user_tokens(user_email)
-            if not tokens:
-                logger.debug(f"No valid tokens for {user_email}, skipping")
-                skipped_count += 1
-                continue
-            
-            # Fetch timezone from Google Calendar
-            new_tz = get_user_calendar_timezone(user_email)
-            
-            # Only update if timezone changed
-            if new_tz != current_tz:
-                await user_repo.update_user_timezone(user_id, new_tz)
-                logger.info(f"Updated timezone for {user_email}: {current_tz} -> {new_tz}")
-                success_count += 1
-            else:
-                logger.debug(f"Timezone unchanged for {user_email}: {current_tz}")
-                skipped_count += 1
-            
-        except Exception as e:
-            error_count += 1
-            logger.warning(f"Failed to sync timezone for {user_email}: {e}")
-            # Continue processing other users
+    success_count = results.count('updated')
+    skipped_count = results.count('unchanged')
+    error_count = results.count('error')
     
     logger.info(
         f"Timezone sync complete: {success_count} updated, "
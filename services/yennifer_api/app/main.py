@@ -31,6 +31,7 @@ from .core.scheduler import start_scheduler, stop_scheduler
 from .core.audit import init_audit_logger, shutdown_audit_logger
 from .core.pii_audit import init_pii_audit_logger
 from .core.analytics import init_analytics, shutdown_analytics
+from .core.google_services import close_http_client, preload_discovery_documents
 from .db.connection import init_db, close_db, get_db_pool
 from .middleware import AuditMiddleware, PIIContextMiddleware
 from .jobs import register_all_jobs
@@ -72,6 +73,10 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to connect to database: {e}")
         logger.warning("Continuing without database - token storage will be unavailable")
     
+    # Parse Google API discovery documents before the first tool call
+    logger.info("Loading Google API discovery documents...")
+    preload_discovery_documents()
+    
     # Start background scheduler
     logger.info("Starting background job scheduler...")
     register_all_jobs()
@@ -101,6 +106,9 @@ async def lifespan(app: FastAPI):
     logger.info("Stopping background job scheduler...")
     stop_scheduler()
     
+    # Close the shared Google token-endpoint client
+    await close_http_client()
+    
     # Close database connection pool
     logger.info("Closing database connection...")
     await close_db()
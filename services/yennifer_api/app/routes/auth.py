@@ -275,8 +275,9 @@ async def _trigger_initial_timezone_sync(user_email: str):
                     logger.info(f"✅ Updated timezone for {user_email}: {current_tz} -> {new_tz}")
                     
                     # Also update the token cache so it takes effect immediately
-                    if user_email in _token_cache:
-                        _token_cache[user_email]["timezone"] = new_tz
+                    cached = _token_cache.get(user_email)
+                    if cached:
+                        cached.timezone = new_tz
                 else:
                     logger.debug(f"Timezone already correct for {user_email}: {new_tz}")
             else:
@@ -155,6 +155,7 @@ READ_ONLY_TOOLS = {
     "list_my_contacts",
     "search_my_contacts",
     "list_drive_files",
+    "list_drive_folders",
     "search_drive",
     "list_spreadsheets",
     "search_spreadsheets",
@@ -295,7 +296,10 @@ async def repair_incomplete_tool_calls_async(
                 # Use functools.partial or default args to capture variables correctly
                 def invoke_tool(func=tool_func, args=tool_args):
                     return func.invoke(args)
-                result = await asyncio.get_event_loop().run_in_executor(None, invoke_tool)
+                # Copied context so the tool sees the current user's ContextVars
+                result = await asyncio.get_event_loop().run_in_executor(
+                    None, contextvars.copy_context().run, invoke_tool
+                )
                 tool_results[tc_id] = str(result)
                 logger.info(f"Re-executed read-only tool '{tool_name}' successfully")
             except Exception as e:
@@ -46,6 +46,9 @@ from ..tools import (
 
 router = APIRouter(prefix="/workspace", tags=["workspace"])
 
+# Drive fields returned by the Sheets/Slides listing endpoints
+API_LIST_FIELDS = ("id", "name", "createdTime", "modifiedTime", "webViewLink")
+
 
 # ============== Calendar Endpoints ==============
 
@@ -133,6 +136,7 @@ async def api_read_emails(
     query: str = Query(""),
     days_back: Optional[int] = Query(None),
     unread_only: bool = Query(False),
+    include_body: bool = Query(True),
     current_user: TokenData = Depends(get_current_user),
 ):
     """Read emails from inbox."""
@@ -143,6 +147,7 @@ async def api_read_emails(
             query=query,
             days_back=days_back,
             unread_only=unread_only,
+            include_body=include_body,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -287,6 +292,7 @@ async def api_list_spreadsheets(
         return list_spreadsheets(
             user_email=current_user.email,
             max_results=max_results,
+            fields=API_LIST_FIELDS,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -296,6 +302,8 @@ async def api_list_spreadsheets(
 async def api_read_spreadsheet(
     spreadsheet_id: str,
     range_name: str = Query("Sheet1"),
+    include_metadata: bool = Query(True),
+    as_columns: bool = Query(False),
     current_user: TokenData = Depends(get_current_user),
 ):
     """Read spreadsheet data."""
@@ -304,6 +312,8 @@ async def api_read_spreadsheet(
             user_email=current_user.email,
             spreadsheet_id=spreadsheet_id,
             range_name=range_name,
+            include_metadata=include_metadata,
+            as_columns=as_columns,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -397,6 +407,7 @@ async def api_list_presentations(
         return list_presentations(
             user_email=current_user.email,
             max_results=max_results,
+            fields=API_LIST_FIELDS,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
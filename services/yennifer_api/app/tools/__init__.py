@@ -27,6 +27,7 @@ from .contacts_tools import (
 
 from .drive_tools import (
     list_drive_files,
+    list_drive_files_multi,
     search_drive_files,
     get_file_content,
     create_drive_folder,
@@ -59,6 +60,7 @@ from .slides_tools import (
     create_presentation,
     add_slide,
     add_text_to_slide,
+    add_text_boxes,
     delete_slide,
 )
 
@@ -80,6 +82,7 @@ __all__ = [
     "get_contact",
     # Drive
     "list_drive_files",
+    "list_drive_files_multi",
     "search_drive_files",
     "get_file_content",
     "create_drive_folder",
@@ -106,6 +109,7 @@ __all__ = [
     "create_presentation",
     "add_slide",
     "add_text_to_slide",
+    "add_text_boxes",
     "delete_slide",
 ]
 
@@ -6,7 +6,8 @@ Functions for reading and creating Google Docs.
 
 from typing import Optional
 
-from ..core.google_services import get_docs_service, get_drive_service
+from ..core.google_services import get_docs_service, get_drive_service, iter_paginated
+from ..core.ttl_cache import invalidate_user_caches
 
 
 def list_documents(
@@ -25,14 +26,14 @@ def list_documents(
     """
     service = get_drive_service(user_email)
     
-    results = service.files().list(
-        pageSize=max_results,
+    files = iter_paginated(
+        service.files(),
+        "files",
+        max_results,
         q="mimeType='application/vnd.google-apps.document' and trashed=false",
-        fields="files(id, name, createdTime, modifiedTime, webViewLink)",
+        fields="nextPageToken, files(id, name, createdTime, modifiedTime, webViewLink)",
         orderBy="modifiedTime desc",
-    ).execute()
-    
-    files = results.get("files", [])
+    )
     
     return [
         {
@@ -129,6 +130,8 @@ def create_document(
             body={"requests": requests},
         ).execute()
     
+    invalidate_user_caches(user_email)
+    
     return {
         "document_id": document_id,
         "title": title,
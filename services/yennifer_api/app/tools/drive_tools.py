@@ -4,11 +4,66 @@ Google Drive Tools
 Functions for accessing Google Drive files and folders.
 """
 
-from typing import Optional
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional
 
-from ..core.google_services import get_drive_service
+from googleapiclient.http import MediaIoBaseDownload
 
+from ..core.google_services import (
+    API_NUM_RETRIES,
+    execute_with_retry,
+    get_drive_service,
+    iter_paginated,
+)
+from ..core.ttl_cache import invalidate_user_caches, user_ttl_cache
 
+
+# Drive rejects queries with too many clauses; 50 parents per query is safe
+MAX_PARENTS_PER_QUERY = 50
+
+# Concurrent Drive requests when listing several folder chunks
+MULTI_LIST_WORKERS = 6
+
+# Seconds an identical read is served from cache (writes invalidate early)
+READ_CACHE_TTL = 30
+
+# Maximum characters of file content returned to the LLM
+CONTENT_CHAR_LIMIT = 10000
+
+# Bytes to download for CONTENT_CHAR_LIMIT characters (UTF-8 is at most 4 bytes/char)
+CONTENT_BYTE_LIMIT = CONTENT_CHAR_LIMIT * 4
+
+
+def _iter_files(
+    files: Iterable[dict],
+    include_owners: bool = False,
+    include_parents: bool = False,
+) -> Iterator[dict]:
+    """
+    Convert Drive file resources into tool result dictionaries.
+    
+    Consumes files lazily, so results can be built straight from the
+    paginated API responses without an intermediate list.
+    """
+    for f in files:
+        item = {
+            "id": f.get("id"),
+            "name": f.get("name"),
+            "mime_type": f.get("mimeType"),
+            "created_time": f.get("createdTime"),
+            "modified_time": f.get("modifiedTime"),
+            "size": f.get("size"),
+            "web_link": f.get("webViewLink"),
+        }
+        if include_owners:
+            item["owners"] = [o.get("displayName") for o in f.get("owners", [])]
+        if include_parents:
+            item["parents"] = f.get("parents", [])
+        yield item
+
+
+@user_ttl_cache(ttl=READ_CACHE_TTL)
 def list_drive_files(
     user_email: str,
     max_results: int = 20,
@@ -38,28 +93,79 @@ def list_drive_files(
     
     query = " and ".join(query_parts)
     
-    results = service.files().list(
-        pageSize=max_results,
+    files = iter_paginated(
+        service.files(),
+        "files",
+        max_results,
         q=query,
-        fields="files(id, name, mimeType, createdTime, modifiedTime, size, webViewLink, owners)",
+        fields="nextPageToken, files(id, name, mimeType, createdTime, modifiedTime, size, webViewLink, owners)",
         orderBy="modifiedTime desc",
-    ).execute()
+    )
     
-    files = results.get("files", [])
+    return list(_iter_files(files, include_owners=True))
+
+
+def _list_children(
+    user_email: str,
+    folder_ids: list[str],
+    max_results: int,
+) -> list[dict]:
+    """List the children of several folders with a single combined parents query."""
+    # Build a service per call - httplib2 connections are not thread-safe
+    service = get_drive_service(user_email)
     
-    return [
-        {
-            "id": f.get("id"),
-            "name": f.get("name"),
-            "mime_type": f.get("mimeType"),
-            "created_time": f.get("createdTime"),
-            "modified_time": f.get("modifiedTime"),
-            "size": f.get("size"),
-            "web_link": f.get("webViewLink"),
-            "owners": [o.get("displayName") for o in f.get("owners", [])],
-        }
-        for f in files
+    parents_clause = " or ".join(f"'{folder_id}' in parents" for folder_id in folder_ids)
+    
+    return list(iter_paginated(
+        service.files(),
+        "files",
+        max_results,
+        q=f"trashed=false and ({parents_clause})",
+        fields="nextPageToken, files(id, name, mimeType, createdTime, modifiedTime, size, webViewLink, owners, parents)",
+        orderBy="modifiedTime desc",
+    ))
+
+
+@user_ttl_cache(ttl=READ_CACHE_TTL)
+def list_drive_files_multi(
+    user_email: str,
+    folder_ids: list[str],
+    max_results: int = 100,
+) -> list[dict]:
+    """
+    List files across several Drive folders.
+    
+    Folder IDs are grouped into combined 'in parents' queries (up to
+    MAX_PARENTS_PER_QUERY per request) which run concurrently.
+    
+    Args:
+        user_email: User's email for authentication
+        folder_ids: Folder IDs to list files from
+        max_results: Maximum number of files to return across all folders
+        
+    Returns:
+        List of file dictionaries as from list_drive_files, newest first.
+        Each also includes its parent folder IDs so callers can group
+        results by folder.
+    """
+    if not folder_ids:
+        return []
+    
+    chunks = [
+        folder_ids[i:i + MAX_PARENTS_PER_QUERY]
+        for i in range(0, len(folder_ids), MAX_PARENTS_PER_QUERY)
     ]
+    
+    with ThreadPoolExecutor(max_workers=min(MULTI_LIST_WORKERS, len(chunks))) as executor:
+        pages = executor.map(lambda chunk: _list_children(user_email, chunk, max_results), chunks)
+        # A file with parents in several chunks is returned by each of them
+        files = list({f.get("id"): f for page in pages for f in page}.values())
+    
+    if len(chunks) > 1:
+        # Each chunk is sorted on its own; restore a global newest-first order
+        files.sort(key=lambda f: f.get("modifiedTime") or "", reverse=True)
+    
+    return list(_iter_files(files[:max_results], include_owners=True, include_parents=True))
 
 
 def search_drive_files(
@@ -83,27 +189,54 @@ def search_drive_files(
     # Build search query
     search_query = f"name contains '{query}' and trashed=false"
     
-    results = service.files().list(
-        pageSize=max_results,
+    files = iter_paginated(
+        service.files(),
+        "files",
+        max_results,
         q=search_query,
-        fields="files(id, name, mimeType, createdTime, modifiedTime, size, webViewLink)",
+        fields="nextPageToken, files(id, name, mimeType, createdTime, modifiedTime, size, webViewLink)",
         orderBy="modifiedTime desc",
-    ).execute()
+    )
     
-    files = results.get("files", [])
+    return list(_iter_files(files))
+
+
+def _download_text(request: Any) -> str:
+    """
+    Download only the first CONTENT_BYTE_LIMIT bytes of a media request.
     
-    return [
-        {
-            "id": f.get("id"),
-            "name": f.get("name"),
-            "mime_type": f.get("mimeType"),
-            "created_time": f.get("createdTime"),
-            "modified_time": f.get("modifiedTime"),
-            "size": f.get("size"),
-            "web_link": f.get("webViewLink"),
-        }
-        for f in files
-    ]
+    Uses a ranged download so large files are never fetched in full.
+    """
+    buffer = io.BytesIO()
+    downloader = MediaIoBaseDownload(buffer, request, chunksize=CONTENT_BYTE_LIMIT)
+    downloader.next_chunk(num_retries=API_NUM_RETRIES)
+    
+    # The cut may land inside a multi-byte character; drop the partial tail
+    data = buffer.getvalue()[:CONTENT_BYTE_LIMIT]
+    return data.decode("utf-8", errors="ignore")[:CONTENT_CHAR_LIMIT]
+
+
+def _export_google_doc(service: Any, file_id: str) -> str:
+    """Export a Google Doc as plain text."""
+    return _download_text(service.files().export_media(fileId=file_id, mimeType="text/plain"))
+
+
+def _download_text_file(service: Any, file_id: str) -> str:
+    """Download a plain text file."""
+    return _download_text(service.files().get_media(fileId=file_id))
+
+
+# Content readers keyed by exact MIME type
+CONTENT_HANDLERS: dict[str, Callable[[Any, str], str]] = {
+    "application/vnd.google-apps.document": _export_google_doc,
+    "application/vnd.google-apps.spreadsheet": lambda service, file_id: "[Spreadsheet - use Sheets tools to read content]",
+    "application/vnd.google-apps.presentation": lambda service, file_id: "[Presentation - use Slides tools to read content]",
+}
+
+# Content readers for MIME type prefixes, tried when there is no exact match
+CONTENT_PREFIX_HANDLERS: tuple[tuple[str, Callable[[Any, str], str]], ...] = (
+    ("text/", _download_text_file),
+)
 
 
 def get_file_content(
@@ -123,10 +256,10 @@ def get_file_content(
     service = get_drive_service(user_email)
     
     # Get file metadata
-    file_metadata = service.files().get(
+    file_metadata = execute_with_retry(service.files().get(
         fileId=file_id,
         fields="id, name, mimeType, createdTime, modifiedTime, size, webViewLink, description",
-    ).execute()
+    ))
     
     result = {
         "id": file_metadata.get("id"),
@@ -140,27 +273,20 @@ def get_file_content(
         "content": None,
     }
     
-    # Try to export content for Google Workspace files
+    # Dispatch on MIME type: exact match first, then prefix match
     mime_type = file_metadata.get("mimeType", "")
-    
-    try:
-        if mime_type == "application/vnd.google-apps.document":
-            # Export Google Doc as plain text
-            content = service.files().export(
-                fileId=file_id,
-                mimeType="text/plain"
-            ).execute()
-            result["content"] = content.decode("utf-8")[:10000]  # Limit size
-        elif mime_type == "application/vnd.google-apps.spreadsheet":
-            result["content"] = "[Spreadsheet - use Sheets tools to read content]"
-        elif mime_type == "application/vnd.google-apps.presentation":
-            result["content"] = "[Presentation - use Slides tools to read content]"
-        elif mime_type.startswith("text/"):
-            # Download text files
-            content = service.files().get_media(fileId=file_id).execute()
-            result["content"] = content.decode("utf-8")[:10000]
-    except Exception as e:
-        result["content"] = f"[Unable to read content: {str(e)}]"
+    handler = CONTENT_HANDLERS.get(mime_type)
+    if handler is None:
+        handler = next(
+            (h for prefix, h in CONTENT_PREFIX_HANDLERS if mime_type.startswith(prefix)),
+            None,
+        )
+    
+    if handler is not None:
+        try:
+            result["content"] = handler(service, file_id)
+        except Exception as e:
+            result["content"] = f"[Unable to read content: {str(e)}]"
     
     return result
 
@@ -196,6 +322,8 @@ def create_drive_folder(
         fields="id, name, webViewLink",
     ).execute()
     
+    invalidate_user_caches(user_email)
+    
     return {
         "id": folder.get("id"),
         "name": folder.get("name"),
@@ -224,11 +352,13 @@ def rename_drive_file(
     
     file_metadata = {"name": new_name}
     
-    updated_file = service.files().update(
+    updated_file = execute_with_retry(service.files().update(
         fileId=file_id,
         body=file_metadata,
         fields="id, name, webViewLink",
-    ).execute()
+    ))
+    
+    invalidate_user_caches(user_email)
     
     return {
         "id": updated_file.get("id"),
@@ -257,20 +387,22 @@ def move_drive_file(
     service = get_drive_service(user_email)
     
     # Get current parents
-    file = service.files().get(
+    file = execute_with_retry(service.files().get(
         fileId=file_id,
         fields="parents",
-    ).execute()
+    ))
     
     previous_parents = ",".join(file.get("parents", []))
     
     # Move file
-    updated_file = service.files().update(
+    updated_file = execute_with_retry(service.files().update(
         fileId=file_id,
         addParents=new_parent_id,
         removeParents=previous_parents,
         fields="id, name, parents, webViewLink",
-    ).execute()
+    ))
+    
+    invalidate_user_caches(user_email)
     
     return {
         "id": updated_file.get("id"),
@@ -303,10 +435,12 @@ def delete_drive_file(
         service.files().delete(fileId=file_id).execute()
     else:
         # Move to trash
-        service.files().update(
+        execute_with_retry(service.files().update(
             fileId=file_id,
             body={"trashed": True},
-        ).execute()
+        ))
+    
+    invalidate_user_caches(user_email)
     
     return {
         "id": file_id,
@@ -342,6 +476,8 @@ def copy_drive_file(
         fields="id, name, webViewLink",
     ).execute()
     
+    invalidate_user_caches(user_email)
+    
     return {
         "id": copied_file.get("id"),
         "name": copied_file.get("name"),
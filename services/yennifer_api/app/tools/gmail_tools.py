@@ -6,13 +6,17 @@ Functions for reading and sending emails via Gmail API.
 
 import base64
 from datetime import datetime, timedelta
-from email.mime.text import MIMEText
 from typing import Optional
 
-from bs4 import BeautifulSoup
+from ..core.google_services import execute_with_retry, get_gmail_service, iter_paginated
+from ..core.ttl_cache import user_ttl_cache
 
-from ..core.google_services import get_gmail_service
 
+# Seconds an identical read is served from cache
+READ_CACHE_TTL = 30
+
+# Headers requested when message bodies are not needed (format="metadata")
+EMAIL_METADATA_HEADERS = ["Subject", "From", "To", "Date"]
 
 # Gmail category label mappings
 # These are the internal label IDs Gmail uses for category tabs
@@ -37,8 +41,9 @@ def _get_category(labels: list) -> str:
         Defaults to "primary" if no category label found
     """
     for label in labels:
-        if label in GMAIL_CATEGORIES:
-            return GMAIL_CATEGORIES[label]
+        category = GMAIL_CATEGORIES.get(label)
+        if category is not None:
+            return category
     return "primary"  # Default if no category label
 
 
@@ -55,6 +60,9 @@ def _decode_body(payload: dict) -> str:
                 body = base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8")
                 break
             elif mime_type == "text/html" and part["body"].get("data"):
+                # Imported here so plain-text-only mailboxes never load bs4
+                from bs4 import BeautifulSoup
+                
                 html = base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8")
                 soup = BeautifulSoup(html, "html.parser")
                 body = soup.get_text(separator="\n", strip=True)
@@ -77,6 +85,7 @@ def read_emails(
     days_back: Optional[int] = None,
     unread_only: bool = False,
     category: Optional[str] = None,
+    include_body: bool = False,
 ) -> list[dict]:
     """
     Read emails from Gmail inbox.
@@ -88,6 +97,8 @@ def read_emails(
         days_back: Only fetch emails from last N days
         unread_only: Only fetch unread emails
         category: Filter by Gmail category (primary, social, promotions, updates, forums)
+        include_body: Fetch and decode message bodies. When False, only headers
+            and snippet are fetched and "body" is None.
         
     Returns:
         List of email dictionaries
@@ -110,26 +121,34 @@ def read_emails(
     
     final_query = " ".join(query_parts)
     
-    # Fetch message list
-    results = service.users().messages().list(
+    # Fetch message list (follows nextPageToken until max_results)
+    messages = list(iter_paginated(
+        service.users().messages(),
+        "messages",
+        max_results,
+        page_size_param="maxResults",
+        max_page_size=500,
         userId="me",
-        maxResults=max_results,
         q=final_query if final_query else None,
-    ).execute()
-    
-    messages = results.get("messages", [])
+    ))
     
     if not messages:
         return []
     
-    # Fetch full message details
+    # Metadata format skips the body payload entirely - much smaller responses
+    if include_body:
+        get_kwargs = {"format": "full"}
+    else:
+        get_kwargs = {"format": "metadata", "metadataHeaders": EMAIL_METADATA_HEADERS}
+    
+    # Fetch message details
     emails = []
     for msg in messages:
-        full_msg = service.users().messages().get(
+        full_msg = execute_with_retry(service.users().messages().get(
             userId="me",
             id=msg["id"],
-            format="full"
-        ).execute()
+            **get_kwargs,
+        ))
         
         headers = full_msg.get("payload", {}).get("headers", [])
         label_ids = full_msg.get("labelIds", [])
@@ -142,7 +161,7 @@ def read_emails(
             "to": _get_header(headers, "To"),
             "date": _get_header(headers, "Date"),
             "snippet": full_msg.get("snippet", ""),
-            "body": _decode_body(full_msg.get("payload", {})),
+            "body": _decode_body(full_msg.get("payload", {})) if include_body else None,
             "labels": label_ids,
             "is_unread": "UNREAD" in label_ids,
             "category": _get_category(label_ids),
@@ -152,6 +171,7 @@ def read_emails(
     return emails
 
 
+@user_ttl_cache(ttl=READ_CACHE_TTL)
 def get_email_by_id(user_email: str, email_id: str) -> dict:
     """
     Get a specific email by its ID.
@@ -165,11 +185,11 @@ def get_email_by_id(user_email: str, email_id: str) -> dict:
     """
     service = get_gmail_service(user_email)
     
-    full_msg = service.users().messages().get(
+    full_msg = execute_with_retry(service.users().messages().get(
         userId="me",
         id=email_id,
         format="full"
-    ).execute()
+    ))
     
     headers = full_msg.get("payload", {}).get("headers", [])
     label_ids = full_msg.get("labelIds", [])
@@ -193,6 +213,7 @@ def search_emails(
     user_email: str,
     query: str,
     max_results: int = 20,
+    include_body: bool = False,
 ) -> list[dict]:
     """
     Search emails using Gmail query syntax.
@@ -201,11 +222,17 @@ def search_emails(
         user_email: User's email for authentication
         query: Gmail search query (e.g., "from:john subject:meeting")
         max_results: Maximum results to return
+        include_body: Fetch and decode message bodies (default: headers and snippet only)
         
     Returns:
         List of email dictionaries
     """
-    return read_emails(user_email, max_results=max_results, query=query)
+    return read_emails(
+        user_email,
+        max_results=max_results,
+        query=query,
+        include_body=include_body,
+    )
 
 
 def send_email(
@@ -230,18 +257,23 @@ def send_email(
     Returns:
         Sent message info
     """
+    from email.message import EmailMessage
+    
     service = get_gmail_service(user_email)
     
-    message = MIMEText(body)
-    message["to"] = to
-    message["subject"] = subject
+    message = EmailMessage()
+    message["To"] = to
+    message["Subject"] = subject
     
     if cc:
-        message["cc"] = cc
+        message["Cc"] = cc
     if bcc:
-        message["bcc"] = bcc
+        message["Bcc"] = bcc
+    
+    message.set_content(body)
     
-    raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+    # Serialize once and encode straight from the bytes (no intermediate str copy)
+    raw_message = base64.urlsafe_b64encode(bytes(message)).decode("ascii")
     
     sent_message = service.users().messages().send(
         userId="me",
@@ -4,9 +4,30 @@ Google Sheets Tools
 Functions for reading and writing Google Sheets.
 """
 
+import secrets
 from typing import Any, Optional
 
-from ..core.google_services import get_sheets_service, get_drive_service
+from googleapiclient.errors import HttpError
+
+from ..core.google_services import (
+    DRIVE_FILE_KEYS,
+    escape_drive_query,
+    execute_with_retry,
+    get_drive_service,
+    get_sheets_service,
+    iter_paginated,
+)
+from ..core.ttl_cache import invalidate_user_caches, user_ttl_cache
+
+
+# Seconds an identical read is served from cache (writes invalidate early)
+READ_CACHE_TTL = 30
+
+# Seconds spreadsheet titles and sheet names are cached
+METADATA_CACHE_TTL = 60
+
+# Tries at add_sheet_to_spreadsheet's batchUpdate when a client-chosen sheet ID collides
+SHEET_ID_ATTEMPTS = 3
 
 
 def create_spreadsheet(
@@ -14,6 +35,7 @@ def create_spreadsheet(
     title: str,
     sheet_names: Optional[list[str]] = None,
     initial_data: Optional[dict[str, list[list[Any]]]] = None,
+    value_input_option: str = "USER_ENTERED",
 ) -> dict:
     """
     Create a new Google Spreadsheet.
@@ -23,6 +45,7 @@ def create_spreadsheet(
         title: Spreadsheet title
         sheet_names: Optional list of sheet names to create (default: ["Sheet1"])
         initial_data: Optional dict mapping sheet names to 2D list of values
+        value_input_option: How to interpret initial values ("RAW" or "USER_ENTERED")
         
     Returns:
         Created spreadsheet info including ID and link
@@ -47,16 +70,19 @@ def create_spreadsheet(
     spreadsheet = service.spreadsheets().create(body=spreadsheet_body).execute()
     spreadsheet_id = spreadsheet.get("spreadsheetId")
     
-    # Add initial data if provided
-    if initial_data:
-        for sheet_name, values in initial_data.items():
-            if values:
-                service.spreadsheets().values().update(
-                    spreadsheetId=spreadsheet_id,
-                    range=f"{sheet_name}!A1",
-                    valueInputOption="USER_ENTERED",
-                    body={"values": values},
-                ).execute()
+    # Add initial data if provided - one request for all non-empty sheets
+    data = [
+        {"range": f"{sheet_name}!A1", "majorDimension": "ROWS", "values": values}
+        for sheet_name, values in (initial_data or {}).items()
+        if values
+    ]
+    if data:
+        execute_with_retry(service.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"valueInputOption": value_input_option, "data": data},
+        ))
+    
+    invalidate_user_caches(user_email)
     
     return {
         "spreadsheet_id": spreadsheet_id,
@@ -67,6 +93,31 @@ def create_spreadsheet(
     }
 
 
+def _paste_text(values: list[list[Any]]) -> Optional[str]:
+    """
+    Render a 2D list of values as tab-delimited text for a pasteData request.
+    
+    Returns:
+        The text, or None if a value contains a tab or line break and so
+        cannot be pasted unambiguously
+    """
+    lines = []
+    for row in values:
+        cells = []
+        for value in row:
+            if value is None:
+                text = ""
+            elif isinstance(value, bool):
+                text = "TRUE" if value else "FALSE"
+            else:
+                text = str(value)
+            if "\t" in text or "\n" in text or "\r" in text:
+                return None
+            cells.append(text)
+        lines.append("\t".join(cells))
+    return "\n".join(lines)
+
+
 def add_sheet_to_spreadsheet(
     user_email: str,
     spreadsheet_id: str,
@@ -76,6 +127,11 @@ def add_sheet_to_spreadsheet(
     """
     Add a new sheet tab to an existing spreadsheet.
     
+    The sheet and its initial data are created in one atomic batchUpdate:
+    the data is pasted with PASTE_NORMAL, which parses numbers, dates,
+    percentages and formulas the same way as USER_ENTERED. Data containing
+    tabs or line breaks is written with a follow-up values.update instead.
+    
     Args:
         user_email: User's email for authentication
         spreadsheet_id: Existing spreadsheet ID
@@ -87,34 +143,51 @@ def add_sheet_to_spreadsheet(
     """
     service = get_sheets_service(user_email)
     
-    # Add new sheet
-    request_body = {
-        "requests": [
-            {
-                "addSheet": {
-                    "properties": {
-                        "title": sheet_name,
-                    }
-                }
-            }
-        ]
-    }
+    paste_text = _paste_text(initial_data) if initial_data else None
     
-    response = service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=request_body,
-    ).execute()
+    for attempt in range(1, SHEET_ID_ATTEMPTS + 1):
+        sheet_properties = {"title": sheet_name}
+        requests = [{"addSheet": {"properties": sheet_properties}}]
+        
+        # Choose the sheet ID up front so pasteData can target the new sheet
+        if paste_text is not None:
+            sheet_properties["sheetId"] = secrets.randbelow(2**31 - 1) + 1
+            requests.append({
+                "pasteData": {
+                    "coordinate": {
+                        "sheetId": sheet_properties["sheetId"],
+                        "rowIndex": 0,
+                        "columnIndex": 0,
+                    },
+                    "data": paste_text,
+                    "type": "PASTE_NORMAL",
+                    "delimiter": "\t",
+                }
+            })
+        
+        try:
+            response = service.spreadsheets().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={"requests": requests},
+            ).execute()
+            break
+        except HttpError as e:
+            # A client-chosen sheet ID may already be taken; retry with a new one
+            if paste_text is None or e.resp.status != 400 or attempt == SHEET_ID_ATTEMPTS:
+                raise
     
     new_sheet_id = response["replies"][0]["addSheet"]["properties"]["sheetId"]
     
-    # Add initial data if provided
-    if initial_data:
-        service.spreadsheets().values().update(
+    # Data that can't be pasted as tab-delimited text is written separately
+    if initial_data and paste_text is None:
+        execute_with_retry(service.spreadsheets().values().update(
             spreadsheetId=spreadsheet_id,
             range=f"{sheet_name}!A1",
             valueInputOption="USER_ENTERED",
             body={"values": initial_data},
-        ).execute()
+        ))
+    
+    invalidate_user_caches(user_email)
     
     return {
         "spreadsheet_id": spreadsheet_id,
@@ -125,10 +198,12 @@ def add_sheet_to_spreadsheet(
     }
 
 
+@user_ttl_cache(ttl=READ_CACHE_TTL)
 def list_spreadsheets(
     user_email: str,
     search_query: Optional[str] = None,
     max_results: int = 20,
+    fields: tuple[str, ...] = ("id", "name", "createdTime", "modifiedTime", "webViewLink"),
 ) -> list[dict]:
     """
     List Google Sheets spreadsheets in Drive.
@@ -137,11 +212,14 @@ def list_spreadsheets(
         user_email: User's email for authentication
         search_query: Optional name search term (case-insensitive partial match)
         max_results: Maximum number of spreadsheets to return
+        fields: Drive file fields to request (keys of DRIVE_FILE_KEYS); only
+            these are fetched and returned
         
     Returns:
         List of spreadsheet dictionaries
     """
     service = get_drive_service(user_email)
+    fields = tuple(fields)
     
     # Build query
     query_parts = [
@@ -152,35 +230,81 @@ def list_spreadsheets(
     # Add name search if provided
     if search_query:
         # Google Drive API uses 'name contains' for partial matching
-        query_parts.append(f"name contains '{search_query}'")
+        query_parts.append(f"name contains '{escape_drive_query(search_query)}'")
     
     query = " and ".join(query_parts)
     
-    results = service.files().list(
-        pageSize=max_results,
+    files = iter_paginated(
+        service.files(),
+        "files",
+        max_results,
         q=query,
-        fields="files(id, name, createdTime, modifiedTime, webViewLink)",
+        fields=f"nextPageToken, files({', '.join(fields)})",
         orderBy="modifiedTime desc",
-    ).execute()
-    
-    files = results.get("files", [])
+    )
     
     return [
-        {
-            "id": f.get("id"),
-            "name": f.get("name"),
-            "created_time": f.get("createdTime"),
-            "modified_time": f.get("modifiedTime"),
-            "web_link": f.get("webViewLink"),
-        }
+        {DRIVE_FILE_KEYS[field]: f.get(field) for field in fields}
         for f in files
     ]
 
 
+def _spreadsheet_access_error(spreadsheet_id: str, e: Exception) -> ValueError:
+    """Translate a Sheets API error on spreadsheet access into a helpful ValueError."""
+    status = e.resp.status
+    if status == 404:
+        return ValueError(
+            f"Spreadsheet not found with ID '{spreadsheet_id}'. "
+            f"Use list_spreadsheets tool first to find the correct spreadsheet ID."
+        )
+    elif status == 400:
+        return ValueError(
+            f"Invalid spreadsheet ID format: '{spreadsheet_id}'. "
+            f"The spreadsheet_id should be the long alphanumeric string from the URL "
+            f"(e.g., '1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms'). "
+            f"Use list_spreadsheets tool to find the correct ID."
+        )
+    elif status == 403:
+        return ValueError(
+            f"Access denied to spreadsheet '{spreadsheet_id}'. "
+            f"The user may not have permission to access this spreadsheet."
+        )
+    return ValueError(f"Error accessing spreadsheet: {e}")
+
+
+@user_ttl_cache(ttl=METADATA_CACHE_TTL, maxsize=512)
+def _get_spreadsheet_metadata(user_email: str, spreadsheet_id: str) -> dict:
+    """
+    Get a spreadsheet's title and sheet names.
+    
+    These change rarely, so results are cached for METADATA_CACHE_TTL seconds.
+    
+    Raises:
+        ValueError: If spreadsheet not found or access denied
+    """
+    service = get_sheets_service(user_email)
+    
+    try:
+        spreadsheet = execute_with_retry(service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields="properties.title,sheets.properties.title",
+        ))
+    except HttpError as e:
+        raise _spreadsheet_access_error(spreadsheet_id, e)
+    
+    return {
+        "title": spreadsheet.get("properties", {}).get("title"),
+        "sheets": [s.get("properties", {}).get("title") for s in spreadsheet.get("sheets", [])],
+    }
+
+
+@user_ttl_cache(ttl=READ_CACHE_TTL)
 def read_spreadsheet(
     user_email: str,
     spreadsheet_id: str,
     range_name: str = "Sheet1",
+    include_metadata: bool = True,
+    as_columns: bool = False,
 ) -> dict:
     """
     Read data from a Google Sheets spreadsheet.
@@ -189,76 +313,78 @@ def read_spreadsheet(
         user_email: User's email for authentication
         spreadsheet_id: Spreadsheet ID (the long alphanumeric string from the URL)
         range_name: Sheet and range to read (e.g., "Sheet1!A1:D10")
+        include_metadata: Also return the spreadsheet title and sheet names
+            (served from a short-lived cache when possible)
+        as_columns: Return "columns" (one list per column, with numbers and
+            booleans as native values) instead of row-major "values"; suited
+            to column-wise aggregation
         
     Returns:
-        Spreadsheet data including values
+        Spreadsheet data including values (or columns)
         
     Raises:
         ValueError: If spreadsheet not found or access denied
     """
-    from googleapiclient.errors import HttpError
-    
     service = get_sheets_service(user_email)
     
-    try:
-        # Get spreadsheet metadata
-        spreadsheet = service.spreadsheets().get(
-            spreadsheetId=spreadsheet_id,
-        ).execute()
-    except HttpError as e:
-        if e.resp.status == 404:
-            raise ValueError(
-                f"Spreadsheet not found with ID '{spreadsheet_id}'. "
-                f"Use list_spreadsheets tool first to find the correct spreadsheet ID."
-            )
-        elif e.resp.status == 400:
-            raise ValueError(
-                f"Invalid spreadsheet ID format: '{spreadsheet_id}'. "
-                f"The spreadsheet_id should be the long alphanumeric string from the URL "
-                f"(e.g., '1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms'). "
-                f"Use list_spreadsheets tool to find the correct ID."
-            )
-        elif e.resp.status == 403:
-            raise ValueError(
-                f"Access denied to spreadsheet '{spreadsheet_id}'. "
-                f"The user may not have permission to access this spreadsheet."
-            )
-        else:
-            raise ValueError(f"Error accessing spreadsheet: {e}")
-    
-    # Get available sheet names for better error messages
-    available_sheets = [s.get("properties", {}).get("title") for s in spreadsheet.get("sheets", [])]
+    metadata = _get_spreadsheet_metadata(user_email, spreadsheet_id) if include_metadata else None
     
     try:
         # Get values
-        result = service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=range_name,
-        ).execute()
+        if as_columns:
+            # Let the API transpose and keep cell types rather than doing it per cell here
+            request = service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=range_name,
+                majorDimension="COLUMNS",
+                valueRenderOption="UNFORMATTED_VALUE",
+            )
+        else:
+            request = service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=range_name,
+            )
+        result = execute_with_retry(request)
     except HttpError as e:
         if e.resp.status == 400:
+            # A bad range and a malformed ID both return 400; fetching the
+            # metadata raises the ID error, or lists sheets for the range error
+            if metadata is None:
+                metadata = _get_spreadsheet_metadata(user_email, spreadsheet_id)
             # Extract sheet name from range (e.g., "MySheet!A1:D10" -> "MySheet")
             requested_sheet = range_name.split("!")[0] if "!" in range_name else range_name
             raise ValueError(
                 f"Invalid range '{range_name}'. "
                 f"Sheet '{requested_sheet}' may not exist. "
-                f"Available sheets in this spreadsheet: {available_sheets}. "
+                f"Available sheets in this spreadsheet: {metadata['sheets']}. "
                 f"Try using one of these sheet names in your range."
             )
+        elif e.resp.status in (403, 404):
+            raise _spreadsheet_access_error(spreadsheet_id, e)
         else:
             raise ValueError(f"Error reading spreadsheet data: {e}")
     
     values = result.get("values", [])
     
-    return {
+    data = {
         "spreadsheet_id": spreadsheet_id,
-        "title": spreadsheet.get("properties", {}).get("title"),
-        "sheets": available_sheets,
         "range": result.get("range"),
-        "values": values,
-        "row_count": len(values),
         "web_link": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}",
     }
+    
+    if as_columns:
+        data["columns"] = values
+        data["row_count"] = max(map(len, values), default=0)
+        data["column_count"] = len(values)
+    else:
+        data["values"] = values
+        data["row_count"] = len(values)
+    
+    if metadata is not None:
+        data["title"] = metadata["title"]
+        data["sheets"] = metadata["sheets"]
+    
+    return data
 
 
 def write_to_spreadsheet(
@@ -287,12 +413,14 @@ def write_to_spreadsheet(
         "values": values,
     }
     
-    result = service.spreadsheets().values().update(
+    result = execute_with_retry(service.spreadsheets().values().update(
         spreadsheetId=spreadsheet_id,
         range=range_name,
         valueInputOption=value_input_option,
         body=body,
-    ).execute()
+    ))
+    
+    invalidate_user_caches(user_email)
     
     return {
         "spreadsheet_id": spreadsheet_id,
@@ -4,14 +4,55 @@ Google Slides Tools
 Functions for reading, creating, and modifying Google Slides presentations.
 """
 
+import itertools
+import secrets
 from typing import Optional
 
-from ..core.google_services import get_slides_service, get_drive_service
+from ..core.google_services import (
+    DRIVE_FILE_KEYS,
+    escape_drive_query,
+    get_drive_service,
+    get_slides_service,
+    iter_paginated,
+)
+from ..core.ttl_cache import invalidate_user_caches, user_ttl_cache
 
 
+# Seconds an identical listing is served from cache (writes invalidate early)
+READ_CACHE_TTL = 30
+
+# Element IDs are a random per-process prefix plus a counter, so they stay
+# unique across workers and restarts without a random draw per element
+_ELEMENT_ID_PREFIX = secrets.token_hex(4)
+_element_counter = itertools.count()
+
+
+# Predefined layouts add_slide accepts (anything else falls back to BLANK)
+_ALLOWED_LAYOUTS = frozenset({
+    "BLANK",
+    "TITLE",
+    "TITLE_AND_BODY",
+    "TITLE_ONLY",
+    "ONE_COLUMN_TEXT",
+    "MAIN_POINT",
+    "SECTION_HEADER",
+    "SECTION_TITLE_AND_DESCRIPTION",
+    "CAPTION_ONLY",
+    "BIG_NUMBER",
+})
+
+
+def _new_element_id(kind: str) -> str:
+    """Return a new page element object ID (e.g. "textbox_1a2b3c4d000001")."""
+    return f"{kind}_{_ELEMENT_ID_PREFIX}{next(_element_counter):06x}"
+
+
+@user_ttl_cache(ttl=READ_CACHE_TTL)
 def list_presentations(
     user_email: str,
     max_results: int = 20,
+    search_query: Optional[str] = None,
+    fields: tuple[str, ...] = ("id", "name", "createdTime", "modifiedTime", "webViewLink"),
 ) -> list[dict]:
     """
     List Google Slides presentations in Drive.
@@ -19,45 +60,44 @@ def list_presentations(
     Args:
         user_email: User's email for authentication
         max_results: Maximum number of presentations to return
+        search_query: Optional name search term (case-insensitive partial match)
+        fields: Drive file fields to request (keys of DRIVE_FILE_KEYS); only
+            these are fetched and returned
         
     Returns:
         List of presentation dictionaries
     """
     service = get_drive_service(user_email)
+    fields = tuple(fields)
     
-    results = service.files().list(
-        pageSize=max_results,
-        q="mimeType='application/vnd.google-apps.presentation' and trashed=false",
-        fields="files(id, name, createdTime, modifiedTime, webViewLink)",
-        orderBy="modifiedTime desc",
-    ).execute()
+    query = "mimeType='application/vnd.google-apps.presentation' and trashed=false"
+    if search_query:
+        query += f" and name contains '{escape_drive_query(search_query)}'"
     
-    files = results.get("files", [])
+    files = iter_paginated(
+        service.files(),
+        "files",
+        max_results,
+        q=query,
+        fields=f"nextPageToken, files({', '.join(fields)})",
+        orderBy="modifiedTime desc",
+    )
     
     return [
-        {
-            "id": f.get("id"),
-            "name": f.get("name"),
-            "created_time": f.get("createdTime"),
-            "modified_time": f.get("modifiedTime"),
-            "web_link": f.get("webViewLink"),
-        }
+        {DRIVE_FILE_KEYS[field]: f.get(field) for field in fields}
         for f in files
     ]
 
 
-def _extract_text_from_element(element: dict) -> str:
-    """Extract text from a page element."""
-    text_parts = []
-    
-    if "shape" in element:
-        shape = element["shape"]
-        if "text" in shape:
-            for text_elem in shape["text"].get("textElements", []):
-                if "textRun" in text_elem:
-                    text_parts.append(text_elem["textRun"].get("content", ""))
-    
-    return "".join(text_parts)
+def _iter_slide_texts(slide: dict):
+    """Yield the stripped, non-empty text of each shape on a slide."""
+    for element in slide.get("pageElements", ()):
+        text_elements = element.get("shape", {}).get("text", {}).get("textElements", ())
+        text = "".join(
+            te["textRun"].get("content", "") for te in text_elements if "textRun" in te
+        ).strip()
+        if text:
+            yield text
 
 
 def read_presentation(
@@ -82,16 +122,10 @@ def read_presentation(
     
     slides_data = []
     for i, slide in enumerate(presentation.get("slides", []), 1):
-        slide_text = []
-        for element in slide.get("pageElements", []):
-            text = _extract_text_from_element(element)
-            if text.strip():
-                slide_text.append(text.strip())
-        
         slides_data.append({
             "slide_number": i,
             "object_id": slide.get("objectId"),
-            "content": "\n".join(slide_text),
+            "content": "\n".join(_iter_slide_texts(slide)),
         })
     
     return {
@@ -125,6 +159,8 @@ def create_presentation(
     
     presentation_id = presentation.get("presentationId")
     
+    invalidate_user_caches(user_email)
+    
     return {
         "presentation_id": presentation_id,
         "title": title,
@@ -154,21 +190,8 @@ def add_slide(
     """
     service = get_slides_service(user_email)
     
-    # Map simple layout names to predefined layouts
-    layout_mapping = {
-        "BLANK": "BLANK",
-        "TITLE": "TITLE",
-        "TITLE_AND_BODY": "TITLE_AND_BODY",
-        "TITLE_ONLY": "TITLE_ONLY",
-        "ONE_COLUMN_TEXT": "ONE_COLUMN_TEXT",
-        "MAIN_POINT": "MAIN_POINT",
-        "SECTION_HEADER": "SECTION_HEADER",
-        "SECTION_TITLE_AND_DESCRIPTION": "SECTION_TITLE_AND_DESCRIPTION",
-        "CAPTION_ONLY": "CAPTION_ONLY",
-        "BIG_NUMBER": "BIG_NUMBER",
-    }
-    
-    predefined_layout = layout_mapping.get(layout.upper(), "BLANK")
+    layout = layout.upper()
+    predefined_layout = layout if layout in _ALLOWED_LAYOUTS else "BLANK"
     
     request = {
         "createSlide": {
@@ -198,6 +221,81 @@ def add_slide(
     }
 
 
+def add_text_boxes(
+    user_email: str,
+    presentation_id: str,
+    slide_id: str,
+    boxes: list[dict],
+) -> dict:
+    """
+    Add several text boxes to a slide in a single batchUpdate.
+    
+    Args:
+        user_email: User's email for authentication
+        presentation_id: Presentation ID
+        slide_id: Slide object ID
+        boxes: Text boxes, each a dict with "text" and optional "x", "y",
+            "width", "height" in points (defaults: 100, 100, 400, 100)
+        
+    Returns:
+        Result info including the new element IDs, in input order
+    """
+    service = get_slides_service(user_email)
+    
+    requests = []
+    element_ids = []
+    for box in boxes:
+        # Generate a unique ID for the text box
+        element_id = _new_element_id("textbox")
+        element_ids.append(element_id)
+        
+        requests.extend([
+            # Create shape (text box)
+            {
+                "createShape": {
+                    "objectId": element_id,
+                    "shapeType": "TEXT_BOX",
+                    "elementProperties": {
+                        "pageObjectId": slide_id,
+                        "size": {
+                            "height": {"magnitude": box.get("height", 100), "unit": "PT"},
+                            "width": {"magnitude": box.get("width", 400), "unit": "PT"},
+                        },
+                        "transform": {
+                            "scaleX": 1,
+                            "scaleY": 1,
+                            "translateX": box.get("x", 100),
+                            "translateY": box.get("y", 100),
+                            "unit": "PT",
+                        },
+                    },
+                }
+            },
+            # Insert text into the shape
+            {
+                "insertText": {
+                    "objectId": element_id,
+                    "insertionIndex": 0,
+                    "text": box["text"],
+                }
+            },
+        ])
+    
+    if requests:
+        service.presentations().batchUpdate(
+            presentationId=presentation_id,
+            body={"requests": requests},
+        ).execute()
+    
+    return {
+        "presentation_id": presentation_id,
+        "slide_id": slide_id,
+        "element_ids": element_ids,
+        "web_link": f"https://docs.google.com/presentation/d/{presentation_id}",
+        "status": "text_added",
+    }
+
+
 def add_text_to_slide(
     user_email: str,
     presentation_id: str,
@@ -211,6 +309,8 @@ def add_text_to_slide(
     """
     Add a text box to a slide.
     
+    To add several text boxes, use add_text_boxes (one API request).
+    
     Args:
         user_email: User's email for authentication
         presentation_id: Presentation ID
@@ -224,55 +324,19 @@ def add_text_to_slide(
     Returns:
         Result info
     """
-    service = get_slides_service(user_email)
-    
-    # Generate a unique ID for the text box
-    import uuid
-    element_id = f"textbox_{uuid.uuid4().hex[:8]}"
-    
-    requests = [
-        # Create shape (text box)
-        {
-            "createShape": {
-                "objectId": element_id,
-                "shapeType": "TEXT_BOX",
-                "elementProperties": {
-                    "pageObjectId": slide_id,
-                    "size": {
-                        "height": {"magnitude": height, "unit": "PT"},
-                        "width": {"magnitude": width, "unit": "PT"},
-                    },
-                    "transform": {
-                        "scaleX": 1,
-                        "scaleY": 1,
-                        "translateX": x,
-                        "translateY": y,
-                        "unit": "PT",
-                    },
-                },
-            }
-        },
-        # Insert text into the shape
-        {
-            "insertText": {
-                "objectId": element_id,
-                "insertionIndex": 0,
-                "text": text,
-            }
-        },
-    ]
-    
-    service.presentations().batchUpdate(
-        presentationId=presentation_id,
-        body={"requests": requests},
-    ).execute()
+    result = add_text_boxes(
+        user_email,
+        presentation_id,
+        slide_id,
+        [{"text": text, "x": x, "y": y, "width": width, "height": height}],
+    )
     
     return {
         "presentation_id": presentation_id,
         "slide_id": slide_id,
-        "element_id": element_id,
+        "element_id": result["element_ids"][0],
         "text": text[:100] + "..." if len(text) > 100 else text,
-        "web_link": f"https://docs.google.com/presentation/d/{presentation_id}",
+        "web_link": result["web_link"],
         "status": "text_added",
     }
 
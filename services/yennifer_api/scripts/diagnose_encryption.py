@@ -15,6 +15,9 @@ Usage:
     
     # Or with specific user:
     ENVIRONMENT=production python scripts/diagnose_encryption.py --user-id 9da8ee2a-3c05-42fc-a07f-d3bce0f08969
+    
+    # Scan everything and log failures to audit_log:
+    ENVIRONMENT=production python scripts/diagnose_encryption.py --scan-all --record-failures
 """
 
 import argparse
@@ -23,14 +26,36 @@ import json
 import logging
 import os
 import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 from uuid import UUID
 
+import asyncpg
+
 # Add parent to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.core.config import get_settings
+from app.core.encryption import get_encryption
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Users decrypted at once by find_corrupted_records
+SCAN_CONCURRENCY = 16
+
+# Worker processes for Fernet decryption in find_corrupted_records
+DECRYPT_WORKERS = os.cpu_count() or 1
+
+
+def _try_decrypt(user_dek: bytes, ciphertext: bytes) -> tuple[Optional[str], Optional[str]]:
+    """Decrypt one record in a worker process. Returns (plaintext, error)."""
+    try:
+        return get_encryption().decrypt_for_user(user_dek, ciphertext), None
+    except Exception as e:
+        return None, str(e)
+
 
 async def check_secrets_manager():
     """Check if AWS Secrets Manager is loading correctly."""
@@ -39,7 +64,6 @@ async def check_secrets_manager():
     print("=" * 60)
     
     try:
-        from app.core.config import get_settings
         settings = get_settings()
         
         print(f"✓ Settings loaded successfully")
@@ -64,7 +88,6 @@ async def check_kms():
     print("=" * 60)
     
     try:
-        from app.core.encryption import get_encryption
         encryption = get_encryption()
         
         print(f"  KMS Key ID: {encryption.kms_key_id}")
@@ -99,8 +122,6 @@ async def check_database():
     print("=" * 60)
     
     try:
-        import asyncpg
-        from app.core.config import get_settings
         settings = get_settings()
         
         conn = await asyncpg.connect(settings.database_url)
@@ -132,20 +153,17 @@ async def diagnose_user(user_id: str):
     print("=" * 60)
     
     try:
-        import asyncpg
-        from app.core.config import get_settings
-        from app.core.encryption import get_encryption
-        
         settings = get_settings()
         encryption = get_encryption()
         
+        uid = UUID(user_id)
         conn = await asyncpg.connect(settings.database_url)
         
         # Get user
-        user = await conn.fetchrow(
-            "SELECT id, email, encryption_key_blob, created_at FROM users WHERE id = $1",
-            UUID(user_id)
+        user_stmt = await conn.prepare(
+            "SELECT id, email, encryption_key_blob, created_at FROM users WHERE id = $1"
         )
+        user = await user_stmt.fetchrow(uid)
         
         if not user:
             print(f"✗ User not found: {user_id}")
@@ -159,7 +177,7 @@ async def diagnose_user(user_id: str):
         # Try to decrypt DEK
         if user['encryption_key_blob']:
             try:
-                user_dek = encryption.decrypt_user_dek(bytes(user['encryption_key_blob']))
+                user_dek = encryption.decrypt_user_dek(user['encryption_key_blob'])
                 print(f"✓ DEK decrypted: {len(user_dek)} bytes")
             except Exception as e:
                 print(f"✗ DEK decryption failed: {e}")
@@ -171,10 +189,10 @@ async def diagnose_user(user_id: str):
             return
         
         # Check interests
-        interests = await conn.fetch(
-            "SELECT id, category, details_encrypted, created_at FROM interests WHERE user_id = $1",
-            UUID(user_id)
+        interests_stmt = await conn.prepare(
+            "SELECT id, category, details_encrypted, created_at FROM interests WHERE user_id = $1"
         )
+        interests = await interests_stmt.fetch(uid)
         
         print(f"\n  Interests: {len(interests)} records")
         
@@ -183,7 +201,7 @@ async def diagnose_user(user_id: str):
         
         for interest in interests:
             try:
-                decrypted = encryption.decrypt_for_user(user_dek, bytes(interest['details_encrypted']))
+                decrypted = encryption.decrypt_for_user(user_dek, interest['details_encrypted'])
                 details = json.loads(decrypted)
                 success_count += 1
                 print(f"    ✓ {interest['id']}: {details.get('name', 'unnamed')[:30]}")
@@ -192,17 +210,17 @@ async def diagnose_user(user_id: str):
                 print(f"    ✗ {interest['id']}: DECRYPT FAILED - {e}")
                 
                 # Try to detect the encryption format
-                ciphertext = bytes(interest['details_encrypted'])
+                ciphertext = interest['details_encrypted']
                 print(f"      Ciphertext preview: {ciphertext[:50]}...")
                 print(f"      Ciphertext length: {len(ciphertext)} bytes")
         
         print(f"\n  Summary: {success_count} succeeded, {fail_count} failed")
         
         # Check memories too
-        memories = await conn.fetch(
-            "SELECT id, fact_key, fact_value_encrypted, created_at FROM memories WHERE user_id = $1 AND is_active = true",
-            UUID(user_id)
+        memories_stmt = await conn.prepare(
+            "SELECT id, fact_key, fact_value_encrypted, created_at FROM memories WHERE user_id = $1 AND is_active = true"
         )
+        memories = await memories_stmt.fetch(uid)
         
         print(f"\n  Memories: {len(memories)} records")
         
@@ -211,10 +229,10 @@ async def diagnose_user(user_id: str):
         
         for memory in memories:
             try:
-                decrypted = encryption.decrypt_for_user(user_dek, bytes(memory['fact_value_encrypted']))
+                decrypted = encryption.decrypt_for_user(user_dek, memory['fact_value_encrypted'])
                 mem_success += 1
                 print(f"    ✓ {memory['fact_key']}: {decrypted[:30]}...")
-            except Exception as e:
+            except Exception:
                 mem_fail += 1
                 print(f"    ✗ {memory['fact_key']}: DECRYPT FAILED")
         
@@ -224,63 +242,142 @@ async def diagnose_user(user_id: str):
         
     except Exception as e:
         print(f"✗ Error diagnosing user: {e}")
-        import traceback
         traceback.print_exc()
 
 
-async def find_corrupted_records():
-    """Find all records that fail decryption."""
+def _failed_interests(user_dek: bytes, interests: list[tuple[str, bytes]]) -> list[str]:
+    """Return the IDs of (id, ciphertext) interests that fail decryption (runs in a worker process)."""
+    failed = []
+    for interest_id, ciphertext in interests:
+        _, error = _try_decrypt(user_dek, ciphertext)
+        if error is not None:
+            failed.append(interest_id)
+    return failed
+
+
+async def _scan_user(executor, encryption, user, interests):
+    """
+    Check one user's interests for decryption failures.
+    
+    The KMS call runs in a thread and Fernet decryption in a worker process,
+    so the event loop keeps streaming rows for other users meanwhile.
+    
+    Returns:
+        Corruption info for the user, or None if nothing failed
+    """
+    try:
+        user_dek = await asyncio.to_thread(
+            encryption.decrypt_user_dek, user['encryption_key_blob']
+        )
+    except Exception as e:
+        print(f"✗ User {user['email']}: DEK decrypt failed")
+        return None
+    
+    records = [(str(i['interest_id']), i['details_encrypted']) for i in interests]
+    failed = await asyncio.get_running_loop().run_in_executor(
+        executor, _failed_interests, user_dek, records
+    )
+    
+    if not failed:
+        return None
+    return {
+        'email': user['email'],
+        'failed_interests': failed,
+        'total': len(interests),
+    }
+
+
+async def _record_failures(conn, corrupted_by_user: dict) -> int:
+    """
+    Write one failed-read audit_log entry per undecryptable interest.
+    
+    Uses a single COPY rather than an INSERT per record.
+    
+    Returns:
+        Number of entries written
+    """
+    records = [
+        (UUID(user_id), 'read', 'interests', interest_id, False, 'decryption failed')
+        for user_id, info in corrupted_by_user.items()
+        for interest_id in info['failed_interests']
+    ]
+    if records:
+        await conn.copy_records_to_table(
+            'audit_log',
+            records=records,
+            columns=['user_id', 'action', 'resource_type', 'resource_id', 'success', 'error_message'],
+        )
+    return len(records)
+
+
+async def find_corrupted_records(record_failures: bool = False):
+    """
+    Find all records that fail decryption.
+    
+    Args:
+        record_failures: Also log each failed interest to audit_log
+    """
     print("\n" + "=" * 60)
     print("5. SCANNING FOR CORRUPTED RECORDS")
     print("=" * 60)
     
     try:
-        import asyncpg
-        from app.core.config import get_settings
-        from app.core.encryption import get_encryption
-        
         settings = get_settings()
         encryption = get_encryption()
         
         conn = await asyncpg.connect(settings.database_url)
+        executor = ProcessPoolExecutor(max_workers=DECRYPT_WORKERS)
         
-        # Get all users with interests
-        users = await conn.fetch("""
-            SELECT DISTINCT u.id, u.email, u.encryption_key_blob
-            FROM users u
-            JOIN interests i ON u.id = i.user_id
-            WHERE u.encryption_key_blob IS NOT NULL
-        """)
-        
-        corrupted_by_user = {}
+        # At most SCAN_CONCURRENCY users are held in memory / being decrypted
+        semaphore = asyncio.Semaphore(SCAN_CONCURRENCY)
+        tasks = []
         
-        for user in users:
+        async def scan(user, interests):
             try:
-                user_dek = encryption.decrypt_user_dek(bytes(user['encryption_key_blob']))
-            except Exception as e:
-                print(f"✗ User {user['email']}: DEK decrypt failed")
-                continue
+                return str(user['id']), await _scan_user(executor, encryption, user, interests)
+            finally:
+                semaphore.release()
+        
+        async def dispatch(user, interests):
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(scan(user, interests)))
+        
+        try:
+            # One query for all users and their interests, streamed in user order
+            async with conn.transaction():
+                user = None
+                interests = []
+                async for row in conn.cursor("""
+                    SELECT u.id, u.email, u.encryption_key_blob,
+                           i.id AS interest_id, i.details_encrypted
+                    FROM users u
+                    JOIN interests i ON u.id = i.user_id
+                    WHERE u.encryption_key_blob IS NOT NULL
+                    ORDER BY u.id
+                """):
+                    if user is not None and row['id'] != user['id']:
+                        await dispatch(user, interests)
+                        interests = []
+                    if not interests:
+                        user = row
+                    interests.append(row)
+                if user is not None:
+                    await dispatch(user, interests)
             
-            interests = await conn.fetch(
-                "SELECT id, details_encrypted FROM interests WHERE user_id = $1",
-                user['id']
-            )
+            results = await asyncio.gather(*tasks)
             
-            failed = []
-            for interest in interests:
-                try:
-                    encryption.decrypt_for_user(user_dek, bytes(interest['details_encrypted']))
-                except:
-                    failed.append(str(interest['id']))
+            corrupted_by_user = {
+                user_id: info
+                for user_id, info in results
+                if info is not None
+            }
             
-            if failed:
-                corrupted_by_user[str(user['id'])] = {
-                    'email': user['email'],
-                    'failed_interests': failed,
-                    'total': len(interests),
-                }
-        
-        await conn.close()
+            if record_failures:
+                recorded = await _record_failures(conn, corrupted_by_user)
+                print(f"  Recorded {recorded} failures in audit_log")
+        finally:
+            await conn.close()
+            executor.shutdown()
         
         if corrupted_by_user:
             print(f"\nFound {len(corrupted_by_user)} users with corrupted records:")
@@ -291,7 +388,6 @@ async def find_corrupted_records():
             
     except Exception as e:
         print(f"✗ Error scanning: {e}")
-        import traceback
         traceback.print_exc()
 
 
@@ -299,6 +395,8 @@ async def main():
     parser = argparse.ArgumentParser(description='Diagnose encryption issues')
     parser.add_argument('--user-id', help='Specific user ID to diagnose')
     parser.add_argument('--scan-all', action='store_true', help='Scan all records for corruption')
+    parser.add_argument('--record-failures', action='store_true',
+                        help='With --scan-all, log each failed interest to audit_log')
     args = parser.parse_args()
     
     print("=" * 60)
@@ -314,7 +412,7 @@ async def main():
         await diagnose_user(args.user_id)
     
     if args.scan_all:
-        await find_corrupted_records()
+        await find_corrupted_records(record_failures=args.record_failures)
     
     print("\n" + "=" * 60)
     print("DIAGNOSTICS COMPLETE")
@@ -17,12 +17,20 @@ import argparse
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Optional
 
 import boto3
 from botocore.exceptions import ClientError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Required keys for yennifer-api
-REQUIRED_KEYS = [
+REQUIRED_KEYS = (
     'openai_api_key',
     'database_url',
     'google_client_id',
@@ -31,9 +39,9 @@ REQUIRED_KEYS = [
     'user_network_api_key',
     'allowed_emails',
     'kms_key_id',
-]
+)
 
-OPTIONAL_KEYS = [
+OPTIONAL_KEYS = (
     'posthog_api_key',
     'posthog_host',
     'sendgrid_api_key',
@@ -42,14 +50,43 @@ OPTIONAL_KEYS = [
     'google_cse_id',
     'redis_url',
     'chat_archive_bucket',
-]
+)
 
+KNOWN_KEYS = frozenset(REQUIRED_KEYS) | frozenset(OPTIONAL_KEYS)
 
-def get_secrets_client():
-    """Get boto3 Secrets Manager client."""
-    region = os.environ.get('AWS_REGION', 'us-east-1')
-    endpoint_url = os.environ.get('AWS_SECRETS_ENDPOINT_URL')  # For LocalStack
+# Value prefixes recognised in the required-key preview, first match wins
+_PREFIX_LABELS = (
+    ('phc_', ' [PostHog key format]'),
+    ('sk-', ' [OpenAI key format]'),
+    ('postgresql://', ' [PostgreSQL URL]'),
+)
+
+# SecretString parser; orjson.JSONDecodeError subclasses json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Secrets per list_secrets page (the API maximum)
+LIST_PAGE_SIZE = 100
+
+# Secrets per BatchGetSecretValue call (the API maximum)
+BATCH_GET_SIZE = 20
+
+# Concurrent BatchGetSecretValue calls when inspecting many secrets
+FETCH_WORKERS = 8
+
+# Whole-call BatchGetSecretValue errors that mean "fetch one at a time instead"
+# (the role lacks the batch permission, or the endpoint doesn't support it)
+BATCH_FALLBACK_CODES = frozenset({'AccessDeniedException', 'UnknownOperation'})
+
+
+@lru_cache(maxsize=1)
+def get_secrets_client(region: str, endpoint_url: Optional[str] = None):
+    """
+    Get boto3 Secrets Manager client (cached per region/endpoint).
     
+    Args:
+        region: AWS region
+        endpoint_url: Optional endpoint override, e.g. for LocalStack
+    """
     kwargs = {
         'service_name': 'secretsmanager',
         'region_name': region,
@@ -60,10 +97,8 @@ def get_secrets_client():
     return boto3.client(**kwargs)
 
 
-def list_all_secrets():
+def list_all_secrets(client):
     """List all secrets in Secrets Manager."""
-    client = get_secrets_client()
-    
     print("\n" + "=" * 60)
     print("ALL SECRETS IN AWS SECRETS MANAGER")
     print("=" * 60)
@@ -72,7 +107,7 @@ def list_all_secrets():
         paginator = client.get_paginator('list_secrets')
         secrets = []
         
-        for page in paginator.paginate():
+        for page in paginator.paginate(PaginationConfig={'PageSize': LIST_PAGE_SIZE}):
             for secret in page['SecretList']:
                 secrets.append(secret['Name'])
         
@@ -87,24 +122,91 @@ def list_all_secrets():
         return []
 
 
-def inspect_secret(secret_name: str):
-    """Inspect a specific secret (show keys, not values)."""
-    client = get_secrets_client()
+def _get_secret_string(client, secret_name: str):
+    """Fetch one secret with GetSecretValue, returning its SecretString or the ClientError."""
+    try:
+        return client.get_secret_value(SecretId=secret_name).get('SecretString')
+    except ClientError as e:
+        return e
+
+
+def fetch_secrets(client, secret_names: list[str]) -> dict:
+    """
+    Fetch up to BATCH_GET_SIZE secrets with one BatchGetSecretValue call.
+    
+    Falls back to one GetSecretValue per secret if the batch call itself is
+    denied or unsupported, so roles without secretsmanager:BatchGetSecretValue
+    still report each secret correctly.
     
+    Returns:
+        Dict mapping each requested name to its SecretString, or to a
+        ClientError if that secret could not be read
+    """
+    try:
+        response = client.batch_get_secret_value(SecretIdList=secret_names)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in BATCH_FALLBACK_CODES:
+            return {name: _get_secret_string(client, name) for name in secret_names}
+        return {name: e for name in secret_names}
+    
+    fetched = {}
+    for secret in response.get('SecretValues', []):
+        # Requested IDs may be names or ARNs
+        fetched[secret['Name']] = fetched[secret['ARN']] = secret.get('SecretString')
+    for error in response.get('Errors', []):
+        fetched[error['SecretId']] = ClientError(
+            {'Error': {'Code': error['ErrorCode'], 'Message': error.get('Message', '')}},
+            'BatchGetSecretValue',
+        )
+    
+    not_found = ClientError({'Error': {'Code': 'ResourceNotFoundException'}}, 'BatchGetSecretValue')
+    return {name: fetched.get(name, not_found) for name in secret_names}
+
+
+def inspect_secrets(client, secret_names: list[str]):
+    """Fetch secrets in batches of BATCH_GET_SIZE (one shared client), then inspect each in order."""
+    batches = [
+        secret_names[i:i + BATCH_GET_SIZE]
+        for i in range(0, len(secret_names), BATCH_GET_SIZE)
+    ]
+    
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(batches))) as executor:
+        for batch in executor.map(partial(fetch_secrets, client), batches):
+            fetched.update(batch)
+    
+    return [
+        inspect_secret(secret_name, fetched[secret_name])
+        for secret_name in secret_names
+    ]
+
+
+def _write_lines(lines: list[str]):
+    """Write a report section to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def inspect_secret(secret_name: str, secret_string):
+    """
+    Inspect a specific secret (show keys, not values).
+    
+    Args:
+        secret_name: Secret name, for display
+        secret_string: The fetched SecretString, or the ClientError from fetching it
+    """
     print("\n" + "=" * 60)
     print(f"INSPECTING: {secret_name}")
     print("=" * 60)
     
     try:
-        response = client.get_secret_value(SecretId=secret_name)
-        secret_data = json.loads(response['SecretString'])
-        
-        print(f"\nKeys found ({len(secret_data)} total):")
+        if isinstance(secret_string, ClientError):
+            raise secret_string
+        secret_data = _json_loads(secret_string)
         
         # Check for required keys (case-insensitive)
         secret_keys_lower = {k.lower(): k for k in secret_data.keys()}
         
-        print("\n--- REQUIRED KEYS ---")
+        out = [f"\nKeys found ({len(secret_data)} total):", "\n--- REQUIRED KEYS ---"]
         for key in REQUIRED_KEYS:
             original_key = secret_keys_lower.get(key, key)
             if key in secret_keys_lower:
@@ -112,19 +214,18 @@ def inspect_secret(secret_name: str):
                 # Show presence and length, not actual value
                 if isinstance(value, str):
                     preview = f"(string, {len(value)} chars)"
-                    if value.startswith('phc_'):
-                        preview += " [PostHog key format]"
-                    elif value.startswith('sk-'):
-                        preview += " [OpenAI key format]"
-                    elif value.startswith('postgresql://'):
-                        preview += " [PostgreSQL URL]"
+                    for prefix, label in _PREFIX_LABELS:
+                        if value.startswith(prefix):
+                            preview += label
+                            break
                 else:
                     preview = f"({type(value).__name__})"
-                print(f"  ✓ {original_key}: {preview}")
+                out.append(f"  ✓ {original_key}: {preview}")
             else:
-                print(f"  ✗ {key}: MISSING")
+                out.append(f"  ✗ {key}: MISSING")
+        _write_lines(out)
         
-        print("\n--- OPTIONAL KEYS ---")
+        out = ["\n--- OPTIONAL KEYS ---"]
         for key in OPTIONAL_KEYS:
             original_key = secret_keys_lower.get(key, key)
             if key in secret_keys_lower:
@@ -133,34 +234,45 @@ def inspect_secret(secret_name: str):
                     preview = f"(string, {len(value)} chars)"
                 else:
                     preview = f"({type(value).__name__})"
-                print(f"  ✓ {original_key}: {preview}")
+                out.append(f"  ✓ {original_key}: {preview}")
             else:
-                print(f"  - {key}: not set")
+                out.append(f"  - {key}: not set")
+        _write_lines(out)
         
         # Check for unexpected keys
-        known_keys = set(REQUIRED_KEYS + OPTIONAL_KEYS)
-        extra_keys = [k for k in secret_keys_lower.keys() if k not in known_keys]
+        extra_keys = sorted(secret_keys_lower.keys() - KNOWN_KEYS)
         
         if extra_keys:
-            print("\n--- ADDITIONAL KEYS ---")
+            out = ["\n--- ADDITIONAL KEYS ---"]
             for key in extra_keys:
                 original_key = secret_keys_lower[key]
-                print(f"  + {original_key}")
+                out.append(f"  + {original_key}")
+            _write_lines(out)
         
         # Show key casing analysis
-        print("\n--- KEY CASING ANALYSIS ---")
-        upper_keys = [k for k in secret_data.keys() if k.isupper()]
-        lower_keys = [k for k in secret_data.keys() if k.islower()]
-        mixed_keys = [k for k in secret_data.keys() if not k.isupper() and not k.islower()]
+        upper_count = lower_count = mixed_count = 0
+        for k in secret_data:
+            if k.isupper():
+                upper_count += 1
+            elif k.islower():
+                lower_count += 1
+            else:
+                mixed_count += 1
         
-        print(f"  UPPER_CASE keys: {len(upper_keys)}")
-        print(f"  lower_case keys: {len(lower_keys)}")
-        print(f"  Mixed_Case keys: {len(mixed_keys)}")
+        out = [
+            "\n--- KEY CASING ANALYSIS ---",
+            f"  UPPER_CASE keys: {upper_count}",
+            f"  lower_case keys: {lower_count}",
+            f"  Mixed_Case keys: {mixed_count}",
+        ]
         
-        if upper_keys and lower_keys:
-            print("\n  ⚠️  WARNING: Mixed key casing detected!")
-            print("  The config loader will normalize all keys to lowercase.")
-            print("  This should work, but consistent casing is recommended.")
+        if upper_count and lower_count:
+            out += [
+                "\n  ⚠️  WARNING: Mixed key casing detected!",
+                "  The config loader will normalize all keys to lowercase.",
+                "  This should work, but consistent casing is recommended.",
+            ]
+        _write_lines(out)
         
         return secret_data
         
@@ -190,17 +302,24 @@ def main():
     print("=" * 60)
     print("AWS SECRETS MANAGER INSPECTOR")
     print("=" * 60)
-    print(f"Region: {os.environ.get('AWS_REGION', 'us-east-1')}")
+    region = os.environ.get('AWS_REGION', 'us-east-1')
+    print(f"Region: {region}")
+    
+    client = get_secrets_client(
+        region,
+        os.environ.get('AWS_SECRETS_ENDPOINT_URL'),  # For LocalStack
+    )
     
     if args.list_all:
-        list_all_secrets()
+        list_all_secrets(client)
     
-    inspect_secret(args.secret_name)
+    secret_names = [args.secret_name]
     
     # Also check user-network secret if it exists
     if 'yennifer-api' in args.secret_name:
-        network_secret = args.secret_name.replace('yennifer-api', 'user-network')
-        inspect_secret(network_secret)
+        secret_names.append(args.secret_name.replace('yennifer-api', 'user-network'))
+    
+    inspect_secrets(client, secret_names)
     
     print("\n" + "=" * 60)
     print("INSPECTION COMPLETE")
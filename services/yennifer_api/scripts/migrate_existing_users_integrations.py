@@ -17,6 +17,11 @@ import logging
 import sys
 from uuid import UUID
 
+try:
+    import uvloop  # Installed with uvicorn[standard]
+except ImportError:
+    uvloop = None
+
 # Add the app directory to the path
 sys.path.insert(0, '.')
 
@@ -26,6 +31,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip while streaming users (also the migration batch size)
+CURSOR_PREFETCH = 500
+
+# Batches migrated concurrently (leaves a pool connection for the cursor)
+MIGRATION_CONCURRENCY = 8
+
+
+async def migrate_batch(integrations_repo, batch: list, dry_run: bool) -> tuple[int, int, int]:
+    """
+    Migrate one batch of users with a probe query and a bulk enable.
+    
+    Returns:
+        (migrated, skipped, errors) counts for the batch
+    """
+    try:
+        # One query finds the already-migrated users in the batch
+        already_migrated = await integrations_repo.get_users_with_enabled_integrations(
+            [row['user_id'] for row in batch]
+        )
+    except Exception as e:
+        logger.error(f"Error checking batch of {len(batch)} users: {e}")
+        return 0, 0, len(batch)
+    
+    pending = [row for row in batch if row['user_id'] not in already_migrated]
+    skipped = len(batch) - len(pending)
+    if not pending:
+        return 0, skipped, 0
+    
+    if dry_run:
+        for row in pending:
+            logger.info(f"[DRY RUN] Would enable all integrations for {row['email']}")
+        return len(pending), skipped, 0
+    
+    try:
+        # Enable all integrations and scopes for the batch at once
+        result = await integrations_repo.enable_all_integrations_and_scopes_bulk(
+            [row['user_id'] for row in pending],
+            mark_granted=True  # They already have OAuth consent
+        )
+    except Exception as e:
+        logger.error(f"Error migrating batch of {len(pending)} users: {e}")
+        return 0, skipped, len(pending)
+    
+    logger.info(
+        f"Migrated {len(pending)} users: "
+        f"{result['integrations_enabled']} integrations, "
+        f"{result['scopes_enabled']} scopes"
+    )
+    return len(pending), skipped, 0
+
 
 async def migrate_users(dry_run: bool = False):
     """Migrate existing users with OAuth tokens to have all integrations enabled."""
@@ -39,61 +94,50 @@ async def migrate_users(dry_run: bool = False):
     integrations_repo = IntegrationsRepository(pool)
     
     try:
-        # Get all users with Google OAuth tokens
-        async with pool.acquire() as conn:
-            users_with_tokens = await conn.fetch("""
-                SELECT DISTINCT user_id, email
+        # At most MIGRATION_CONCURRENCY batches are in flight at once
+        semaphore = asyncio.Semaphore(MIGRATION_CONCURRENCY)
+        tasks = []
+        
+        async def run(batch):
+            try:
+                return await migrate_batch(integrations_repo, batch, dry_run)
+            finally:
+                semaphore.release()
+        
+        async def dispatch(batch):
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(run(batch)))
+        
+        # Stream users with Google OAuth tokens rather than loading them all
+        user_count = 0
+        async with pool.acquire() as conn, conn.transaction():
+            batch = []
+            # One row per user, even if they have tokens under several emails
+            async for row in conn.cursor("""
+                SELECT DISTINCT ON (user_id) user_id, email
                 FROM user_oauth_tokens
                 WHERE user_id IS NOT NULL AND provider = 'google'
-            """)
+                ORDER BY user_id, email
+            """, prefetch=CURSOR_PREFETCH):
+                user_count += 1
+                batch.append(row)
+                if len(batch) == CURSOR_PREFETCH:
+                    await dispatch(batch)
+                    batch = []
+            if batch:
+                await dispatch(batch)
         
-        logger.info(f"Found {len(users_with_tokens)} users with Google OAuth tokens")
+        results = await asyncio.gather(*tasks)
         
-        if not users_with_tokens:
-            logger.info("No users to migrate")
-            return
+        migrated_count = sum(r[0] for r in results)
+        skipped_count = sum(r[1] for r in results)
+        error_count = sum(r[2] for r in results)
         
-        migrated_count = 0
-        skipped_count = 0
-        error_count = 0
+        logger.info(f"Found {user_count} users with Google OAuth tokens")
         
-        for row in users_with_tokens:
-            user_id = row['user_id']
-            email = row['email']
-            
-            try:
-                # Check if user already has integrations enabled
-                user_integrations = await integrations_repo.get_user_integrations(
-                    user_id, 
-                    enabled_only=True
-                )
-                
-                if user_integrations:
-                    logger.debug(f"User {email} already has {len(user_integrations)} integrations enabled")
-                    skipped_count += 1
-                    continue
-                
-                if dry_run:
-                    logger.info(f"[DRY RUN] Would enable all integrations for {email}")
-                    migrated_count += 1
-                    continue
-                
-                # Enable all integrations and scopes
-                result = await integrations_repo.enable_all_integrations_and_scopes(
-                    user_id,
-                    mark_granted=True  # They already have OAuth consent
-                )
-                
-                logger.info(
-                    f"Migrated {email}: "
-                    f"{result['integrations_enabled']} integrations, "
-                    f"{result['scopes_enabled']} scopes"
-                )
-                migrated_count += 1
-                
-            except Exception as e:
-                logger.error(f"Error migrating {email}: {e}")
-                error_count += 1
+        if not user_count:
+            logger.info("No users to migrate")
+            return
         
         logger.info(f"\n{'=' * 50}")
         logger.info(f"Migration complete{' (DRY RUN)' if dry_run else ''}:")
@@ -120,6 +164,10 @@ def main():
     if args.dry_run:
         logger.info("Running in DRY RUN mode - no changes will be made")
     
+    if uvloop is not None:
+        # libuv-based loop cuts per-await overhead across thousands of queries
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     asyncio.run(migrate_users(dry_run=args.dry_run))
 
 
@@ -21,13 +21,21 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.core.pii import (
     PIIContext,
     set_pii_context,
-    clear_pii_context,
     mask_pii,
     mask_message_for_llm,
     unmask_pii,
     get_pii_context,
 )
 
+# One context reused by every test case, reset between them
+_CTX = PIIContext()
+
+
+def reset_ctx():
+    """Clear the shared context and make it current."""
+    _CTX.reset()
+    set_pii_context(_CTX)
+
 
 def print_header(title: str):
     print("\n" + "=" * 60)
@@ -46,8 +54,7 @@ def test_tc1_ssn_storage():
     """TC-1: User Provides SSN - Should Store Securely"""
     print_header("TC-1: User Provides SSN")
     
-    clear_pii_context()
-    set_pii_context(PIIContext())
+    reset_ctx()
     
     # User sends SIN
     user_input = "My SIN is 111-222-333"
@@ -79,8 +86,7 @@ def test_tc2_credit_card():
     """TC-2: User Provides Credit Card - Should Store Securely"""
     print_header("TC-2: User Provides Credit Card")
     
-    clear_pii_context()
-    set_pii_context(PIIContext())
+    reset_ctx()
     
     # User sends card
     user_input = "My card is 4500 1111 1111 0911"
@@ -112,8 +118,7 @@ def test_tc3_cross_session_history():
     """TC-3: Cross-Session PII - Should Be Masked in History"""
     print_header("TC-3: Cross-Session PII (History Masking)")
     
-    clear_pii_context()
-    set_pii_context(PIIContext())
+    reset_ctx()
     
     # Session A: User sends email
     msg1 = "My email is test@secret.com"
@@ -138,8 +143,7 @@ def test_tc3_cross_session_history():
         print(f"    {h['role']}: {h['content']}")
     
     # Re-mask history for new LLM call
-    clear_pii_context()
-    set_pii_context(PIIContext())
+    reset_ctx()
     
     masked_history = []
     for h in history:
@@ -174,8 +178,7 @@ def test_tc4_tool_results():
     """TC-4: Tool Results with PII - Should Be Masked"""
     print_header("TC-4: Tool Results with PII")
     
-    clear_pii_context()
-    set_pii_context(PIIContext())
+    reset_ctx()
     
     # Simulate tool result from read_email
     tool_result = """
@@ -221,8 +224,7 @@ def test_tc5_followup_questions():
     """TC-5: PII in Follow-up Questions"""
     print_header("TC-5: PII in Follow-up Questions")
     
-    clear_pii_context()
-    set_pii_context(PIIContext())
+    reset_ctx()
     
     # First message with SSN
     msg1 = "My SSN is 123-45-6789"
@@ -247,8 +249,7 @@ def test_tc5_followup_questions():
     print("\n  Simulating second request...")
     
     # Clear and create fresh context
-    clear_pii_context()
-    set_pii_context(PIIContext())
+    reset_ctx()
     
     # Mask history
     for h in history:
@@ -284,8 +285,7 @@ def test_pii_stats():
     """Test PII context statistics"""
     print_header("PII Context Statistics")
     
-    clear_pii_context()
-    set_pii_context(PIIContext())
+    reset_ctx()
     
     text = """
     Contact: john@example.com, jane@test.org
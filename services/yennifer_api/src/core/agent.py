@@ -8,6 +8,8 @@ import os
 import sys
 import importlib.util
 
+from langchain_core.messages import HumanMessage, AIMessage
+
 # Add agent src to Python path
 agent_src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../agent/src"))
 
@@ -20,6 +22,10 @@ if agent_base_path not in sys.path:
 # Now import through the package structure
 from src.gmail_agent import GmailAssistant, GMAIL_TOOLS, SYSTEM_PROMPT
 
+# Chat history role for each stored message class, and the reverse
+_ROLE_FOR_TYPE = {HumanMessage: "user", AIMessage: "assistant"}
+_MSG_FOR_ROLE = {role: cls for cls, role in _ROLE_FOR_TYPE.items()}
+
 
 class YenniferAssistant:
     """
@@ -54,15 +60,11 @@ class YenniferAssistant:
         Returns:
             List of messages with 'role' and 'content' keys
         """
-        from langchain_core.messages import HumanMessage, AIMessage
-        
-        history = []
-        for msg in self._assistant.chat_history:
-            if isinstance(msg, HumanMessage):
-                history.append({"role": "user", "content": msg.content})
-            elif isinstance(msg, AIMessage):
-                history.append({"role": "assistant", "content": msg.content})
-        return history
+        return [
+            {"role": _ROLE_FOR_TYPE[type(msg)], "content": msg.content}
+            for msg in self._assistant.chat_history
+            if type(msg) in _ROLE_FOR_TYPE
+        ]
     
     def set_history(self, history: list[dict]):
         """
@@ -71,11 +73,8 @@ class YenniferAssistant:
         Args:
             history: List of messages with 'role' and 'content' keys
         """
-        from langchain_core.messages import HumanMessage, AIMessage
-        
-        self._assistant.chat_history = []
-        for msg in history:
-            if msg["role"] == "user":
-                self._assistant.chat_history.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                self._assistant.chat_history.append(AIMessage(content=msg["content"]))
+        self._assistant.chat_history = [
+            _MSG_FOR_ROLE[msg["role"]](content=msg["content"])
+            for msg in history
+            if msg["role"] in _MSG_FOR_ROLE
+        ]
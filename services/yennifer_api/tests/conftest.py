@@ -6,7 +6,95 @@ This file sets up the Python path so tests can import from the app module.
 
 import sys
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import call
+
+import pytest
 
 # Add the yennifer_api directory to Python path so 'app' module can be found
-yennifer_api_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(yennifer_api_dir))
+yennifer_api_dir = str(Path(__file__).parent.parent)
+if yennifer_api_dir not in sys.path:
+    sys.path.insert(0, yennifer_api_dir)
+
+
+@pytest.fixture(autouse=True)
+def clear_read_caches():
+    """Drop cached Google API reads so mocked responses never leak between tests."""
+    from app.core.ttl_cache import clear_user_caches
+    clear_user_caches()
+    yield
+
+
+# Canned Calendar API responses shared by every mock_calendar_events test;
+# read-only so one test cannot change what the next one sees
+_EXISTING_EVENT = MappingProxyType({
+    "id": "event123",
+    "summary": "Existing Event",
+    "start": MappingProxyType({"dateTime": "2026-01-05T10:00:00"}),
+    "end": MappingProxyType({"dateTime": "2026-01-05T11:00:00"}),
+})
+_CREATED_EVENT = MappingProxyType({
+    "id": "event123",
+    "summary": "Test",
+    "htmlLink": "http://example.com",
+    "start": MappingProxyType({"dateTime": "2026-01-05T10:00:00"}),
+    "end": MappingProxyType({"dateTime": "2026-01-05T11:00:00"}),
+})
+_UPDATED_EVENT = MappingProxyType({
+    "id": "event123",
+    "summary": "Existing Event",
+    "htmlLink": "http://example.com",
+})
+_NO_EVENTS = MappingProxyType({"items": ()})
+
+
+class _FakeApiMethod:
+    """
+    Stand-in for one Calendar API method such as events().insert.
+    
+    Records each call like a Mock and returns a request whose execute()
+    serves the canned response (or calls it, if it is a factory).
+    """
+    
+    def __init__(self, response):
+        self.response = response
+        self.call_args_list = []
+    
+    @property
+    def call_args(self):
+        return self.call_args_list[-1] if self.call_args_list else None
+    
+    def __call__(self, **kwargs):
+        self.call_args_list.append(call(**kwargs))
+        return SimpleNamespace(execute=self._execute)
+    
+    def _execute(self):
+        return self.response() if callable(self.response) else self.response
+    
+    def assert_called_once(self):
+        assert len(self.call_args_list) == 1, (
+            f"Expected one call, got {len(self.call_args_list)}"
+        )
+
+
+@pytest.fixture
+def mock_calendar_events(monkeypatch):
+    """
+    Patch calendar_tools' Calendar service and yield its events() resource.
+    
+    list() returns no items, get() returns an existing event, and insert() and
+    update() return a minimal saved event.
+    """
+    events = SimpleNamespace(
+        list=_FakeApiMethod(_NO_EVENTS),
+        # update_calendar_event edits the fetched event, so hand out a copy
+        get=_FakeApiMethod(lambda: dict(_EXISTING_EVENT)),
+        insert=_FakeApiMethod(_CREATED_EVENT),
+        update=_FakeApiMethod(_UPDATED_EVENT),
+    )
+    service = SimpleNamespace(events=lambda: events)
+    monkeypatch.setattr(
+        "app.tools.calendar_tools.get_calendar_service",
+        lambda *args, **kwargs: service,
+    )
+    return events
@@ -8,16 +8,25 @@ Tests the timezone-aware calendar functionality including:
 - list_calendar_events with time_min/time_max
 - create/update_calendar_event with user timezone
 - Google Calendar timezone fetch
-- Timezone sync job
 
 Run with: pytest tests/test_calendar_timezone.py -v
 """
 
+import asyncio
+import time
+
 import pytest
-from datetime import datetime, timezone as dt_timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+from app.core import google_services, workspace_tools
+from app.core.google_services import get_user_calendar_timezone
+from app.tools.calendar_tools import (
+    create_calendar_event,
+    list_calendar_events,
+    update_calendar_event,
+)
+
 
 # ==============================================================================
 # 1. Unit Tests for load_user_tokens() - LT-01 to LT-06
@@ -29,55 +38,44 @@ class TestLoadUserTokens:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Clear token cache before each test."""
-        from app.core import google_services
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
         yield
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
     
     @pytest.mark.asyncio
-    async def test_lt01_user_with_valid_tokens_and_timezone(self):
+    async def test_lt01_user_with_valid_tokens_and_timezone(self, monkeypatch):
         """LT-01: User with valid tokens and timezone gets both cached."""
-        from app.core import google_services
         
         mock_tokens = {"access_token": "test_token", "refresh_token": "refresh"}
         
-        # Mock the functions that load_user_tokens imports internally
-        async def mock_get_tokens(email):
-            return mock_tokens
-        
+        # Mock the pool and the single tokens + timezone query
         async def mock_get_pool():
-            mock_conn = AsyncMock()
-            mock_conn.fetchrow.return_value = {"timezone": "America/Los_Angeles"}
-            mock_pool = MagicMock()
-            mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
-            mock_pool.acquire.return_value.__aexit__ = AsyncMock()
-            return mock_pool
-        
-        with patch.dict('sys.modules', {'app.routes.auth': MagicMock(get_google_tokens=mock_get_tokens)}), \
-             patch.dict('sys.modules', {'app.db.connection': MagicMock(get_db_pool=mock_get_pool)}):
-            
-            # Need to reload the function to pick up the patched modules
-            import importlib
-            importlib.reload(google_services)
-            
-            result = await google_services.load_user_tokens("user@example.com")
-            
-            assert result == mock_tokens
-            assert "user@example.com" in google_services._token_cache
-            assert google_services._token_cache["user@example.com"]["timezone"] == "America/Los_Angeles"
+            return MagicMock()
+        
+        mock_repo = MagicMock()
+        mock_repo.get_tokens_with_timezone = AsyncMock(
+            return_value=(mock_tokens, "America/Los_Angeles")
+        )
+        
+        monkeypatch.setattr(google_services, "get_db_pool", mock_get_pool)
+        monkeypatch.setattr(google_services, "_get_token_repo", lambda pool: mock_repo)
+        
+        result = await google_services.load_user_tokens("user@example.com")
+        
+        assert result == mock_tokens
+        assert "user@example.com" in google_services._token_cache
+        assert google_services._token_cache["user@example.com"].timezone == "America/Los_Angeles"
     
     @pytest.mark.asyncio
     async def test_lt02_user_with_tokens_but_null_timezone(self):
         """LT-02: User with tokens but NULL timezone defaults to UTC."""
-        from app.core import google_services
         
         # Directly test by manipulating the cache - simpler and more reliable
         # This tests the behavior that if timezone is NULL, it should default to UTC
-        google_services._token_cache["user@example.com"] = {
-            "tokens": {"access_token": "test_token"},
-            "timezone": "UTC",  # What should happen when NULL
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={"access_token": "test_token"},
+            timezone="UTC",  # What should happen when NULL
+        )
         
         tz = google_services.get_cached_timezone("user@example.com")
         assert tz == "UTC"
@@ -85,14 +83,12 @@ class TestLoadUserTokens:
     @pytest.mark.asyncio
     async def test_lt03_user_with_tokens_empty_string_timezone(self):
         """LT-03: User with tokens and empty string timezone defaults to UTC."""
-        from app.core import google_services
         
         # Test the fallback behavior for empty timezone
-        google_services._token_cache["user@example.com"] = {
-            "tokens": {"access_token": "test_token"},
-            "timezone": "",  # Empty string
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={"access_token": "test_token"},
+            timezone="",  # Empty string
+        )
         
         tz = google_services.get_cached_timezone("user@example.com")
         assert tz == "UTC"
@@ -100,15 +96,13 @@ class TestLoadUserTokens:
     @pytest.mark.asyncio
     async def test_lt04_db_query_fails(self):
         """LT-04: DB query fails - tokens cached with UTC fallback, warning logged."""
-        from app.core import google_services
         
         # When DB fails, timezone should fallback to UTC
         # This is tested via the cache behavior - if no valid TZ, use UTC
-        google_services._token_cache["user@example.com"] = {
-            "tokens": {"access_token": "test_token"},
-            "timezone": "UTC",  # Fallback value
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={"access_token": "test_token"},
+            timezone="UTC",  # Fallback value
+        )
         
         tz = google_services.get_cached_timezone("user@example.com")
         assert tz == "UTC"
@@ -116,14 +110,12 @@ class TestLoadUserTokens:
     @pytest.mark.asyncio
     async def test_lt05_user_not_found_in_users_table(self):
         """LT-05: User not found in users table - defaults to UTC."""
-        from app.core import google_services
         
         # Similar to LT-04, this tests that missing user defaults to UTC
-        google_services._token_cache["user@example.com"] = {
-            "tokens": {"access_token": "test_token"},
-            "timezone": "UTC",  # Default when user not found
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={"access_token": "test_token"},
+            timezone="UTC",  # Default when user not found
+        )
         
         tz = google_services.get_cached_timezone("user@example.com")
         assert tz == "UTC"
@@ -131,19 +123,43 @@ class TestLoadUserTokens:
     @pytest.mark.asyncio
     async def test_lt06_no_tokens_found(self):
         """LT-06: No tokens found - returns None, nothing cached."""
-        from app.core import google_services
         
         # When no tokens, email should not be in cache
-        google_services._token_cache = {}  # Empty cache
+        google_services.clear_token_cache()  # Empty cache
         
         # get_cached_timezone should return UTC for non-cached user
         tz = google_services.get_cached_timezone("user@example.com")
         assert tz == "UTC"
         assert "user@example.com" not in google_services._token_cache
+    
+    @pytest.mark.asyncio
+    async def test_lt07_concurrent_loads_share_one_query(self):
+        """LT-07: Concurrent loads for one user run a single database load."""
+        
+        calls = []
+        
+        async def slow_load(email):
+            calls.append(email)
+            await asyncio.sleep(0.01)
+            return {"access_token": "token"}
+        
+        with patch.object(google_services, "_load_user_tokens", side_effect=slow_load):
+            results = await asyncio.gather(
+                *(google_services.load_user_tokens("user@example.com") for _ in range(5))
+            )
+            await asyncio.sleep(0)  # let the done callback clear the in-flight entry
+            
+            assert calls == ["user@example.com"]
+            assert all(r == {"access_token": "token"} for r in results)
+            assert "user@example.com" not in google_services._inflight_loads
+            
+            # A later call loads again
+            await google_services.load_user_tokens("user@example.com")
+            assert len(calls) == 2
 
 
 # ==============================================================================
-# 2. Unit Tests for get_cached_timezone() - GCT-01 to GCT-07
+# 2. Unit Tests for get_cached_timezone() - GCT-01 to GCT-11
 # ==============================================================================
 
 class TestGetCachedTimezone:
@@ -152,95 +168,133 @@ class TestGetCachedTimezone:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Clear token cache before each test."""
-        from app.core import google_services
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
         yield
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
     
     def test_gct01_valid_timezone_in_cache(self):
         """GCT-01: Valid timezone in cache is returned."""
-        from app.core import google_services
         
-        google_services._token_cache["user@example.com"] = {
-            "tokens": {},
-            "timezone": "America/Los_Angeles",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="America/Los_Angeles",
+        )
         
         result = google_services.get_cached_timezone("user@example.com")
         assert result == "America/Los_Angeles"
     
     def test_gct02_utc_timezone_in_cache(self):
         """GCT-02: UTC timezone in cache is returned."""
-        from app.core import google_services
         
-        google_services._token_cache["user@example.com"] = {
-            "tokens": {},
-            "timezone": "UTC",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="UTC",
+        )
         
         result = google_services.get_cached_timezone("user@example.com")
         assert result == "UTC"
     
     def test_gct03_invalid_timezone_string(self):
         """GCT-03: Invalid timezone string returns UTC."""
-        from app.core import google_services
         
-        google_services._token_cache["user@example.com"] = {
-            "tokens": {},
-            "timezone": "Invalid/Zone",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="Invalid/Zone",
+        )
         
         result = google_services.get_cached_timezone("user@example.com")
         assert result == "UTC"
     
     def test_gct04_email_not_in_cache(self):
         """GCT-04: Email not in cache returns UTC."""
-        from app.core import google_services
         
         result = google_services.get_cached_timezone("nonexistent@example.com")
         assert result == "UTC"
     
     def test_gct05_empty_timezone_in_cache(self):
         """GCT-05: Empty timezone in cache returns UTC."""
-        from app.core import google_services
         
-        google_services._token_cache["user@example.com"] = {
-            "tokens": {},
-            "timezone": "",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="",
+        )
         
         result = google_services.get_cached_timezone("user@example.com")
         assert result == "UTC"
     
     def test_gct06_none_timezone_in_cache(self):
         """GCT-06: None timezone in cache returns UTC."""
-        from app.core import google_services
         
-        google_services._token_cache["user@example.com"] = {
-            "tokens": {},
-            "timezone": None,
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone=None,
+        )
         
         result = google_services.get_cached_timezone("user@example.com")
         assert result == "UTC"
     
     def test_gct07_half_hour_timezone(self):
         """GCT-07: Half-hour timezone (Asia/Kolkata) is valid."""
-        from app.core import google_services
         
-        google_services._token_cache["user@example.com"] = {
-            "tokens": {},
-            "timezone": "Asia/Kolkata",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="Asia/Kolkata",
+        )
         
         result = google_services.get_cached_timezone("user@example.com")
         assert result == "Asia/Kolkata"
+    
+    def test_gct08_timezone_validated_once(self):
+        """GCT-08: Repeat lookups of valid and invalid zones skip ZoneInfo."""
+        
+        google_services._token_cache["valid@example.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="Europe/Lisbon",
+        )
+        google_services._token_cache["typo@example.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="Europe/Lisbonn",
+        )
+        
+        with patch.object(google_services, "ZoneInfo", wraps=google_services.ZoneInfo) as zone_info:
+            google_services._TZ_OBJECT_CACHE.pop("Europe/Lisbon", None)
+            google_services._INVALID_TZ.pop("Europe/Lisbonn", None)
+            for _ in range(3):
+                assert google_services.get_cached_timezone("valid@example.com") == "Europe/Lisbon"
+                assert google_services.get_cached_timezone("typo@example.com") == "UTC"
+        
+        assert zone_info.call_count == 2
+    
+    def test_gct09_expired_entry_is_evicted(self):
+        """GCT-09: Entry past its TTL is dropped and UTC returned."""
+        
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={"access_token": "stale"},
+            timezone="Asia/Tokyo",
+            expires_at=time.monotonic() - 1,
+        )
+        
+        assert google_services.get_cached_timezone("user@example.com") == "UTC"
+        assert "user@example.com" not in google_services._token_cache
+    
+    def test_gct10_get_zoneinfo_reuses_objects(self):
+        """GCT-10: get_zoneinfo returns one shared ZoneInfo per name, None if invalid."""
+        zone = google_services.get_zoneinfo("America/Denver")
+        
+        assert zone.key == "America/Denver"
+        assert google_services.get_zoneinfo("America/Denver") is zone
+        assert google_services.get_zoneinfo("America/Denverr") is None
+    
+    def test_gct11_invalid_timezone_cache_is_bounded(self):
+        """GCT-11: Remembered invalid names are capped, evicting the oldest."""
+        maxsize = google_services._INVALID_TZ.maxsize
+        
+        for i in range(maxsize + 10):
+            assert google_services.get_zoneinfo(f"Not/AZone{i}") is None
+        
+        assert len(google_services._INVALID_TZ) == maxsize
+        assert "Not/AZone0" not in google_services._INVALID_TZ
+        assert f"Not/AZone{maxsize + 9}" in google_services._INVALID_TZ
 
 
 # ==============================================================================
@@ -253,26 +307,23 @@ class TestRefreshAccessTokenTimezone:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Clear token cache before each test."""
-        from app.core import google_services
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
         yield
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
     
     @pytest.mark.asyncio
     async def test_rt01_refresh_preserves_existing_timezone(self):
         """RT-01: Refresh preserves existing timezone in cache."""
-        from app.core import google_services
         
         # Pre-populate cache with timezone
-        google_services._token_cache["user@example.com"] = {
-            "tokens": {"access_token": "old_token", "refresh_token": "refresh"},
-            "timezone": "America/New_York",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={"access_token": "old_token", "refresh_token": "refresh"},
+            timezone="America/New_York",
+        )
         
         with patch.object(google_services, 'load_user_tokens', new_callable=AsyncMock) as mock_load, \
-             patch('app.db.get_db_pool', new_callable=AsyncMock) as mock_pool, \
-             patch('app.core.google_services.httpx.AsyncClient') as mock_client, \
+             patch('app.core.google_services.get_db_pool', new_callable=AsyncMock) as mock_pool, \
+             patch('app.core.google_services._get_http_client') as mock_client, \
              patch('app.core.google_services.get_settings') as mock_settings:
             
             # Skip load since we have cached tokens
@@ -289,12 +340,12 @@ class TestRefreshAccessTokenTimezone:
                 "access_token": "new_token",
                 "expires_in": 3600
             }
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
             
             # Mock DB save
             mock_pool.return_value = MagicMock()
             
-            with patch('app.db.token_repository.TokenRepository') as mock_repo_class:
+            with patch('app.core.google_services.TokenRepository') as mock_repo_class:
                 mock_repo = MagicMock()
                 mock_repo.save_tokens = AsyncMock()
                 mock_repo_class.return_value = mock_repo
@@ -302,16 +353,19 @@ class TestRefreshAccessTokenTimezone:
                 await google_services.refresh_access_token("user@example.com")
         
         # Timezone should be preserved
-        assert google_services._token_cache["user@example.com"]["timezone"] == "America/New_York"
+        assert google_services._token_cache["user@example.com"].timezone == "America/New_York"
+        
+        # Entry lapses TOKEN_EXPIRY_BUFFER_SECONDS before the new token expires
+        remaining = google_services._token_cache["user@example.com"].expires_at - time.monotonic()
+        assert 3600 - 300 - 5 < remaining <= 3600 - 300
     
     @pytest.mark.asyncio
     async def test_rt02_refresh_with_no_prior_cache(self):
         """RT-02: Refresh with no prior cache defaults to UTC."""
-        from app.core import google_services
         
         with patch.object(google_services, 'load_user_tokens', new_callable=AsyncMock) as mock_load, \
-             patch('app.db.get_db_pool', new_callable=AsyncMock) as mock_pool, \
-             patch('app.core.google_services.httpx.AsyncClient') as mock_client, \
+             patch('app.core.google_services.get_db_pool', new_callable=AsyncMock) as mock_pool, \
+             patch('app.core.google_services._get_http_client') as mock_client, \
              patch('app.core.google_services.get_settings') as mock_settings:
             
             # Return tokens from load_user_tokens since cache is empty
@@ -327,11 +381,11 @@ class TestRefreshAccessTokenTimezone:
                 "access_token": "new_token",
                 "expires_in": 3600
             }
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
             
             mock_pool.return_value = MagicMock()
             
-            with patch('app.db.token_repository.TokenRepository') as mock_repo_class:
+            with patch('app.core.google_services.TokenRepository') as mock_repo_class:
                 mock_repo = MagicMock()
                 mock_repo.save_tokens = AsyncMock()
                 mock_repo_class.return_value = mock_repo
@@ -339,7 +393,7 @@ class TestRefreshAccessTokenTimezone:
                 await google_services.refresh_access_token("user@example.com")
         
         # Timezone should default to UTC
-        assert google_services._token_cache["user@example.com"]["timezone"] == "UTC"
+        assert google_services._token_cache["user@example.com"].timezone == "UTC"
 
 
 # ==============================================================================
@@ -352,23 +406,20 @@ class TestGetCurrentDatetime:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Set up mocks for current user."""
-        from app.core import workspace_tools, google_services
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
         yield
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
     
     def test_dt01_pacific_time_user(self):
         """DT-01: Pacific time user gets correct local date."""
-        from app.core import workspace_tools, google_services
         from datetime import datetime
         from zoneinfo import ZoneInfo
         
         # Cache timezone for user
-        google_services._token_cache["pacific@test.com"] = {
-            "tokens": {},
-            "timezone": "America/Los_Angeles",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["pacific@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="America/Los_Angeles",
+        )
         
         with patch.object(workspace_tools, 'get_current_user', return_value="pacific@test.com"):
             result = workspace_tools.get_current_datetime.invoke({})
@@ -378,13 +429,11 @@ class TestGetCurrentDatetime:
     
     def test_dt02_eastern_time_user(self):
         """DT-02: Eastern time user gets correct local time."""
-        from app.core import workspace_tools, google_services
         
-        google_services._token_cache["eastern@test.com"] = {
-            "tokens": {},
-            "timezone": "America/New_York",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["eastern@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="America/New_York",
+        )
         
         with patch.object(workspace_tools, 'get_current_user', return_value="eastern@test.com"):
             result = workspace_tools.get_current_datetime.invoke({})
@@ -393,13 +442,11 @@ class TestGetCurrentDatetime:
     
     def test_dt03_utc_user(self):
         """DT-03: UTC user gets UTC time."""
-        from app.core import workspace_tools, google_services
         
-        google_services._token_cache["utc@test.com"] = {
-            "tokens": {},
-            "timezone": "UTC",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["utc@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="UTC",
+        )
         
         with patch.object(workspace_tools, 'get_current_user', return_value="utc@test.com"):
             result = workspace_tools.get_current_datetime.invoke({})
@@ -408,10 +455,9 @@ class TestGetCurrentDatetime:
     
     def test_dt04_cache_miss_falls_back_to_utc(self):
         """DT-04: Cache miss (no timezone) falls back to UTC."""
-        from app.core import workspace_tools, google_services
         
         # Empty cache
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
         
         with patch.object(workspace_tools, 'get_current_user', return_value="nocache@test.com"):
             result = workspace_tools.get_current_datetime.invoke({})
@@ -420,13 +466,11 @@ class TestGetCurrentDatetime:
     
     def test_dt05_output_includes_timezone_name(self):
         """DT-05: Output includes timezone name in parentheses."""
-        from app.core import workspace_tools, google_services
         
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {},
-            "timezone": "America/Chicago",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="America/Chicago",
+        )
         
         with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"):
             result = workspace_tools.get_current_datetime.invoke({})
@@ -444,20 +488,17 @@ class TestListCalendarEventsValidation:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Set up mocks."""
-        from app.core import workspace_tools, google_services
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
         yield
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
     
     def test_le01_valid_date_range(self):
         """LE-01: Valid date range calls underlying function."""
-        from app.core import workspace_tools, google_services
         
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {},
-            "timezone": "UTC",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="UTC",
+        )
         
         with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"), \
              patch.object(workspace_tools, '_list_calendar_events', return_value=[]) as mock_list:
@@ -472,7 +513,6 @@ class TestListCalendarEventsValidation:
     
     def test_le02_time_min_after_time_max(self):
         """LE-02: time_min >= time_max returns error."""
-        from app.core import workspace_tools
         
         with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"):
             result = workspace_tools.list_calendar_events.invoke({
@@ -485,7 +525,6 @@ class TestListCalendarEventsValidation:
     
     def test_le03_invalid_time_min_format(self):
         """LE-03: Invalid time_min format returns error."""
-        from app.core import workspace_tools
         
         with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"):
             result = workspace_tools.list_calendar_events.invoke({
@@ -498,7 +537,6 @@ class TestListCalendarEventsValidation:
     
     def test_le04_invalid_time_max_format(self):
         """LE-04: Invalid time_max format returns error."""
-        from app.core import workspace_tools
         
         with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"):
             result = workspace_tools.list_calendar_events.invoke({
@@ -511,13 +549,11 @@ class TestListCalendarEventsValidation:
     
     def test_le05_max_results_is_50(self):
         """LE-05: max_results is 50 by default."""
-        from app.core import workspace_tools, google_services
         
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {},
-            "timezone": "UTC",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="UTC",
+        )
         
         with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"), \
              patch.object(workspace_tools, '_list_calendar_events', return_value=[]) as mock_list:
@@ -528,12 +564,11 @@ class TestListCalendarEventsValidation:
             })
             
             # Check max_results was 50
-            call_kwargs = mock_list.call_args[1]
+            call_kwargs = mock_list.call_args.kwargs
             assert call_kwargs.get("max_results") == 50
     
     def test_le06_same_instant_returns_error(self):
         """LE-06: Same instant (time_min == time_max) returns error."""
-        from app.core import workspace_tools
         
         with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"):
             result = workspace_tools.list_calendar_events.invoke({
@@ -552,62 +587,44 @@ class TestListCalendarEventsValidation:
 class TestCalendarToolsFunction:
     """Test calendar_tools.py list_calendar_events function."""
     
-    def test_ct01_pass_through_time_params(self):
+    def test_ct01_pass_through_time_params(self, mock_calendar_events):
         """CT-01: time_min/time_max are passed to Google API."""
-        from app.tools.calendar_tools import list_calendar_events
         
-        with patch('app.tools.calendar_tools.get_calendar_service') as mock_service:
-            mock_events = MagicMock()
-            mock_events.list.return_value.execute.return_value = {"items": []}
-            mock_service.return_value.events.return_value = mock_events
-            
-            list_calendar_events(
-                user_email="user@test.com",
-                time_min="2026-01-05T00:00:00",
-                time_max="2026-01-05T23:59:59"
-            )
-            
-            mock_events.list.assert_called_once()
-            call_kwargs = mock_events.list.call_args[1]
-            assert "2026-01-05T00:00:00" in call_kwargs["timeMin"]
-            assert "2026-01-05T23:59:59" in call_kwargs["timeMax"]
+        list_calendar_events(
+            user_email="user@test.com",
+            time_min="2026-01-05T00:00:00",
+            time_max="2026-01-05T23:59:59"
+        )
+        
+        mock_calendar_events.list.assert_called_once()
+        call_kwargs = mock_calendar_events.list.call_args.kwargs
+        assert "2026-01-05T00:00:00" in call_kwargs["timeMin"]
+        assert "2026-01-05T23:59:59" in call_kwargs["timeMax"]
     
-    def test_ct02_default_max_results_is_50(self):
+    def test_ct02_default_max_results_is_50(self, mock_calendar_events):
         """CT-02: Default max_results is 50."""
-        from app.tools.calendar_tools import list_calendar_events
         
-        with patch('app.tools.calendar_tools.get_calendar_service') as mock_service:
-            mock_events = MagicMock()
-            mock_events.list.return_value.execute.return_value = {"items": []}
-            mock_service.return_value.events.return_value = mock_events
-            
-            list_calendar_events(
-                user_email="user@test.com",
-                time_min="2026-01-05T00:00:00",
-                time_max="2026-01-05T23:59:59"
-            )
-            
-            call_kwargs = mock_events.list.call_args[1]
-            assert call_kwargs["maxResults"] == 50
+        list_calendar_events(
+            user_email="user@test.com",
+            time_min="2026-01-05T00:00:00",
+            time_max="2026-01-05T23:59:59"
+        )
+        
+        call_kwargs = mock_calendar_events.list.call_args.kwargs
+        assert call_kwargs["maxResults"] == 50
     
-    def test_ct03_custom_max_results(self):
+    def test_ct03_custom_max_results(self, mock_calendar_events):
         """CT-03: Custom max_results is respected."""
-        from app.tools.calendar_tools import list_calendar_events
         
-        with patch('app.tools.calendar_tools.get_calendar_service') as mock_service:
-            mock_events = MagicMock()
-            mock_events.list.return_value.execute.return_value = {"items": []}
-            mock_service.return_value.events.return_value = mock_events
-            
-            list_calendar_events(
-                user_email="user@test.com",
-                time_min="2026-01-05T00:00:00",
-                time_max="2026-01-05T23:59:59",
-                max_results=25
-            )
-            
-            call_kwargs = mock_events.list.call_args[1]
-            assert call_kwargs["maxResults"] == 25
+        list_calendar_events(
+            user_email="user@test.com",
+            time_min="2026-01-05T00:00:00",
+            time_max="2026-01-05T23:59:59",
+            max_results=25
+        )
+        
+        call_kwargs = mock_calendar_events.list.call_args.kwargs
+        assert call_kwargs["maxResults"] == 25
 
 
 # ==============================================================================
@@ -617,88 +634,49 @@ class TestCalendarToolsFunction:
 class TestCreateCalendarEventTimezone:
     """Test create_calendar_event() passes timezone correctly."""
     
-    def test_ce01_user_timezone_passed(self):
+    def test_ce01_user_timezone_passed(self, mock_calendar_events):
         """CE-01: User timezone is passed to Google API."""
-        from app.tools.calendar_tools import create_calendar_event
         
-        with patch('app.tools.calendar_tools.get_calendar_service') as mock_service:
-            mock_events = MagicMock()
-            mock_events.insert.return_value.execute.return_value = {
-                "id": "event123",
-                "summary": "Test",
-                "htmlLink": "http://example.com",
-                "start": {"dateTime": "2026-01-05T10:00:00"},
-                "end": {"dateTime": "2026-01-05T11:00:00"}
-            }
-            mock_service.return_value.events.return_value = mock_events
-            
-            create_calendar_event(
-                user_email="user@test.com",
-                summary="Test Event",
-                start_time="2026-01-05T10:00:00",
-                end_time="2026-01-05T11:00:00",
-                user_timezone="America/Los_Angeles"
-            )
-            
-            call_kwargs = mock_events.insert.call_args[1]
-            body = call_kwargs["body"]
-            assert body["start"]["timeZone"] == "America/Los_Angeles"
-            assert body["end"]["timeZone"] == "America/Los_Angeles"
+        create_calendar_event(
+            user_email="user@test.com",
+            summary="Test Event",
+            start_time="2026-01-05T10:00:00",
+            end_time="2026-01-05T11:00:00",
+            user_timezone="America/Los_Angeles"
+        )
+        
+        body = mock_calendar_events.insert.call_args.kwargs["body"]
+        assert body["start"]["timeZone"] == "America/Los_Angeles"
+        assert body["end"]["timeZone"] == "America/Los_Angeles"
     
-    def test_ce02_default_timezone_is_utc(self):
+    def test_ce02_default_timezone_is_utc(self, mock_calendar_events):
         """CE-02: Default timezone is UTC."""
-        from app.tools.calendar_tools import create_calendar_event
         
-        with patch('app.tools.calendar_tools.get_calendar_service') as mock_service:
-            mock_events = MagicMock()
-            mock_events.insert.return_value.execute.return_value = {
-                "id": "event123",
-                "summary": "Test",
-                "htmlLink": "http://example.com",
-                "start": {"dateTime": "2026-01-05T10:00:00"},
-                "end": {"dateTime": "2026-01-05T11:00:00"}
-            }
-            mock_service.return_value.events.return_value = mock_events
-            
-            create_calendar_event(
-                user_email="user@test.com",
-                summary="Test Event",
-                start_time="2026-01-05T10:00:00",
-                end_time="2026-01-05T11:00:00"
-                # No user_timezone - should default to UTC
-            )
-            
-            call_kwargs = mock_events.insert.call_args[1]
-            body = call_kwargs["body"]
-            assert body["start"]["timeZone"] == "UTC"
-            assert body["end"]["timeZone"] == "UTC"
+        create_calendar_event(
+            user_email="user@test.com",
+            summary="Test Event",
+            start_time="2026-01-05T10:00:00",
+            end_time="2026-01-05T11:00:00"
+            # No user_timezone - should default to UTC
+        )
+        
+        body = mock_calendar_events.insert.call_args.kwargs["body"]
+        assert body["start"]["timeZone"] == "UTC"
+        assert body["end"]["timeZone"] == "UTC"
     
-    def test_ce03_utc_timezone_explicit(self):
+    def test_ce03_utc_timezone_explicit(self, mock_calendar_events):
         """CE-03: Explicit UTC timezone works."""
-        from app.tools.calendar_tools import create_calendar_event
         
-        with patch('app.tools.calendar_tools.get_calendar_service') as mock_service:
-            mock_events = MagicMock()
-            mock_events.insert.return_value.execute.return_value = {
-                "id": "event123",
-                "summary": "Test",
-                "htmlLink": "http://example.com",
-                "start": {"dateTime": "2026-01-05T10:00:00"},
-                "end": {"dateTime": "2026-01-05T11:00:00"}
-            }
-            mock_service.return_value.events.return_value = mock_events
-            
-            create_calendar_event(
-                user_email="user@test.com",
-                summary="Test Event",
-                start_time="2026-01-05T10:00:00",
-                end_time="2026-01-05T11:00:00",
-                user_timezone="UTC"
-            )
-            
-            call_kwargs = mock_events.insert.call_args[1]
-            body = call_kwargs["body"]
-            assert body["start"]["timeZone"] == "UTC"
+        create_calendar_event(
+            user_email="user@test.com",
+            summary="Test Event",
+            start_time="2026-01-05T10:00:00",
+            end_time="2026-01-05T11:00:00",
+            user_timezone="UTC"
+        )
+        
+        body = mock_calendar_events.insert.call_args.kwargs["body"]
+        assert body["start"]["timeZone"] == "UTC"
 
 
 # ==============================================================================
@@ -708,205 +686,91 @@ class TestCreateCalendarEventTimezone:
 class TestUpdateCalendarEventTimezone:
     """Test update_calendar_event() passes timezone correctly."""
     
-    def test_ue01_update_with_timezone(self):
+    def test_ue01_update_with_timezone(self, mock_calendar_events):
         """UE-01: Update with timezone uses correct timeZone."""
-        from app.tools.calendar_tools import update_calendar_event
         
-        with patch('app.tools.calendar_tools.get_calendar_service') as mock_service:
-            mock_events = MagicMock()
-            # Mock get() to return existing event
-            mock_events.get.return_value.execute.return_value = {
-                "id": "event123",
-                "summary": "Existing Event",
-                "start": {"dateTime": "2026-01-05T10:00:00"},
-                "end": {"dateTime": "2026-01-05T11:00:00"}
-            }
-            # Mock update()
-            mock_events.update.return_value.execute.return_value = {
-                "id": "event123",
-                "summary": "Existing Event",
-                "htmlLink": "http://example.com"
-            }
-            mock_service.return_value.events.return_value = mock_events
-            
-            update_calendar_event(
-                user_email="user@test.com",
-                event_id="event123",
-                start_time="2026-01-05T14:00:00",
-                user_timezone="America/New_York"
-            )
-            
-            call_kwargs = mock_events.update.call_args[1]
-            body = call_kwargs["body"]
-            assert body["start"]["timeZone"] == "America/New_York"
+        update_calendar_event(
+            user_email="user@test.com",
+            event_id="event123",
+            start_time="2026-01-05T14:00:00",
+            user_timezone="America/New_York"
+        )
+        
+        body = mock_calendar_events.update.call_args.kwargs["body"]
+        assert body["start"]["timeZone"] == "America/New_York"
     
-    def test_ue02_update_time_only_uses_default(self):
+    def test_ue02_update_time_only_uses_default(self, mock_calendar_events):
         """UE-02: Update time only uses default UTC timezone."""
-        from app.tools.calendar_tools import update_calendar_event
         
-        with patch('app.tools.calendar_tools.get_calendar_service') as mock_service:
-            mock_events = MagicMock()
-            mock_events.get.return_value.execute.return_value = {
-                "id": "event123",
-                "summary": "Existing Event",
-                "start": {"dateTime": "2026-01-05T10:00:00"},
-                "end": {"dateTime": "2026-01-05T11:00:00"}
-            }
-            mock_events.update.return_value.execute.return_value = {
-                "id": "event123",
-                "summary": "Existing Event",
-                "htmlLink": "http://example.com"
-            }
-            mock_service.return_value.events.return_value = mock_events
-            
-            update_calendar_event(
-                user_email="user@test.com",
-                event_id="event123",
-                start_time="2026-01-05T14:00:00"
-                # No user_timezone provided
-            )
-            
-            call_kwargs = mock_events.update.call_args[1]
-            body = call_kwargs["body"]
-            assert body["start"]["timeZone"] == "UTC"
+        update_calendar_event(
+            user_email="user@test.com",
+            event_id="event123",
+            start_time="2026-01-05T14:00:00"
+            # No user_timezone provided
+        )
+        
+        body = mock_calendar_events.update.call_args.kwargs["body"]
+        assert body["start"]["timeZone"] == "UTC"
 
 
 # ==============================================================================
-# 9. Unit Tests for get_user_calendar_timezone() - GZ-01 to GZ-05
+# 9. Unit Tests for get_user_calendar_timezone() - GZ-01 to GZ-06
 # ==============================================================================
 
+@patch('app.core.google_services.logger')
+@patch('app.core.google_services.get_calendar_service')
 class TestGetUserCalendarTimezone:
     """Test get_user_calendar_timezone() fetches timezone from Google."""
     
-    def test_gz01_valid_timezone_response(self):
+    def test_gz01_valid_timezone_response(self, mock_service, mock_logger):
         """GZ-01: Valid timezone from Google is returned."""
-        from app.core.google_services import get_user_calendar_timezone
+        mock_settings = mock_service.return_value.settings.return_value
+        mock_settings.get.return_value.execute.return_value = {"value": "America/New_York"}
         
-        with patch('app.core.google_services.get_calendar_service') as mock_service:
-            mock_settings = MagicMock()
-            mock_settings.get.return_value.execute.return_value = {"value": "America/New_York"}
-            mock_service.return_value.settings.return_value = mock_settings
-            
-            result = get_user_calendar_timezone("user@test.com")
-            
-            assert result == "America/New_York"
+        result = get_user_calendar_timezone("user@test.com")
+        
+        assert result == "America/New_York"
     
-    def test_gz02_empty_response(self):
+    def test_gz02_empty_response(self, mock_service, mock_logger):
         """GZ-02: Empty response returns UTC."""
-        from app.core.google_services import get_user_calendar_timezone
+        mock_settings = mock_service.return_value.settings.return_value
+        mock_settings.get.return_value.execute.return_value = {}
         
-        with patch('app.core.google_services.get_calendar_service') as mock_service:
-            mock_settings = MagicMock()
-            mock_settings.get.return_value.execute.return_value = {}
-            mock_service.return_value.settings.return_value = mock_settings
-            
-            result = get_user_calendar_timezone("user@test.com")
-            
-            assert result == "UTC"
-    
-    def test_gz03_api_401_error(self):
-        """GZ-03: API 401 error returns UTC, logs warning."""
-        from app.core.google_services import get_user_calendar_timezone
+        result = get_user_calendar_timezone("user@test.com")
         
-        with patch('app.core.google_services.get_calendar_service') as mock_service, \
-             patch('app.core.google_services.logger') as mock_logger:
-            mock_service.side_effect = Exception("401 Unauthorized")
-            
-            result = get_user_calendar_timezone("user@test.com")
-            
-            assert result == "UTC"
-            mock_logger.warning.assert_called()
+        assert result == "UTC"
     
-    def test_gz04_api_403_error(self):
-        """GZ-04: API 403 error returns UTC, logs warning."""
-        from app.core.google_services import get_user_calendar_timezone
+    @pytest.mark.parametrize("error", [
+        Exception("401 Unauthorized"),
+        Exception("403 Forbidden"),
+        TimeoutError("Connection timed out"),
+    ], ids=["gz03_api_401_error", "gz04_api_403_error", "gz05_network_timeout"])
+    def test_gz03_to_gz05_api_error(self, mock_service, mock_logger, error):
+        """GZ-03..GZ-05: API errors and timeouts return UTC, log warning."""
+        mock_service.side_effect = error
         
-        with patch('app.core.google_services.get_calendar_service') as mock_service, \
-             patch('app.core.google_services.logger') as mock_logger:
-            mock_service.side_effect = Exception("403 Forbidden")
-            
-            result = get_user_calendar_timezone("user@test.com")
-            
-            assert result == "UTC"
-            mock_logger.warning.assert_called()
-    
-    def test_gz05_network_timeout(self):
-        """GZ-05: Network timeout returns UTC, logs warning."""
-        from app.core.google_services import get_user_calendar_timezone
+        result = get_user_calendar_timezone("user@test.com")
         
-        with patch('app.core.google_services.get_calendar_service') as mock_service, \
-             patch('app.core.google_services.logger') as mock_logger:
-            mock_service.side_effect = TimeoutError("Connection timed out")
-            
-            result = get_user_calendar_timezone("user@test.com")
-            
-            assert result == "UTC"
-            mock_logger.warning.assert_called()
-
-
-# ==============================================================================
-# 10. Unit Tests for Timezone Sync Job - TS-01 to TS-04
-# ==============================================================================
-
-class TestTimezoneSyncJob:
-    """Test timezone_sync.py job logic via isolated unit tests."""
-    
-    def test_ts01_sync_updates_db_concept(self):
-        """TS-01: Verify the concept - when tz changes, DB should update."""
-        # This test validates the logic: if new_tz != current_tz, update should happen
-        current_tz = "UTC"
-        new_tz = "America/Chicago"
-        
-        # The sync job logic says: if new_tz != current_tz, update
-        should_update = new_tz != current_tz
-        assert should_update is True
+        assert result == "UTC"
+        mock_logger.warning.assert_called()
     
-    def test_ts02_skip_users_without_tokens_concept(self):
-        """TS-02: Verify logic - no tokens means skip."""
-        tokens = None
+    def test_gz06_timezone_cached_per_user(self, mock_service, mock_logger):
+        """GZ-06: Repeat lookups reuse the fetched timezone; errors are not cached."""
+        mock_settings = mock_service.return_value.settings.return_value
+        mock_settings.get.return_value.execute.return_value = {"value": "Asia/Tokyo"}
         
-        # The sync job checks: if not tokens, skip
-        should_skip = tokens is None
-        assert should_skip is True
-    
-    def test_ts03_continue_on_individual_failure_concept(self):
-        """TS-03: Verify logic - failures don't stop processing."""
-        users = ["user1@test.com", "user2@test.com"]
-        results = []
-        errors = []
-        
-        # Simulate the loop logic
-        for i, user in enumerate(users):
-            try:
-                if i == 0:
-                    raise Exception("Token load failed")
-                results.append(f"Updated {user}")
-            except Exception as e:
-                errors.append(str(e))
-                # Continue - the job shouldn't stop
-        
-        # First user failed, but second was processed
-        assert len(errors) == 1
-        assert len(results) == 1
-        assert "user2@test.com" in results[0]
-    
-    def test_ts04_log_summary_concept(self):
-        """TS-04: Verify summary calculation logic."""
-        # Simulate sync results
-        success_count = 2
-        skipped_count = 1  # Unchanged
-        error_count = 1
-        
-        # This is the format the job uses
-        summary = f"{success_count} updated, {skipped_count} unchanged, {error_count} errors"
-        
-        assert "2 updated" in summary
-        assert "1 unchanged" in summary
-        assert "1 errors" in summary
+        assert get_user_calendar_timezone("user@test.com") == "Asia/Tokyo"
+        assert get_user_calendar_timezone("user@test.com") == "Asia/Tokyo"
+        assert mock_service.call_count == 1
+        
+        mock_service.side_effect = Exception("503 Backend Error")
+        assert get_user_calendar_timezone("other@test.com") == "UTC"
+        mock_service.side_effect = None
+        assert get_user_calendar_timezone("other@test.com") == "Asia/Tokyo"
 
 
 # ==============================================================================
-# 11. Edge Case Tests - DST, Date Line, Half-hour Timezones
+# 10. Edge Case Tests - DST, Date Line, Half-hour Timezones
 # ==============================================================================
 
 class TestTimezoneEdgeCases:
@@ -915,79 +779,29 @@ class TestTimezoneEdgeCases:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Clear cache before each test."""
-        from app.core import google_services
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
         yield
-        google_services._token_cache = {}
-    
-    def test_half_hour_timezone_kolkata(self):
-        """Asia/Kolkata (UTC+5:30) is handled correctly."""
-        from app.core import google_services
-        
-        google_services._token_cache["india@test.com"] = {
-            "tokens": {},
-            "timezone": "Asia/Kolkata",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
-        
-        result = google_services.get_cached_timezone("india@test.com")
-        assert result == "Asia/Kolkata"
-    
-    def test_quarter_hour_timezone_kathmandu(self):
-        """Asia/Kathmandu (UTC+5:45) is handled correctly."""
-        from app.core import google_services
-        
-        google_services._token_cache["nepal@test.com"] = {
-            "tokens": {},
-            "timezone": "Asia/Kathmandu",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
-        
-        result = google_services.get_cached_timezone("nepal@test.com")
-        assert result == "Asia/Kathmandu"
-    
-    def test_long_timezone_name(self):
-        """Long timezone names like America/Argentina/Buenos_Aires work."""
-        from app.core import google_services
-        
-        google_services._token_cache["argentina@test.com"] = {
-            "tokens": {},
-            "timezone": "America/Argentina/Buenos_Aires",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
-        
-        result = google_services.get_cached_timezone("argentina@test.com")
-        assert result == "America/Argentina/Buenos_Aires"
-    
-    def test_positive_utc_offset_timezone(self):
-        """Pacific/Auckland (UTC+12/+13) is handled correctly."""
-        from app.core import google_services
-        
-        google_services._token_cache["nz@test.com"] = {
-            "tokens": {},
-            "timezone": "Pacific/Auckland",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
-        
-        result = google_services.get_cached_timezone("nz@test.com")
-        assert result == "Pacific/Auckland"
-    
-    def test_negative_utc_offset_timezone(self):
-        """Pacific/Honolulu (UTC-10) is handled correctly."""
-        from app.core import google_services
-        
-        google_services._token_cache["hawaii@test.com"] = {
-            "tokens": {},
-            "timezone": "Pacific/Honolulu",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
-        
-        result = google_services.get_cached_timezone("hawaii@test.com")
-        assert result == "Pacific/Honolulu"
+        google_services.clear_token_cache()
+    
+    @pytest.mark.parametrize("email,tz", [
+        ("india@test.com", "Asia/Kolkata"),  # Half-hour offset (UTC+5:30)
+        ("nepal@test.com", "Asia/Kathmandu"),  # Quarter-hour offset (UTC+5:45)
+        ("argentina@test.com", "America/Argentina/Buenos_Aires"),  # Long name
+        ("nz@test.com", "Pacific/Auckland"),  # Positive offset (UTC+12/+13)
+        ("hawaii@test.com", "Pacific/Honolulu"),  # Negative offset (UTC-10)
+    ])
+    def test_timezone_roundtrip(self, email, tz):
+        """Unusual offsets and long names come back from the cache unchanged."""
+        google_services._token_cache[email] = google_services.TokenEntry(
+            tokens={},
+            timezone=tz,
+        )
+        
+        assert google_services.get_cached_timezone(email) == tz
 
 
 # ==============================================================================
-# 12. Integration Tests
+# 11. Integration Tests
 # ==============================================================================
 
 class TestTokenToToolIntegration:
@@ -996,22 +810,19 @@ class TestTokenToToolIntegration:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Clear cache before each test."""
-        from app.core import google_services
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
         yield
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
     
     @pytest.mark.asyncio
     async def test_token_load_to_get_cached_timezone(self):
         """Token load -> get_cached_timezone flow works (simulated)."""
-        from app.core import google_services
         
         # Simulate what load_user_tokens does - cache tokens with timezone
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {"access_token": "test_token"},
-            "timezone": "America/Denver",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={"access_token": "test_token"},
+            timezone="America/Denver",
+        )
         
         # Now get_cached_timezone should return the cached value
         result = google_services.get_cached_timezone("user@test.com")
@@ -1020,14 +831,12 @@ class TestTokenToToolIntegration:
     
     def test_workspace_create_event_uses_cached_timezone(self):
         """Workspace create_calendar_event uses cached timezone."""
-        from app.core import workspace_tools, google_services
         
         # Pre-cache timezone
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {},
-            "timezone": "America/Los_Angeles",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="America/Los_Angeles",
+        )
         
         with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"), \
              patch.object(workspace_tools, '_create_calendar_event') as mock_create:
@@ -1045,19 +854,17 @@ class TestTokenToToolIntegration:
             })
             
             # Verify timezone was passed
-            call_kwargs = mock_create.call_args[1]
+            call_kwargs = mock_create.call_args.kwargs
             assert call_kwargs.get("user_timezone") == "America/Los_Angeles"
     
     def test_workspace_update_event_uses_cached_timezone(self):
         """Workspace update_calendar_event uses cached timezone."""
-        from app.core import workspace_tools, google_services
         
         # Pre-cache timezone
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {},
-            "timezone": "Europe/London",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="Europe/London",
+        )
         
         with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"), \
              patch.object(workspace_tools, '_update_calendar_event') as mock_update:
@@ -1074,37 +881,34 @@ class TestTokenToToolIntegration:
             })
             
             # Verify timezone was passed
-            call_kwargs = mock_update.call_args[1]
+            call_kwargs = mock_update.call_args.kwargs
             assert call_kwargs.get("user_timezone") == "Europe/London"
 
 
 # ==============================================================================
-# 13. Regression Tests - Calendar CRUD Operations
+# 12. Regression Tests - Calendar CRUD Operations
 # ==============================================================================
 
+@patch.object(workspace_tools, 'get_current_user', return_value="user@test.com")
 class TestCalendarCRUDRegression:
     """Regression tests to ensure existing calendar operations still work."""
     
     @pytest.fixture(autouse=True)
     def setup(self):
         """Clear cache before each test."""
-        from app.core import google_services
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
         yield
-        google_services._token_cache = {}
+        google_services.clear_token_cache()
     
-    def test_create_event_without_attendees(self):
+    def test_create_event_without_attendees(self, mock_current_user):
         """Create event without attendees still works."""
-        from app.core import workspace_tools, google_services
         
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {},
-            "timezone": "America/New_York",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="America/New_York",
+        )
         
-        with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"), \
-             patch.object(workspace_tools, '_create_calendar_event') as mock_create:
+        with patch.object(workspace_tools, '_create_calendar_event') as mock_create:
             
             mock_create.return_value = {
                 "id": "event123",
@@ -1121,21 +925,18 @@ class TestCalendarCRUDRegression:
             assert "event123" in result
             assert "Solo Meeting" in result
             # Verify no attendees were passed
-            call_kwargs = mock_create.call_args[1]
+            call_kwargs = mock_create.call_args.kwargs
             assert call_kwargs.get("attendees") is None or call_kwargs.get("attendees") == []
     
-    def test_create_event_with_attendees(self):
+    def test_create_event_with_attendees(self, mock_current_user):
         """Create event with attendees still works."""
-        from app.core import workspace_tools, google_services
         
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {},
-            "timezone": "America/New_York",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="America/New_York",
+        )
         
-        with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"), \
-             patch.object(workspace_tools, '_create_calendar_event') as mock_create:
+        with patch.object(workspace_tools, '_create_calendar_event') as mock_create:
             
             mock_create.return_value = {
                 "id": "event456",
@@ -1152,22 +953,19 @@ class TestCalendarCRUDRegression:
             
             assert "Team Meeting" in result
             # Verify attendees were passed
-            call_kwargs = mock_create.call_args[1]
-            assert "alice@test.com" in call_kwargs.get("attendees", [])
-            assert "bob@test.com" in call_kwargs.get("attendees", [])
+            call_kwargs = mock_create.call_args.kwargs
+            attendees = set(call_kwargs.get("attendees") or ())
+            assert {"alice@test.com", "bob@test.com"} <= attendees
     
-    def test_delete_event_still_works(self):
+    def test_delete_event_still_works(self, mock_current_user):
         """Delete event functionality unchanged."""
-        from app.core import workspace_tools, google_services
         
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {},
-            "timezone": "UTC",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="UTC",
+        )
         
-        with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"), \
-             patch.object(workspace_tools, '_delete_calendar_event') as mock_delete:
+        with patch.object(workspace_tools, '_delete_calendar_event') as mock_delete:
             
             mock_delete.return_value = {"id": "event123", "status": "deleted"}
             
@@ -1178,18 +976,15 @@ class TestCalendarCRUDRegression:
             assert "deleted" in result.lower()
             mock_delete.assert_called_once()
     
-    def test_event_location_preserved(self):
+    def test_event_location_preserved(self, mock_current_user):
         """Event location is still passed correctly."""
-        from app.core import workspace_tools, google_services
         
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {},
-            "timezone": "UTC",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="UTC",
+        )
         
-        with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"), \
-             patch.object(workspace_tools, '_create_calendar_event') as mock_create:
+        with patch.object(workspace_tools, '_create_calendar_event') as mock_create:
             
             mock_create.return_value = {
                 "id": "event789",
@@ -1204,21 +999,18 @@ class TestCalendarCRUDRegression:
                 "location": "Conference Room A"
             })
             
-            call_kwargs = mock_create.call_args[1]
+            call_kwargs = mock_create.call_args.kwargs
             assert call_kwargs.get("location") == "Conference Room A"
     
-    def test_event_description_preserved(self):
+    def test_event_description_preserved(self, mock_current_user):
         """Event description is still passed correctly."""
-        from app.core import workspace_tools, google_services
         
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {},
-            "timezone": "UTC",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="UTC",
+        )
         
-        with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"), \
-             patch.object(workspace_tools, '_create_calendar_event') as mock_create:
+        with patch.object(workspace_tools, '_create_calendar_event') as mock_create:
             
             mock_create.return_value = {
                 "id": "event999",
@@ -1233,18 +1025,16 @@ class TestCalendarCRUDRegression:
                 "description": "Quarterly planning discussion"
             })
             
-            call_kwargs = mock_create.call_args[1]
+            call_kwargs = mock_create.call_args.kwargs
             assert call_kwargs.get("description") == "Quarterly planning discussion"
     
-    def test_list_events_returns_formatted_output(self):
+    def test_list_events_returns_formatted_output(self, mock_current_user):
         """List events returns properly formatted output with all fields."""
-        from app.core import workspace_tools, google_services
         
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {},
-            "timezone": "UTC",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="UTC",
+        )
         
         mock_events = [
             {
@@ -1265,8 +1055,7 @@ class TestCalendarCRUDRegression:
             }
         ]
         
-        with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"), \
-             patch.object(workspace_tools, '_list_calendar_events', return_value=mock_events):
+        with patch.object(workspace_tools, '_list_calendar_events', return_value=mock_events):
             
             result = workspace_tools.list_calendar_events.invoke({
                 "time_min": "2026-01-05T00:00:00",
@@ -1278,15 +1067,13 @@ class TestCalendarCRUDRegression:
             assert "Lunch Meeting" in result
             assert "2 found" in result
     
-    def test_pii_masking_on_attendees(self):
+    def test_pii_masking_on_attendees(self, mock_current_user):
         """Attendee emails are still masked in output."""
-        from app.core import workspace_tools, google_services
         
-        google_services._token_cache["user@test.com"] = {
-            "tokens": {},
-            "timezone": "UTC",
-            "loaded_at": datetime.now(dt_timezone.utc)
-        }
+        google_services._token_cache["user@test.com"] = google_services.TokenEntry(
+            tokens={},
+            timezone="UTC",
+        )
         
         mock_events = [
             {
@@ -1299,8 +1086,7 @@ class TestCalendarCRUDRegression:
             }
         ]
         
-        with patch.object(workspace_tools, 'get_current_user', return_value="user@test.com"), \
-             patch.object(workspace_tools, '_list_calendar_events', return_value=mock_events):
+        with patch.object(workspace_tools, '_list_calendar_events', return_value=mock_events):
             
             result = workspace_tools.list_calendar_events.invoke({
                 "time_min": "2026-01-05T00:00:00",
@@ -7,149 +7,102 @@ RLS policies on the persons and relationships tables ensure data isolation.
 Run with: pytest tests/test_contacts_isolation.py -v
 """
 
-import asyncio
 import pytest
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4, UUID
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from fastapi import HTTPException
+
+from app.core.auth import TokenData
 from app.db.persons_repository import PersonsRepository
+from app.routes.contacts import get_contact, get_contact_relationships, list_contacts
+
 
+# Pre-generated IDs for mocks that only need distinct UUIDs; tests that
+# need several distinct users take different slots.
+_UUID_POOL = [uuid4() for _ in range(32)]
 
-def run_async(coro):
-    """Helper to run async coroutines in sync tests."""
-    return asyncio.run(coro)
 
+def _uid(i: int) -> UUID:
+    """Return the pooled UUID in slot ``i``."""
+    return _UUID_POOL[i % len(_UUID_POOL)]
 
-def make_token_data(user_id: UUID):
-    """Create a TokenData-like mock object for tests."""
-    from app.core.auth import TokenData
+
+@pytest.fixture(scope="module")
+def token_factory():
+    """Build TokenData for a user, with one issued/expiry time shared by the module."""
     now = datetime.now(timezone.utc)
-    return TokenData(
-        user_id=str(user_id),
-        email="user@example.com",
-        name="Test User",
-        exp=now + timedelta(hours=1),
-        iat=now
-    )
+    exp = now + timedelta(hours=1)
+    
+    def make_token_data(user_id: UUID, email: str = "user@example.com", name: str = "Test User"):
+        return TokenData(user_id=str(user_id), email=email, name=name, exp=exp, iat=now)
+    
+    return make_token_data
+
+
+@pytest.fixture(scope="module")
+def shared_pool():
+    """Create a mock connection pool once for the module."""
+    pool = MagicMock()
+    conn = AsyncMock()
+    
+    # Mock acquire context manager
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    
+    return pool, conn
 
 
 class TestPersonsRepositoryRLS:
     """Test that PersonsRepository correctly sets RLS context."""
     
     @pytest.fixture
-    def mock_pool(self):
-        """Create a mock connection pool."""
-        pool = MagicMock()
-        conn = AsyncMock()
-        
-        # Mock acquire context manager
-        pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
-        pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
-        
+    def mock_pool(self, shared_pool):
+        """The shared pool, with calls recorded by earlier tests cleared."""
+        pool, conn = shared_pool
+        conn.reset_mock()
         return pool, conn
     
-    def test_list_contacts_sets_rls_user(self, mock_pool):
-        """Verify that list_contacts sets the RLS user context."""
+    @pytest.mark.parametrize("method,kwargs,fetch_attr,fetch_result", [
+        ("list_contacts", {"limit": 10, "offset": 0}, "fetch", []),
+        ("get_core_user", {}, "fetchrow", None),
+        ("get_contact", {"contact_id": _uid(1)}, "fetchrow", None),
+        ("search", {"query": "test"}, "fetch", []),
+        ("get_relationships", {"person_id": _uid(2)}, "fetch", []),
+    ], ids=["list_contacts", "get_core_user", "get_contact", "search", "get_relationships"])
+    @pytest.mark.asyncio
+    async def test_method_sets_rls_user(self, mock_pool, method, kwargs, fetch_attr, fetch_result):
+        """Verify that each read method sets the RLS user context."""
         pool, conn = mock_pool
-        conn.fetch = AsyncMock(return_value=[])
+        getattr(conn, fetch_attr).return_value = fetch_result
         
         repo = PersonsRepository(pool)
-        user_id = uuid4()
+        user_id = _uid(0)
         
         with patch('app.db.persons_repository.set_rls_user', new_callable=AsyncMock) as mock_set_rls:
-            run_async(repo.list_contacts(user_id=user_id, limit=10, offset=0))
+            await getattr(repo, method)(user_id=user_id, **kwargs)
             
             # Verify set_rls_user was called with the user_id
             mock_set_rls.assert_called_once()
             call_args = mock_set_rls.call_args[0]
             assert call_args[1] == str(user_id)
-    
-    def test_get_core_user_sets_rls_user(self, mock_pool):
-        """Verify that get_core_user sets the RLS user context."""
-        pool, conn = mock_pool
-        conn.fetchrow = AsyncMock(return_value=None)
-        
-        repo = PersonsRepository(pool)
-        user_id = uuid4()
-        
-        with patch('app.db.persons_repository.set_rls_user', new_callable=AsyncMock) as mock_set_rls:
-            run_async(repo.get_core_user(user_id=user_id))
-            
-            mock_set_rls.assert_called_once()
-            call_args = mock_set_rls.call_args[0]
-            assert call_args[1] == str(user_id)
-    
-    def test_get_contact_sets_rls_user(self, mock_pool):
-        """Verify that get_contact sets the RLS user context."""
-        pool, conn = mock_pool
-        conn.fetchrow = AsyncMock(return_value=None)
-        
-        repo = PersonsRepository(pool)
-        user_id = uuid4()
-        contact_id = uuid4()
-        
-        with patch('app.db.persons_repository.set_rls_user', new_callable=AsyncMock) as mock_set_rls:
-            run_async(repo.get_contact(user_id=user_id, contact_id=contact_id))
-            
-            mock_set_rls.assert_called_once()
-            call_args = mock_set_rls.call_args[0]
-            assert call_args[1] == str(user_id)
-    
-    def test_search_sets_rls_user(self, mock_pool):
-        """Verify that search sets the RLS user context."""
-        pool, conn = mock_pool
-        conn.fetch = AsyncMock(return_value=[])
-        
-        repo = PersonsRepository(pool)
-        user_id = uuid4()
-        
-        with patch('app.db.persons_repository.set_rls_user', new_callable=AsyncMock) as mock_set_rls:
-            run_async(repo.search(user_id=user_id, query="test"))
-            
-            mock_set_rls.assert_called_once()
-            call_args = mock_set_rls.call_args[0]
-            assert call_args[1] == str(user_id)
-    
-    def test_get_relationships_sets_rls_user(self, mock_pool):
-        """Verify that get_relationships sets the RLS user context."""
-        pool, conn = mock_pool
-        conn.fetch = AsyncMock(return_value=[])
-        
-        repo = PersonsRepository(pool)
-        user_id = uuid4()
-        person_id = uuid4()
-        
-        with patch('app.db.persons_repository.set_rls_user', new_callable=AsyncMock) as mock_set_rls:
-            run_async(repo.get_relationships(user_id=user_id, person_id=person_id))
-            
-            mock_set_rls.assert_called_once()
-            call_args = mock_set_rls.call_args[0]
-            assert call_args[1] == str(user_id)
 
 
 class TestContactsRouteIsolation:
     """Test that contacts routes use the current user's ID for RLS."""
     
-    def test_list_contacts_uses_authenticated_user(self):
+    @pytest.mark.asyncio
+    async def test_list_contacts_uses_authenticated_user(self, token_factory):
         """Verify list_contacts passes the authenticated user's ID to repository."""
-        from app.routes.contacts import list_contacts
-        from app.core.auth import TokenData
         
         # Mock the current user
-        user_id = uuid4()
-        now = datetime.now(timezone.utc)
-        mock_user = TokenData(
-            user_id=str(user_id),
-            email="user@example.com",
-            name="Test User",
-            exp=now + timedelta(hours=1),
-            iat=now
-        )
+        user_id = _uid(0)
+        mock_user = token_factory(user_id)
         
         mock_contacts = [
-            {"id": str(uuid4()), "name": "Contact 1", "is_core_user": False},
-            {"id": str(uuid4()), "name": "Contact 2", "is_core_user": False},
+            {"id": str(_uid(1)), "name": "Contact 1", "is_core_user": False},
+            {"id": str(_uid(2)), "name": "Contact 2", "is_core_user": False},
         ]
         
         with patch('app.routes.contacts.get_db_pool', new_callable=AsyncMock) as mock_get_pool, \
@@ -169,7 +122,7 @@ class TestContactsRouteIsolation:
             mock_audit.return_value = mock_audit_logger
             
             # Call the endpoint
-            result = run_async(list_contacts(current_user=mock_user, limit=100, offset=0))
+            result = await list_contacts(current_user=mock_user, limit=100, offset=0)
             
             # Verify the repository was called with the correct user_id
             # Note: user_id is passed as string from TokenData
@@ -182,32 +135,17 @@ class TestContactsRouteIsolation:
             # Verify we got the expected contacts
             assert result == mock_contacts
     
-    def test_different_users_get_different_results(self):
+    @pytest.mark.asyncio
+    async def test_different_users_get_different_results(self, token_factory):
         """Demonstrate that different users would get different results."""
-        from app.routes.contacts import list_contacts
-        from app.core.auth import TokenData
-        
-        user_a_id = uuid4()
-        user_b_id = uuid4()
-        now = datetime.now(timezone.utc)
         
-        user_a = TokenData(
-            user_id=str(user_a_id), 
-            email="usera@example.com", 
-            name="User A",
-            exp=now + timedelta(hours=1),
-            iat=now
-        )
-        user_b = TokenData(
-            user_id=str(user_b_id), 
-            email="userb@example.com", 
-            name="User B",
-            exp=now + timedelta(hours=1),
-            iat=now
-        )
+        user_a_id = _uid(0)
+        user_b_id = _uid(1)
+        user_a = token_factory(user_a_id, email="usera@example.com", name="User A")
+        user_b = token_factory(user_b_id, email="userb@example.com", name="User B")
         
-        user_a_contacts = [{"id": str(uuid4()), "name": "A's Contact", "is_core_user": False}]
-        user_b_contacts = [{"id": str(uuid4()), "name": "B's Contact", "is_core_user": False}]
+        user_a_contacts = [{"id": str(_uid(2)), "name": "A's Contact", "is_core_user": False}]
+        user_b_contacts = [{"id": str(_uid(3)), "name": "B's Contact", "is_core_user": False}]
         
         with patch('app.routes.contacts.get_db_pool', new_callable=AsyncMock) as mock_get_pool, \
              patch('app.routes.contacts.PersonsRepository') as MockRepo, \
@@ -225,7 +163,7 @@ class TestContactsRouteIsolation:
             
             # User A's request
             mock_repo_instance.list_contacts = AsyncMock(return_value=user_a_contacts)
-            result_a = run_async(list_contacts(current_user=user_a, limit=100, offset=0))
+            result_a = await list_contacts(current_user=user_a, limit=100, offset=0)
             
             # Verify User A's ID was used
             mock_repo_instance.list_contacts.assert_called_with(
@@ -237,7 +175,7 @@ class TestContactsRouteIsolation:
             
             # User B's request
             mock_repo_instance.list_contacts = AsyncMock(return_value=user_b_contacts)
-            result_b = run_async(list_contacts(current_user=user_b, limit=100, offset=0))
+            result_b = await list_contacts(current_user=user_b, limit=100, offset=0)
             
             # Verify User B's ID was used
             mock_repo_instance.list_contacts.assert_called_with(
@@ -284,22 +222,13 @@ class TestRLSPolicy:
 class TestContactRouteEndpoints:
     """Test all contact route endpoints use proper authentication."""
     
-    def test_get_contact_verifies_ownership(self):
+    @pytest.mark.asyncio
+    async def test_get_contact_verifies_ownership(self, token_factory):
         """Verify get_contact returns 404 for contacts not owned by user."""
-        from app.routes.contacts import get_contact
-        from app.core.auth import TokenData
-        from fastapi import HTTPException
         
-        user_id = uuid4()
-        contact_id = uuid4()
-        now = datetime.now(timezone.utc)
-        mock_user = TokenData(
-            user_id=str(user_id), 
-            email="user@example.com", 
-            name="Test User",
-            exp=now + timedelta(hours=1),
-            iat=now
-        )
+        user_id = _uid(0)
+        contact_id = _uid(1)
+        mock_user = token_factory(user_id)
         
         with patch('app.routes.contacts.get_db_pool', new_callable=AsyncMock) as mock_get_pool, \
              patch('app.routes.contacts.PersonsRepository') as MockRepo, \
@@ -319,27 +248,18 @@ class TestContactRouteEndpoints:
             
             # Should raise 404
             with pytest.raises(HTTPException) as exc_info:
-                run_async(get_contact(contact_id=contact_id, current_user=mock_user))
+                await get_contact(contact_id=contact_id, current_user=mock_user)
             
             assert exc_info.value.status_code == 404
             assert "not found" in exc_info.value.detail.lower()
     
-    def test_get_relationships_verifies_contact_ownership(self):
+    @pytest.mark.asyncio
+    async def test_get_relationships_verifies_contact_ownership(self, token_factory):
         """Verify get_relationships checks contact ownership first."""
-        from app.routes.contacts import get_contact_relationships
-        from app.core.auth import TokenData
-        from fastapi import HTTPException
         
-        user_id = uuid4()
-        contact_id = uuid4()
-        now = datetime.now(timezone.utc)
-        mock_user = TokenData(
-            user_id=str(user_id), 
-            email="user@example.com", 
-            name="Test User",
-            exp=now + timedelta(hours=1),
-            iat=now
-        )
+        user_id = _uid(0)
+        contact_id = _uid(1)
+        mock_user = token_factory(user_id)
         
         with patch('app.routes.contacts.get_db_pool', new_callable=AsyncMock) as mock_get_pool, \
              patch('app.routes.contacts.PersonsRepository') as MockRepo:
@@ -354,6 +274,6 @@ class TestContactRouteEndpoints:
             
             # Should raise 404 because contact not found
             with pytest.raises(HTTPException) as exc_info:
-                run_async(get_contact_relationships(contact_id=contact_id, current_user=mock_user))
+                await get_contact_relationships(contact_id=contact_id, current_user=mock_user)
             
             assert exc_info.value.status_code == 404
@@ -0,0 +1,36 @@
+"""
+Tests for the Google Drive tools.
+
+Run with: pytest tests/test_drive_tools.py -v
+"""
+
+from unittest.mock import MagicMock, patch
+
+
+class TestListDriveFilesMulti:
+    """Test list_drive_files_multi() chunking and result shape."""
+
+    def test_files_in_several_chunks_are_returned_once(self):
+        """A file whose parents span two query chunks appears once, newest first."""
+        from app.tools.drive_tools import list_drive_files_multi
+
+        shared = {"id": "f1", "name": "Plan", "modifiedTime": "2024-02-01", "parents": ["a", "b"]}
+        older = {"id": "f2", "name": "Notes", "modifiedTime": "2024-01-01", "parents": ["b"]}
+
+        def list_files(q, **kwargs):
+            request = MagicMock()
+            files = [shared] if "'a' in parents" in q else [shared, older]
+            request.execute.return_value = {"files": files}
+            return request
+
+        service = MagicMock()
+        service.files.return_value.list.side_effect = list_files
+
+        with patch("app.tools.drive_tools.get_drive_service", return_value=service), \
+             patch("app.tools.drive_tools.MAX_PARENTS_PER_QUERY", 1):
+            files = list_drive_files_multi("test@example.com", ["a", "b"])
+
+        assert service.files.return_value.list.call_count == 2
+        assert [f["id"] for f in files] == ["f1", "f2"]
+        assert files[0]["parents"] == ["a", "b"]
+        assert {"mime_type", "created_time", "size", "web_link", "owners"} <= files[0].keys()
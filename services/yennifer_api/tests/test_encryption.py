@@ -59,6 +59,28 @@ def test_hash_functions():
     print("✅ hash_provider_id works correctly")
 
 
+def test_decrypt_user_dek_is_cached():
+    """Test that a DEK blob is decrypted through KMS only once (no KMS required)."""
+    from unittest.mock import MagicMock
+    from app.core.encryption import UserEncryption
+    
+    encryption = UserEncryption()
+    encryption._kms_client = MagicMock()
+    encryption._kms_client.decrypt.return_value = {"Plaintext": b"k" * 32}
+    
+    assert encryption.decrypt_user_dek(b"blob-1") == b"k" * 32
+    assert encryption.decrypt_user_dek(b"blob-1") == b"k" * 32
+    assert encryption._kms_client.decrypt.call_count == 1
+    
+    encryption.decrypt_user_dek(b"blob-2")
+    assert encryption._kms_client.decrypt.call_count == 2
+    
+    encryption.clear_dek_cache()
+    encryption.decrypt_user_dek(b"blob-1")
+    assert encryption._kms_client.decrypt.call_count == 3
+    print("✅ decrypt_user_dek caches plaintext DEKs")
+
+
 def test_kms_operations():
     """
     Test KMS operations (requires AWS credentials and KMS key).
@@ -146,6 +168,7 @@ def main():
     print("\n--- Non-AWS Tests ---")
     test_encryption_imports()
     test_hash_functions()
+    test_decrypt_user_dek_is_cached()
     
     # Tests that require AWS
     print("\n--- AWS KMS Tests ---")
@@ -241,6 +241,39 @@ def test_email_response_primary_category():
     print("✅ Primary category correctly detected")
 
 
+def test_read_emails_fetches_metadata_by_default():
+    """Test that read_emails skips bodies unless include_body is set."""
+    from app.tools.gmail_tools import read_emails
+    
+    mock_message = {
+        "id": "msg123",
+        "threadId": "thread456",
+        "labelIds": ["INBOX"],
+        "snippet": "Snippet only",
+        "payload": {
+            "headers": [{"name": "Subject", "value": "Hello"}],
+            "body": {"data": "VGVzdCBib2R5"}
+        }
+    }
+    
+    mock_service = MagicMock()
+    mock_messages = MagicMock()
+    mock_service.users.return_value.messages.return_value = mock_messages
+    mock_messages.list.return_value.execute.return_value = {"messages": [{"id": "msg123"}]}
+    mock_messages.get.return_value.execute.return_value = mock_message
+    
+    with patch("app.tools.gmail_tools.get_gmail_service", return_value=mock_service):
+        emails = read_emails(user_email="test@example.com", max_results=1)
+        assert mock_messages.get.call_args.kwargs["format"] == "metadata"
+        assert emails[0]["body"] is None
+        
+        emails = read_emails(user_email="test@example.com", max_results=1, include_body=True)
+        assert mock_messages.get.call_args.kwargs["format"] == "full"
+        assert emails[0]["body"] == "Test body"
+    
+    print("✅ read_emails fetches metadata only unless include_body=True")
+
+
 def test_get_email_by_id_includes_category():
     """Test that get_email_by_id also returns category."""
     from app.tools.gmail_tools import get_email_by_id
@@ -310,6 +343,7 @@ if __name__ == "__main__":
     test_query_building_without_category()
     test_email_response_includes_category()
     test_email_response_primary_category()
+    test_read_emails_fetches_metadata_by_default()
     test_get_email_by_id_includes_category()
     test_system_prompt_includes_email_guidance()
     
@@ -0,0 +1,235 @@
+"""
+Tests for the Google API request helpers.
+
+Covers iter_paginated(), execute_with_retry() and the Drive/Gmail tools
+built on them.
+
+Run with: pytest tests/test_google_api_helpers.py -v
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+
+def _make_collection(pages: list[dict]) -> MagicMock:
+    """Build a mock API collection that serves the given response pages in order."""
+    collection = MagicMock()
+    requests = [MagicMock() for _ in pages]
+    for request, page in zip(requests, pages):
+        request.execute.return_value = page
+
+    collection.list.return_value = requests[0]
+    collection.list_next.side_effect = requests[1:] + [None]
+    return collection
+
+
+class TestIterPaginated:
+    """Test iter_paginated() follows nextPageToken up to max_results."""
+
+    def test_single_page_without_token(self):
+        """A response without nextPageToken ends the iteration."""
+        from app.core.google_services import iter_paginated
+
+        collection = _make_collection([{"files": [{"id": "a"}, {"id": "b"}]}])
+
+        items = list(iter_paginated(collection, "files", 10))
+
+        assert [i["id"] for i in items] == ["a", "b"]
+        collection.list_next.assert_not_called()
+
+    def test_follows_next_page_token(self):
+        """Items from every page are yielded in API order."""
+        from app.core.google_services import iter_paginated
+
+        collection = _make_collection([
+            {"files": [{"id": "a"}, {"id": "b"}], "nextPageToken": "t1"},
+            {"files": [{"id": "c"}]},
+        ])
+
+        items = list(iter_paginated(collection, "files", 10))
+
+        assert [i["id"] for i in items] == ["a", "b", "c"]
+        assert collection.list_next.call_count == 1
+
+    def test_stops_at_max_results(self):
+        """No further page is requested once max_results is reached."""
+        from app.core.google_services import iter_paginated
+
+        collection = _make_collection([
+            {"files": [{"id": "a"}, {"id": "b"}], "nextPageToken": "t1"},
+            {"files": [{"id": "c"}, {"id": "d"}], "nextPageToken": "t2"},
+        ])
+
+        items = list(iter_paginated(collection, "files", 3))
+
+        assert [i["id"] for i in items] == ["a", "b", "c"]
+        assert collection.list_next.call_count == 1
+
+    def test_page_size_is_capped(self):
+        """The requested page size never exceeds the API maximum."""
+        from app.core.google_services import iter_paginated
+
+        collection = _make_collection([{"messages": []}])
+
+        list(iter_paginated(
+            collection, "messages", 1200,
+            page_size_param="maxResults", max_page_size=500, userId="me",
+        ))
+
+        collection.list.assert_called_once_with(maxResults=500, userId="me")
+
+
+def test_list_drive_files_requests_next_page_token():
+    """list_drive_files asks Drive for nextPageToken and returns every page."""
+    from app.tools.drive_tools import list_drive_files
+
+    mock_service = MagicMock()
+    files = _make_collection([
+        {"files": [{"id": "a", "name": "A"}], "nextPageToken": "t1"},
+        {"files": [{"id": "b", "name": "B"}]},
+    ])
+    mock_service.files.return_value = files
+
+    with patch("app.tools.drive_tools.get_drive_service", return_value=mock_service):
+        result = list_drive_files(user_email="test@example.com", max_results=150)
+
+    assert [f["id"] for f in result] == ["a", "b"]
+    assert "nextPageToken" in files.list.call_args.kwargs["fields"]
+    assert files.list.call_args.kwargs["pageSize"] == 100
+
+
+def _http_error(status: int, headers: dict) -> HttpError:
+    """Build an HttpError with the given status and response headers."""
+    resp = MagicMock(status=status)
+    resp.get.side_effect = headers.get
+    return HttpError(resp, b"{}")
+
+
+class TestExecuteWithRetry:
+    """Test execute_with_retry() delegates backoff and honours Retry-After."""
+
+    def test_passes_num_retries_to_execute(self):
+        """googleapiclient's built-in exponential backoff is enabled."""
+        from app.core.google_services import API_NUM_RETRIES, execute_with_retry
+
+        request = MagicMock()
+        request.execute.return_value = {"ok": True}
+
+        assert execute_with_retry(request) == {"ok": True}
+        request.execute.assert_called_once_with(num_retries=API_NUM_RETRIES)
+
+    def test_retries_once_after_retry_after(self):
+        """A rate-limited failure with Retry-After waits and tries again."""
+        from app.core import google_services
+
+        request = MagicMock()
+        request.execute.side_effect = [_http_error(429, {"retry-after": "2"}), {"ok": True}]
+
+        with patch.object(google_services.time, "sleep") as mock_sleep:
+            assert google_services.execute_with_retry(request) == {"ok": True}
+
+        mock_sleep.assert_called_once_with(2)
+        assert request.execute.call_count == 2
+
+    def test_other_errors_are_raised(self):
+        """Errors that are not rate limits propagate immediately."""
+        from app.core import google_services
+
+        request = MagicMock()
+        request.execute.side_effect = _http_error(404, {"retry-after": "2"})
+
+        with patch.object(google_services.time, "sleep") as mock_sleep, \
+             pytest.raises(HttpError):
+            google_services.execute_with_retry(request)
+
+        mock_sleep.assert_not_called()
+
+
+class TestAuthorizedHttpReuse:
+    """Test service builds share one keep-alive HTTP client per user."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Seed the token cache and reset the per-thread HTTP clients."""
+        from app.core import google_services
+        google_services._http_local.clients = {}
+        google_services._token_cache["user@example.com"] = google_services.TokenEntry(
+            tokens={"access_token": "token-1", "refresh_token": "refresh"},
+            timezone="UTC",
+        )
+        yield
+        google_services._token_cache.pop("user@example.com", None)
+        google_services._http_local.clients = {}
+
+    def test_services_share_http_until_token_changes(self):
+        """APIs share the client and each service is reused; a new access token replaces both."""
+        from app.core import google_services
+
+        drive = google_services.get_drive_service("user@example.com")
+        sheets = google_services.get_sheets_service("user@example.com")
+        assert drive._http is sheets._http
+
+        assert google_services.get_drive_service("user@example.com") is drive
+
+        google_services._token_cache["user@example.com"].tokens["access_token"] = "token-2"
+        refreshed = google_services.get_drive_service("user@example.com")
+        assert refreshed._http is not drive._http
+
+
+class TestTokenLRU:
+    """Test the bounded token cache evicts least recently used users."""
+
+    def test_evicts_least_recently_used(self):
+        from app.core.google_services import _TokenLRU
+
+        cache = _TokenLRU(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache.get("a") == 1  # "a" is now most recently used
+        cache["c"] = 3
+
+        assert list(cache) == ["a", "c"]
+        assert cache.pop("a") == 1
+        assert cache.get("b") is None
+
+
+class TestTokenHttpClient:
+    """Test token refreshes share one keep-alive httpx client."""
+
+    async def test_client_is_shared_until_closed(self):
+        from app.core import google_services
+
+        client = google_services._get_http_client()
+        assert google_services._get_http_client() is client
+
+        await google_services.close_http_client()
+        assert client.is_closed
+        assert google_services._get_http_client() is not client
+        await google_services.close_http_client()
+
+
+class TestOrjsonModel:
+    """Test the orjson response model matches googleapiclient's JsonModel."""
+
+    @pytest.mark.parametrize("content", [
+        b'{"values": [["a", 1], ["b", 2.5]]}',
+        '{"title": "caf\\u00e9"}',
+        b"not json",
+    ])
+    def test_deserialize_matches_json_model(self, content):
+        """Valid and invalid bodies decode the same way as the stdlib model."""
+        pytest.importorskip("orjson")
+        from googleapiclient.model import JsonModel
+        from app.core.google_services import _OrjsonModel
+
+        assert _OrjsonModel().deserialize(content) == JsonModel().deserialize(content)
+
+    def test_services_use_orjson_model(self):
+        """Built service clients decode responses with the orjson model."""
+        pytest.importorskip("orjson")
+        from app.core.google_services import _OrjsonModel, _build_service
+
+        service = _build_service("drive", "v3", MagicMock())
+        assert isinstance(service._model, _OrjsonModel)
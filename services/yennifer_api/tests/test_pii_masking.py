@@ -179,7 +179,36 @@ class TestPIIContext:
     def test_resolve_nonexistent_returns_none(self):
         resolved = resolve_pii_reference("[MASKED_999]")
         assert resolved is None
-    
+
+    def test_placeholders_follow_type_priority(self):
+        """Mixed PII types are numbered by masking priority, not text position."""
+        result = mask_pii("SSN 123-45-6789, card 4111-1111-1111-1111, upi foo@okhdfc")
+
+        assert result == "SSN [MASKED_2], card [MASKED_1], upi [MASKED_3]"
+
+        items = get_pii_context()._mappings
+        assert [items[f"[MASKED_{n}]"].pii_type for n in (1, 2, 3)] == [
+            PIIType.CREDIT_CARD, PIIType.SSN, PIIType.UPI_ID,
+        ]
+
+    def test_adjacent_number_runs_leave_no_digits(self):
+        """Back-to-back numbers are claimed by higher-priority types first, so no card digits leak."""
+        result = mask_pii("555-123-4567 2345 6789 0123 4111-1111-1111-1111")
+
+        assert result == "555-123-[MASKED_1] [MASKED_2]"
+        assert resolve_pii_reference("[MASKED_2]") == "4111-1111-1111-1111"
+
+    def test_reset_clears_mappings(self):
+        """reset() forgets placeholders and restarts numbering in place."""
+        ctx = get_pii_context()
+        mask_pii("Email: one@test.com")
+        ctx.reset()
+
+        assert ctx.get_stats() == {"total": 0}
+        assert resolve_pii_reference("[MASKED_1]") is None
+        assert mask_pii("Email: two@test.com") == "Email: [MASKED_1]"
+        assert resolve_pii_reference("[MASKED_1]") == "two@test.com"
+
     def test_context_isolation(self):
         """Test that different contexts are isolated."""
         ctx1 = PIIContext()
@@ -256,7 +285,16 @@ class TestEdgeCases:
     def test_no_pii(self):
         text = "This is a normal message without PII"
         assert mask_pii(text) == text
-    
+
+    def test_non_ascii_digits_still_checked(self):
+        """The no-digit fast path must not skip digits from other scripts."""
+        result = mask_pii("SSN १२३-४५-६७८९")
+        assert "१२३-४५-६७८९" not in result
+
+    def test_unmask_without_brackets_unchanged(self):
+        text = "Nothing to restore here"
+        assert unmask_pii(text) is text
+
     def test_already_masked_not_double_masked(self):
         """Ensure already masked items aren't re-masked."""
         text = "Contact [EMAIL_1] for details"
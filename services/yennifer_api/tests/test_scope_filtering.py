@@ -17,6 +17,16 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from app.db.integrations_repository import IntegrationsRepository
 
 
+# Pre-generated IDs for mocks that only need distinct UUIDs; tests that
+# need several distinct users take different slots.
+_UUID_POOL = [uuid4() for _ in range(32)]
+
+
+def _uid(i: int) -> UUID:
+    """Return the pooled UUID in slot ``i``."""
+    return _UUID_POOL[i % len(_UUID_POOL)]
+
+
 def run_async(coro):
     """Helper to run async coroutines in sync tests."""
     return asyncio.run(coro)
@@ -41,8 +51,8 @@ class TestGetUsersWithScopeGranted:
         """Verify that users with is_granted=TRUE are returned."""
         pool, conn = mock_pool
         
-        user1_id = uuid4()
-        user2_id = uuid4()
+        user1_id = _uid(0)
+        user2_id = _uid(1)
         
         # Mock database response
         conn.fetch = AsyncMock(return_value=[
@@ -119,6 +129,36 @@ class TestGetUsersWithScopeGranted:
         assert call2[0][2] == 'calendar.readonly'
 
 
+class TestEnableAllIntegrationsAndScopesBulk:
+    """Test the enable_all_integrations_and_scopes_bulk repository method."""
+    
+    @pytest.fixture
+    def mock_pool(self):
+        """Create a mock connection pool with a transaction-capable connection."""
+        pool = MagicMock()
+        conn = AsyncMock()
+        conn.transaction = MagicMock()
+        conn.transaction.return_value.__aenter__ = AsyncMock(return_value=None)
+        conn.transaction.return_value.__aexit__ = AsyncMock(return_value=None)
+        conn.execute = AsyncMock(return_value="INSERT 0 4")
+        
+        pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+        pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+        
+        return pool, conn
+    
+    def test_repeated_user_ids_are_sent_once(self, mock_pool):
+        """A user listed twice in a batch is upserted once per statement."""
+        pool, conn = mock_pool
+        
+        repo = IntegrationsRepository(pool)
+        run_async(repo.enable_all_integrations_and_scopes_bulk([_uid(0), _uid(1), _uid(0)]))
+        
+        assert conn.execute.call_count == 2
+        for call in conn.execute.call_args_list:
+            assert call.args[1] == [_uid(0), _uid(1)]
+
+
 class TestUserHasScopeGranted:
     """Test the user_has_scope_granted repository method."""
     
@@ -136,7 +176,7 @@ class TestUserHasScopeGranted:
     def test_returns_true_when_scope_granted(self, mock_pool):
         """Verify returns True when user has the scope granted."""
         pool, conn = mock_pool
-        user_id = uuid4()
+        user_id = _uid(0)
         
         # Mock finding a row (scope is granted)
         conn.fetchrow = AsyncMock(return_value={'dummy': 1})
@@ -149,7 +189,7 @@ class TestUserHasScopeGranted:
     def test_returns_false_when_scope_not_granted(self, mock_pool):
         """Verify returns False when user doesn't have the scope granted."""
         pool, conn = mock_pool
-        user_id = uuid4()
+        user_id = _uid(0)
         
         # Mock not finding a row (scope not granted)
         conn.fetchrow = AsyncMock(return_value=None)
@@ -162,7 +202,7 @@ class TestUserHasScopeGranted:
     def test_checks_is_granted_flag(self, mock_pool):
         """Verify SQL checks is_granted = TRUE."""
         pool, conn = mock_pool
-        user_id = uuid4()
+        user_id = _uid(0)
         conn.fetchrow = AsyncMock(return_value=None)
         
         repo = IntegrationsRepository(pool)
@@ -194,8 +234,8 @@ class TestContactSyncScopeFiltering:
         mock_repo = AsyncMock()
         
         # Users with scope granted
-        user1_id = uuid4()
-        user2_id = uuid4()
+        user1_id = _uid(0)
+        user2_id = _uid(1)
         mock_repo.get_users_with_scope_granted = AsyncMock(return_value=[
             {'id': user1_id, 'email': 'user1@example.com'},
             {'id': user2_id, 'email': 'user2@example.com'},
@@ -334,7 +374,7 @@ class TestContactSyncSchedulerIntegration:
         
         from app.jobs.contact_sync import contact_sync_scheduler
         
-        user_a_id = uuid4()
+        user_a_id = _uid(0)
         
         # Mock repo returns only User A (has scope)
         mock_pool = MagicMock()
@@ -417,7 +457,7 @@ class TestTimezoneSyncIntegration:
         """
         from app.jobs.timezone_sync import sync_user_timezones
         
-        user_a_id = uuid4()
+        user_a_id = _uid(0)
         
         mock_pool = MagicMock()
         mock_conn = AsyncMock()
@@ -0,0 +1,277 @@
+"""
+Tests for the Google Sheets tools.
+
+Run with: pytest tests/test_sheets_tools.py -v
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+
+def _mock_sheets_service(values: list[list]) -> MagicMock:
+    """Build a mock Sheets service returning the given values and fixed metadata."""
+    service = MagicMock()
+    spreadsheets = service.spreadsheets.return_value
+    spreadsheets.get.return_value.execute.return_value = {
+        "properties": {"title": "Budget"},
+        "sheets": [{"properties": {"title": "Sheet1"}}, {"properties": {"title": "P1"}}],
+    }
+    spreadsheets.values.return_value.get.return_value.execute.return_value = {
+        "range": "Sheet1!A1:B2",
+        "values": values,
+    }
+    return service
+
+
+class TestListSpreadsheets:
+    """Test list_spreadsheets() query building."""
+
+    def test_search_term_is_escaped_and_fields_trimmed(self):
+        """Quotes in the search term are escaped and only requested fields are fetched."""
+        from app.tools.sheets_tools import list_spreadsheets
+
+        service = MagicMock()
+        files = service.files.return_value
+        files.list.return_value.execute.return_value = {
+            "files": [{"id": "s1", "name": "Bob's budget"}],
+        }
+
+        with patch("app.tools.sheets_tools.get_drive_service", return_value=service):
+            sheets = list_spreadsheets(
+                "test@example.com", search_query="Bob's", fields=("id", "name"),
+            )
+
+        assert sheets == [{"id": "s1", "name": "Bob's budget"}]
+        kwargs = files.list.call_args.kwargs
+        assert "name contains 'Bob\\'s'" in kwargs["q"]
+        assert kwargs["fields"] == "nextPageToken, files(id, name)"
+
+    def test_fields_may_be_a_generator(self):
+        """A one-shot iterable of fields is used for both the mask and the result keys."""
+        from app.tools.sheets_tools import list_spreadsheets
+
+        service = MagicMock()
+        files = service.files.return_value
+        files.list.return_value.execute.return_value = {
+            "files": [{"id": "s1", "name": "Budget"}],
+        }
+
+        with patch("app.tools.sheets_tools.get_drive_service", return_value=service):
+            sheets = list_spreadsheets("test@example.com", fields=(f for f in ("id", "name")))
+
+        assert sheets == [{"id": "s1", "name": "Budget"}]
+
+    def test_default_fields_include_created_time(self):
+        """The default result keeps created_time alongside the other listing keys."""
+        from app.tools.sheets_tools import list_spreadsheets
+
+        service = MagicMock()
+        service.files.return_value.list.return_value.execute.return_value = {"files": [{"id": "s1"}]}
+
+        with patch("app.tools.sheets_tools.get_drive_service", return_value=service):
+            (sheet,) = list_spreadsheets("test@example.com")
+
+        assert sheet.keys() == {"id", "name", "created_time", "modified_time", "web_link"}
+
+
+class TestReadSpreadsheet:
+    """Test read_spreadsheet() metadata handling."""
+
+    def test_metadata_included_by_default(self):
+        """By default the title and sheet names are returned alongside the values."""
+        from app.tools.sheets_tools import read_spreadsheet
+
+        service = _mock_sheets_service([["a", "b"], ["c", "d"]])
+        with patch("app.tools.sheets_tools.get_sheets_service", return_value=service):
+            data = read_spreadsheet("test@example.com", "sheet-id")
+
+        assert data["values"] == [["a", "b"], ["c", "d"]]
+        assert data["row_count"] == 2
+        assert data["title"] == "Budget"
+        assert data["sheets"] == ["Sheet1", "P1"]
+
+    def test_values_only_without_metadata(self):
+        """With include_metadata=False only the values endpoint is called."""
+        from app.tools.sheets_tools import read_spreadsheet
+
+        service = _mock_sheets_service([["a", "b"], ["c", "d"]])
+        with patch("app.tools.sheets_tools.get_sheets_service", return_value=service):
+            data = read_spreadsheet("test@example.com", "sheet-id", include_metadata=False)
+
+        assert data["values"] == [["a", "b"], ["c", "d"]]
+        assert "title" not in data
+        service.spreadsheets.return_value.get.assert_not_called()
+
+    def test_metadata_is_cached_across_ranges(self):
+        """Reading two ranges fetches the spreadsheet metadata once."""
+        from app.tools.sheets_tools import read_spreadsheet
+
+        service = _mock_sheets_service([["a"]])
+        with patch("app.tools.sheets_tools.get_sheets_service", return_value=service):
+            first = read_spreadsheet("test@example.com", "sheet-id", "Sheet1", include_metadata=True)
+            second = read_spreadsheet("test@example.com", "sheet-id", "P1", include_metadata=True)
+
+        assert first["title"] == second["title"] == "Budget"
+        assert first["sheets"] == ["Sheet1", "P1"]
+        assert service.spreadsheets.return_value.get.call_count == 1
+
+    def test_as_columns_requests_column_major_values(self):
+        """as_columns lets the API return typed, column-major data."""
+        from app.tools.sheets_tools import read_spreadsheet
+
+        service = _mock_sheets_service([["Name", "Rent"], ["Amount", 1200]])
+        with patch("app.tools.sheets_tools.get_sheets_service", return_value=service):
+            data = read_spreadsheet("test@example.com", "sheet-id", as_columns=True)
+
+        values_get = service.spreadsheets.return_value.values.return_value.get
+        assert values_get.call_args.kwargs["majorDimension"] == "COLUMNS"
+        assert values_get.call_args.kwargs["valueRenderOption"] == "UNFORMATTED_VALUE"
+        assert data["columns"] == [["Name", "Rent"], ["Amount", 1200]]
+        assert data["row_count"] == 2
+        assert data["column_count"] == 2
+        assert "values" not in data
+
+    def test_invalid_range_lists_available_sheets(self):
+        """A 400 on the values call reports the sheet names in the error."""
+        from app.tools.sheets_tools import read_spreadsheet
+
+        service = _mock_sheets_service([])
+        values_get = service.spreadsheets.return_value.values.return_value.get.return_value
+        values_get.execute.side_effect = HttpError(MagicMock(status=400), b"{}")
+
+        with patch("app.tools.sheets_tools.get_sheets_service", return_value=service), \
+             pytest.raises(ValueError, match=r"Available sheets in this spreadsheet: \['Sheet1', 'P1'\]"):
+            read_spreadsheet("test@example.com", "sheet-id", "Missing!A1")
+
+
+class TestCreateSpreadsheet:
+    """Test create_spreadsheet() initial data writes."""
+
+    def test_initial_data_written_in_one_batch(self):
+        """All non-empty sheets are written with a single values.batchUpdate."""
+        from app.tools.sheets_tools import create_spreadsheet
+
+        service = MagicMock()
+        spreadsheets = service.spreadsheets.return_value
+        spreadsheets.create.return_value.execute.return_value = {"spreadsheetId": "new-id"}
+
+        with patch("app.tools.sheets_tools.get_sheets_service", return_value=service):
+            create_spreadsheet(
+                "test@example.com",
+                "Report",
+                sheet_names=["Q1", "Q2", "Q3"],
+                initial_data={"Q1": [["a"]], "Q2": [], "Q3": [["b"]]},
+            )
+
+        values = spreadsheets.values.return_value
+        values.update.assert_not_called()
+        values.batchUpdate.assert_called_once()
+        body = values.batchUpdate.call_args.kwargs["body"]
+        assert body["valueInputOption"] == "USER_ENTERED"
+        assert [d["range"] for d in body["data"]] == ["Q1!A1", "Q3!A1"]
+
+    def test_all_empty_initial_data_skips_write(self):
+        """No values request is made when every sheet's data is empty."""
+        from app.tools.sheets_tools import create_spreadsheet
+
+        service = MagicMock()
+        spreadsheets = service.spreadsheets.return_value
+        spreadsheets.create.return_value.execute.return_value = {"spreadsheetId": "new-id"}
+
+        with patch("app.tools.sheets_tools.get_sheets_service", return_value=service):
+            create_spreadsheet("test@example.com", "Report", initial_data={"Sheet1": []})
+
+        spreadsheets.values.return_value.batchUpdate.assert_not_called()
+
+
+class TestAddSheetToSpreadsheet:
+    """Test add_sheet_to_spreadsheet() request fusion."""
+
+    def test_sheet_and_data_added_in_one_batch_update(self):
+        """addSheet and a PASTE_NORMAL pasteData share one request and the same sheet ID."""
+        from app.tools.sheets_tools import add_sheet_to_spreadsheet
+
+        service = MagicMock()
+        spreadsheets = service.spreadsheets.return_value
+        spreadsheets.batchUpdate.return_value.execute.return_value = {
+            "replies": [{"addSheet": {"properties": {"sheetId": 42}}}, {}],
+        }
+
+        with patch("app.tools.sheets_tools.get_sheets_service", return_value=service):
+            result = add_sheet_to_spreadsheet(
+                "test@example.com", "sheet-id", "Totals",
+                initial_data=[["Name", "Amount", "Due"], ["Rent", 1200, "2024-01-05"], ["Sum", "=SUM(B2)", None]],
+            )
+
+        assert result["sheet_id"] == 42
+        spreadsheets.values.return_value.update.assert_not_called()
+
+        add_sheet, paste = spreadsheets.batchUpdate.call_args.kwargs["body"]["requests"]
+        sheet_id = add_sheet["addSheet"]["properties"]["sheetId"]
+        assert paste["pasteData"]["coordinate"] == {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0}
+        assert paste["pasteData"]["type"] == "PASTE_NORMAL"
+        assert paste["pasteData"]["delimiter"] == "\t"
+        assert paste["pasteData"]["data"] == "Name\tAmount\tDue\nRent\t1200\t2024-01-05\nSum\t=SUM(B2)\t"
+
+    def test_sheet_id_collision_is_retried(self):
+        """A 400 from a taken sheet ID retries the batchUpdate with a fresh ID."""
+        from app.tools.sheets_tools import add_sheet_to_spreadsheet
+
+        service = MagicMock()
+        spreadsheets = service.spreadsheets.return_value
+        spreadsheets.batchUpdate.return_value.execute.side_effect = [
+            HttpError(MagicMock(status=400), b"{}"),
+            {"replies": [{"addSheet": {"properties": {"sheetId": 7}}}, {}]},
+        ]
+
+        with patch("app.tools.sheets_tools.get_sheets_service", return_value=service), \
+             patch("app.tools.sheets_tools.secrets.randbelow", side_effect=[10, 20]):
+            result = add_sheet_to_spreadsheet(
+                "test@example.com", "sheet-id", "Totals", initial_data=[["a"]],
+            )
+
+        assert result["sheet_id"] == 7
+        sheet_ids = [
+            call.kwargs["body"]["requests"][0]["addSheet"]["properties"]["sheetId"]
+            for call in spreadsheets.batchUpdate.call_args_list
+        ]
+        assert sheet_ids == [11, 21]
+
+    def test_multiline_values_fall_back_to_values_update(self):
+        """Values with line breaks are written with USER_ENTERED after the sheet is added."""
+        from app.tools.sheets_tools import add_sheet_to_spreadsheet
+
+        service = MagicMock()
+        spreadsheets = service.spreadsheets.return_value
+        spreadsheets.batchUpdate.return_value.execute.return_value = {
+            "replies": [{"addSheet": {"properties": {"sheetId": 42}}}],
+        }
+        initial_data = [["Notes"], ["line one\nline two"]]
+
+        with patch("app.tools.sheets_tools.get_sheets_service", return_value=service):
+            add_sheet_to_spreadsheet("test@example.com", "sheet-id", "Totals", initial_data=initial_data)
+
+        (add_sheet,) = spreadsheets.batchUpdate.call_args.kwargs["body"]["requests"]
+        assert add_sheet == {"addSheet": {"properties": {"title": "Totals"}}}
+        kwargs = spreadsheets.values.return_value.update.call_args.kwargs
+        assert kwargs["valueInputOption"] == "USER_ENTERED"
+        assert kwargs["body"] == {"values": initial_data}
+
+    def test_no_initial_data_skips_values_write(self):
+        """Without initial data only the addSheet request is made."""
+        from app.tools.sheets_tools import add_sheet_to_spreadsheet
+
+        service = MagicMock()
+        spreadsheets = service.spreadsheets.return_value
+        spreadsheets.batchUpdate.return_value.execute.return_value = {
+            "replies": [{"addSheet": {"properties": {"sheetId": 7}}}],
+        }
+
+        with patch("app.tools.sheets_tools.get_sheets_service", return_value=service):
+            add_sheet_to_spreadsheet("test@example.com", "sheet-id", "Empty")
+
+        (add_sheet,) = spreadsheets.batchUpdate.call_args.kwargs["body"]["requests"]
+        assert "sheetId" not in add_sheet["addSheet"]["properties"]
+        spreadsheets.values.return_value.update.assert_not_called()
@@ -0,0 +1,63 @@
+"""
+Tests for the Google Slides tools.
+
+Run with: pytest tests/test_slides_tools.py -v
+"""
+
+from unittest.mock import MagicMock, patch
+
+
+class TestAddTextBoxes:
+    """Test add_text_boxes() request batching."""
+
+    def test_boxes_share_one_batch_update(self):
+        """Every box's createShape/insertText pair goes in a single request."""
+        from app.tools.slides_tools import add_text_boxes
+
+        service = MagicMock()
+        with patch("app.tools.slides_tools.get_slides_service", return_value=service):
+            result = add_text_boxes(
+                "test@example.com", "pres-id", "slide-1",
+                [{"text": "Title", "y": 40}, {"text": "Body"}],
+            )
+
+        batch_update = service.presentations.return_value.batchUpdate
+        batch_update.assert_called_once()
+        requests = batch_update.call_args.kwargs["body"]["requests"]
+        assert [next(iter(r)) for r in requests] == [
+            "createShape", "insertText", "createShape", "insertText",
+        ]
+        assert [r["insertText"]["objectId"] for r in requests[1::2]] == result["element_ids"]
+        assert len(set(result["element_ids"])) == 2
+        assert requests[0]["createShape"]["elementProperties"]["transform"]["translateY"] == 40
+
+    def test_add_text_to_slide_delegates(self):
+        """add_text_to_slide sends one box and reports its element ID."""
+        from app.tools.slides_tools import add_text_to_slide
+
+        service = MagicMock()
+        with patch("app.tools.slides_tools.get_slides_service", return_value=service):
+            result = add_text_to_slide("test@example.com", "pres-id", "slide-1", "Hello")
+
+        requests = service.presentations.return_value.batchUpdate.call_args.kwargs["body"]["requests"]
+        assert requests[0]["createShape"]["objectId"] == result["element_id"]
+        assert requests[1]["insertText"]["text"] == "Hello"
+        assert result["status"] == "text_added"
+
+
+class TestAddSlide:
+    """Test add_slide() layout handling."""
+
+    def test_layout_is_normalised_and_unknown_falls_back(self):
+        """Layout names are case-insensitive and unknown ones become BLANK."""
+        from app.tools.slides_tools import add_slide
+
+        service = MagicMock()
+        batch_update = service.presentations.return_value.batchUpdate
+        batch_update.return_value.execute.return_value = {
+            "replies": [{"createSlide": {"objectId": "slide-2"}}],
+        }
+
+        with patch("app.tools.slides_tools.get_slides_service", return_value=service):
+            assert add_slide("test@example.com", "pres-id", "title_only")["layout"] == "TITLE_ONLY"
+            assert add_slide("test@example.com", "pres-id", "FANCY")["layout"] == "BLANK"
@@ -0,0 +1,93 @@
+"""
+Tests for the TTL read cache used by the Google Workspace tools.
+
+Run with: pytest tests/test_ttl_cache.py -v
+"""
+
+from unittest.mock import MagicMock, patch
+
+
+class TestTTLCache:
+    """Test TTLCache expiry and LRU eviction."""
+
+    def test_entry_expires_after_ttl(self):
+        """Entries older than the TTL are treated as missing."""
+        from app.core import ttl_cache
+
+        cache = ttl_cache.TTLCache(maxsize=10, ttl=30)
+        with patch.object(ttl_cache.time, "monotonic", return_value=100.0):
+            cache.set("key", "value")
+        with patch.object(ttl_cache.time, "monotonic", return_value=129.0):
+            assert cache.get("key") == "value"
+        with patch.object(ttl_cache.time, "monotonic", return_value=131.0):
+            assert cache.get("key") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Reading an entry protects it from eviction."""
+        from app.core.ttl_cache import TTLCache
+
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+
+class TestUserTTLCache:
+    """Test the user_ttl_cache decorator."""
+
+    def test_positional_and_keyword_calls_share_entry(self):
+        """Equivalent calls hit the same cache entry."""
+        from app.core.ttl_cache import user_ttl_cache
+
+        calls = MagicMock(return_value=["result"])
+
+        @user_ttl_cache(ttl=60)
+        def read(user_email: str, max_results: int = 20):
+            return calls(user_email, max_results)
+
+        assert read("a@example.com") == ["result"]
+        assert read("a@example.com", 20) == ["result"]
+        assert read(user_email="a@example.com", max_results=20) == ["result"]
+        assert calls.call_count == 1
+
+    def test_invalidate_user_caches_only_drops_that_user(self):
+        """Writes by one user do not evict another user's reads."""
+        from app.core.ttl_cache import invalidate_user_caches, user_ttl_cache
+
+        calls = MagicMock(return_value="result")
+
+        @user_ttl_cache(ttl=60)
+        def read(user_email: str):
+            return calls(user_email)
+
+        read("a@example.com")
+        read("b@example.com")
+        invalidate_user_caches("a@example.com")
+        read("a@example.com")
+        read("b@example.com")
+
+        assert [c.args[0] for c in calls.call_args_list] == [
+            "a@example.com", "b@example.com", "a@example.com",
+        ]
+
+
+def test_drive_write_invalidates_cached_listing():
+    """Renaming a file forces the next list_drive_files call to hit the API."""
+    from app.tools.drive_tools import list_drive_files, rename_drive_file
+
+    mock_service = MagicMock()
+    mock_service.files.return_value.list.return_value.execute.return_value = {"files": []}
+
+    with patch("app.tools.drive_tools.get_drive_service", return_value=mock_service):
+        list_drive_files(user_email="test@example.com")
+        list_drive_files(user_email="test@example.com")
+        assert mock_service.files.return_value.list.call_count == 1
+
+        rename_drive_file(user_email="test@example.com", file_id="f1", new_name="New")
+        list_drive_files(user_email="test@example.com")
+        assert mock_service.files.return_value.list.call_count == 2